@@ -0,0 +1,165 @@
+"""
+High-throughput activity ingestion.
+
+Field devices upload thousands of activities, each with nested details, in
+one request. Rows are validated one by one so a bad row is reported
+instead of failing the batch; the valid rows are then written with
+batched multi-row ``INSERT ... RETURNING`` statements (one round trip per
+``INGEST_BATCH_SIZE`` rows) rather than one ORM flush and refresh per row.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.activity_summary import refresh_parcel_summaries
+from app.context_index import (
+    context_index,
+    index_activities,
+    index_activity_details,
+)
+from app.core.config import get_batch_settings
+
+# Rows written per INSERT statement
+INGEST_BATCH_SIZE = get_batch_settings().INGEST_BATCH_SIZE
+
+IndexedActivity = Tuple[int, schemas.ActivityIngest]  # (request index, row)
+
+
+def _format_errors(error: ValidationError) -> List[str]:
+    """Flatten a pydantic error into "field: message" strings."""
+    messages = []
+    for item in error.errors(include_url=False):
+        field = ".".join(str(part) for part in item["loc"]) or "row"
+        messages.append(f"{field}: {item['msg']}")
+    return messages
+
+
+def validate_rows(
+    rows: Sequence[Any],
+) -> Tuple[List[IndexedActivity], List[schemas.IngestRowError]]:
+    """
+    Validate raw rows against the ingest schema.
+
+    Args:
+        rows: Raw JSON rows from the request
+
+    Returns:
+        Valid rows with their request index, and the errors of the others
+    """
+    valid, errors = [], []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, schemas.ActivityIngest.model_validate(row)))
+        except ValidationError as error:
+            errors.append(
+                schemas.IngestRowError(index=index, errors=_format_errors(error))
+            )
+    return valid, errors
+
+
+def check_references(
+    db: Session, rows: List[IndexedActivity]
+) -> Tuple[List[IndexedActivity], List[schemas.IngestRowError]]:
+    """
+    Reject rows that point to unknown parcels or users.
+
+    Checked up front with one query per table, so a dangling foreign key
+    cannot abort the whole insert.
+
+    Args:
+        db: Database session
+        rows: Validated rows with their request index
+
+    Returns:
+        Rows with valid references, and the errors of the others
+    """
+    parcel_ids = {row.parcel_id for _, row in rows}
+    user_ids = {row.user_id for _, row in rows}
+    known_parcels = set(
+        db.scalars(select(models.Parcel.id).where(models.Parcel.id.in_(parcel_ids)))
+    )
+    known_users = set(
+        db.scalars(select(models.User.id).where(models.User.id.in_(user_ids)))
+    )
+
+    valid, errors = [], []
+    for index, row in rows:
+        messages = []
+        if row.parcel_id not in known_parcels:
+            messages.append(f"parcel_id: parcel {row.parcel_id} does not exist")
+        if row.user_id not in known_users:
+            messages.append(f"user_id: user {row.user_id} does not exist")
+        if messages:
+            errors.append(schemas.IngestRowError(index=index, errors=messages))
+        else:
+            valid.append((index, row))
+    return valid, errors
+
+
+def _insert_returning_ids(db: Session, model: Any, values: List[Dict]) -> List[int]:
+    """Insert rows in one batched statement and return their ids in order."""
+    if not values:
+        return []
+    # Core insert on the table: skips ORM bulk-persistence bookkeeping
+    table = model.__table__
+    statement = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+    return list(db.scalars(statement, values))
+
+
+def ingest_activities(db: Session, rows: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Store a batch of activities with nested details.
+
+    Invalid rows are skipped and reported; the valid ones are committed
+    together, along with the parcel activity summaries they affect.
+
+    Args:
+        db: Database session
+        rows: Raw JSON rows, each an activity with optional "details"
+
+    Returns:
+        Dictionary matching schemas.IngestResult
+    """
+    valid, errors = validate_rows(rows)
+    valid, reference_errors = check_references(db, valid)
+    errors = sorted(errors + reference_errors, key=lambda error: error.index)
+
+    activity_rows, detail_rows = [], []
+    for start in range(0, len(valid), INGEST_BATCH_SIZE):
+        batch = [row for _, row in valid[start : start + INGEST_BATCH_SIZE]]
+        activity_values = [row.model_dump(exclude={"details"}) for row in batch]
+        activity_ids = _insert_returning_ids(db, models.Activity, activity_values)
+
+        detail_values = [
+            {"activity_id": activity_id, **detail.model_dump()}
+            for activity_id, row in zip(activity_ids, batch)
+            for detail in row.details
+        ]
+        detail_ids = _insert_returning_ids(db, models.ActivityDetail, detail_values)
+
+        activity_rows += [
+            {"id": activity_id, **values}
+            for activity_id, values in zip(activity_ids, activity_values)
+        ]
+        detail_rows += [
+            {"id": detail_id, **values}
+            for detail_id, values in zip(detail_ids, detail_values)
+        ]
+
+    refresh_parcel_summaries(db, {row["parcel_id"] for row in activity_rows})
+    db.commit()
+    if context_index.is_built:
+        # Transient copies of the inserted rows, only read by the index
+        index_activities(db, [models.Activity(**row) for row in activity_rows])
+        index_activity_details(models.ActivityDetail(**row) for row in detail_rows)
+
+    return {
+        "inserted": len(activity_rows),
+        "details_inserted": len(detail_rows),
+        "activity_ids": [row["id"] for row in activity_rows],
+        "errors": errors,
+    }
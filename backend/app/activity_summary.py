@@ -0,0 +1,169 @@
+"""
+Materialized per-parcel activity summary.
+
+``parcel_activity_summary`` holds one row per parcel with activities: last
+activity and harvest dates, counts by type and daily counts over a trailing
+window. Writers call ``refresh_parcel_summaries`` for the parcels they
+touched, in the same transaction, so readers only scan O(parcels) rows.
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.utils import HARVEST_ACTIVITY_TYPES
+
+# Days of per-day counts kept, the longest "last N days" window served
+SUMMARY_WINDOW_DAYS = 30
+
+
+def _compute_summaries(
+    db: Session, parcel_ids: Optional[Iterable[int]], today: date
+) -> Dict[int, dict]:
+    """Aggregate activities into summary values, keyed by parcel_id."""
+    activity = models.Activity
+    conditions = [activity.parcel_id.isnot(None)]
+    if parcel_ids is not None:
+        conditions.append(activity.parcel_id.in_(parcel_ids))
+
+    summaries: Dict[int, dict] = defaultdict(
+        lambda: {
+            "last_activity_date": None,
+            "last_harvest_date": None,
+            "activity_count": 0,
+            "type_counts": {},
+            "daily_counts": {},
+        }
+    )
+
+    by_type = (
+        db.query(
+            activity.parcel_id,
+            activity.type,
+            func.count(activity.id),
+            func.max(activity.date),
+        )
+        .filter(*conditions)
+        .group_by(activity.parcel_id, activity.type)
+    )
+    for parcel_id, activity_type, count, last_date in by_type:
+        summary = summaries[parcel_id]
+        summary["type_counts"][activity_type] = count
+        summary["activity_count"] += count
+        if last_date is not None and (
+            summary["last_activity_date"] is None
+            or last_date > summary["last_activity_date"]
+        ):
+            summary["last_activity_date"] = last_date
+        if (
+            activity_type in HARVEST_ACTIVITY_TYPES
+            and last_date is not None
+            and (
+                summary["last_harvest_date"] is None
+                or last_date > summary["last_harvest_date"]
+            )
+        ):
+            summary["last_harvest_date"] = last_date
+
+    window_start = today - timedelta(days=SUMMARY_WINDOW_DAYS)
+    by_day = (
+        db.query(activity.parcel_id, activity.date, func.count(activity.id))
+        .filter(*conditions, activity.date >= window_start)
+        .group_by(activity.parcel_id, activity.date)
+    )
+    for parcel_id, day, count in by_day:
+        summaries[parcel_id]["daily_counts"][day.isoformat()] = count
+
+    return summaries
+
+
+def refresh_parcel_summaries(
+    db: Session, parcel_ids: Iterable[Optional[int]], today: Optional[date] = None
+) -> None:
+    """
+    Recompute the summary rows of the given parcels.
+
+    Pending changes are flushed first; the caller commits. Parcels left
+    without activities lose their summary row.
+
+    Args:
+        db: Database session
+        parcel_ids: Parcels whose activities changed (None entries are ignored)
+        today: Reference date for the daily window (defaults to today)
+    """
+    ids = sorted({parcel_id for parcel_id in parcel_ids if parcel_id is not None})
+    if not ids:
+        return
+    db.flush()
+
+    # Serialize concurrent refreshes of the same parcels (no-op on SQLite)
+    db.execute(
+        select(models.Parcel.id).where(models.Parcel.id.in_(ids)).with_for_update()
+    )
+
+    computed = _compute_summaries(db, ids, today or date.today())
+    existing = {
+        row.parcel_id: row
+        for row in db.query(models.ParcelActivitySummary).filter(
+            models.ParcelActivitySummary.parcel_id.in_(ids)
+        )
+    }
+    for parcel_id in ids:
+        row = existing.get(parcel_id)
+        values = computed.get(parcel_id)
+        if values is None:
+            if row is not None:
+                db.delete(row)
+        elif row is None:
+            db.add(models.ParcelActivitySummary(parcel_id=parcel_id, **values))
+        else:
+            for field, value in values.items():
+                setattr(row, field, value)
+    db.flush()
+
+
+def rebuild_parcel_summaries(db: Session, today: Optional[date] = None) -> int:
+    """
+    Rebuild the whole summary table from the activities table and commit.
+
+    Use after bulk loads that bypass the activity routes.
+
+    Args:
+        db: Database session
+        today: Reference date for the daily window (defaults to today)
+
+    Returns:
+        Number of summary rows written
+    """
+    computed = _compute_summaries(db, None, today or date.today())
+    db.query(models.ParcelActivitySummary).delete(synchronize_session=False)
+    db.add_all(
+        models.ParcelActivitySummary(parcel_id=parcel_id, **values)
+        for parcel_id, values in computed.items()
+    )
+    db.commit()
+    return len(computed)
+
+
+def recent_activity_count(
+    summary: models.ParcelActivitySummary, days: int, today: Optional[date] = None
+) -> int:
+    """
+    Count a parcel's activities dated within the last ``days`` days.
+
+    Args:
+        summary: Parcel summary row
+        days: Window length, at most SUMMARY_WINDOW_DAYS
+        today: Reference date (defaults to today)
+
+    Returns:
+        Number of activities dated on or after ``today - days``
+    """
+    since = ((today or date.today()) - timedelta(days=days)).isoformat()
+    return sum(
+        count for day, count in (summary.daily_counts or {}).items() if day >= since
+    )
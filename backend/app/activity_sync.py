@@ -0,0 +1,164 @@
+"""
+Idempotent activity sync for offline field devices.
+
+Devices tag every activity with a UUID of their own (``client_uuid``) and
+upload with ``INSERT ... ON CONFLICT (client_uuid) DO NOTHING``, so a
+retried upload never duplicates rows. Changes are pulled in
+``(updated_at, id)`` order from the watermark of the previous pull, and
+deletions (``activity_tombstones``) in ``(deleted_at, id)`` order from a
+watermark of their own.
+
+Both timestamps come from the database clock, but are taken when the
+writing transaction starts, not when it commits. A pull therefore only
+returns changes older than ``SYNC_SAFETY_LAG``: a transaction still open
+then would otherwise commit behind a watermark a device already holds.
+The lag must exceed the longest write transaction (see
+DATABASE_STATEMENT_TIMEOUT).
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.activity_summary import refresh_parcel_summaries
+from app.context_index import index_activities
+
+DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Changes younger than this are held back from pulls
+SYNC_SAFETY_LAG = timedelta(seconds=60)
+
+
+def push_activities(
+    db: Session, activities: List[schemas.ActivitySync]
+) -> List[Dict[str, Any]]:
+    """
+    Store uploaded activities, skipping those already stored.
+
+    Args:
+        db: Database session
+        activities: Activities uploaded by a device
+
+    Returns:
+        client_uuid and server id of each newly created activity
+    """
+    if not activities:
+        return []
+    table = models.Activity.__table__
+    insert = DIALECT_INSERTS[db.get_bind().dialect.name]
+    statement = (
+        insert(table)
+        .on_conflict_do_nothing(index_elements=[table.c.client_uuid])
+        .returning(table.c.id, table.c.client_uuid, table.c.parcel_id)
+    )
+    values = [
+        {**activity.model_dump(), "client_uuid": str(activity.client_uuid)}
+        for activity in activities
+    ]
+    created = db.execute(statement, values).all()
+
+    refresh_parcel_summaries(db, {row.parcel_id for row in created})
+    db.commit()
+    if created:
+        new_ids = [row.id for row in created]
+        index_activities(
+            db, db.query(models.Activity).filter(models.Activity.id.in_(new_ids))
+        )
+    return [{"client_uuid": row.client_uuid, "id": row.id} for row in created]
+
+
+def changes_after(
+    db: Session,
+    model: Any,
+    changed_at: Any,
+    since: Optional[datetime],
+    after_id: Optional[int],
+    until: datetime,
+    limit: int,
+) -> Dict[str, Any]:
+    """
+    One page of rows changed after a (timestamp, id) watermark.
+
+    Args:
+        db: Database session
+        model: models.Activity or models.ActivityTombstone
+        changed_at: Timestamp column of the watermark
+        since: Timestamp of the last row already pulled (None: all)
+        after_id: id of the last row already pulled, to break ties
+            between rows changed at the same instant
+        until: Latest timestamp returned (the safety lag cutoff)
+        limit: Maximum number of rows
+
+    Returns:
+        Dictionary with "items", the next "since" and "after_id", and
+        "has_more"
+    """
+    query = db.query(model).filter(changed_at <= until)
+    if since is not None:
+        query = query.filter(
+            or_(
+                changed_at > since,
+                and_(changed_at == since, model.id > (after_id or 0)),
+            )
+        )
+    rows = query.order_by(changed_at, model.id).limit(limit + 1).all()
+    items = rows[:limit]
+    last = items[-1] if items else None
+    return {
+        "items": items,
+        "since": getattr(last, changed_at.key) if last else since,
+        "after_id": last.id if last else after_id,
+        "has_more": len(rows) > limit,
+    }
+
+
+def pull_activities(
+    db: Session,
+    since: Optional[datetime],
+    after_id: Optional[int],
+    limit: int,
+    deleted_since: Optional[datetime] = None,
+    deleted_after_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch activities changed and deleted after the watermarks.
+
+    Args:
+        db: Database session
+        since: updated_at of the last activity already pulled (None: all)
+        after_id: id of the last activity already pulled
+        limit: Maximum number of activities, and of deletions
+        deleted_since: deleted_at of the last deletion already pulled
+            (None: all)
+        deleted_after_id: id of the last deletion already pulled
+
+    Returns:
+        Dictionary matching schemas.ActivitySyncPage
+    """
+    until = db.scalar(select(models.utc_timestamp())) - SYNC_SAFETY_LAG
+    activity, tombstone = models.Activity, models.ActivityTombstone
+    changed = changes_after(
+        db, activity, activity.updated_at, since, after_id, until, limit
+    )
+    deleted = changes_after(
+        db,
+        tombstone,
+        tombstone.deleted_at,
+        deleted_since,
+        deleted_after_id,
+        until,
+        limit,
+    )
+    return {
+        "items": changed["items"],
+        "since": changed["since"],
+        "after_id": changed["after_id"],
+        "deleted": deleted["items"],
+        "deleted_since": deleted["since"],
+        "deleted_after_id": deleted["after_id"],
+        "has_more": changed["has_more"] or deleted["has_more"],
+    }
@@ -4,12 +4,12 @@ Thin controllers that delegate to services.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.application.services.terrain_service import TerrainService
-from app.core.dependencies import ServiceDependencies, get_skip_limit
+from app.core.dependencies import ServiceDependencies
 from app.core.exceptions import (
     DomainException,
     TerrainNotFoundException,
@@ -21,6 +21,8 @@ from app.domain.farming.schemas import (
     TerrainSummary,
     TerrainUpdate,
 )
+from app.pagination import PageParams
+from app.schemas import Page
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +51,7 @@ async def create_terrain(
     - **location_id**: Optional location reference
     """
     try:
-        return terrain_service.create_terrain(terrain_data, current_user_id)
+        return await terrain_service.create_terrain(terrain_data, current_user_id)
     except DomainException as e:
         logger.error(f"Domain error creating terrain: {e}")
         raise domain_exception_to_http(e)
@@ -76,7 +78,7 @@ async def get_terrain(
     - Number of inactive parcels
     """
     try:
-        return terrain_service.get_terrain(terrain_id, current_user_id)
+        return await terrain_service.get_terrain(terrain_id, current_user_id)
     except TerrainNotFoundException:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -86,25 +88,27 @@ async def get_terrain(
         raise domain_exception_to_http(e)
 
 
-@router.get("/", response_model=List[TerrainSummary])
+@router.get("/", response_model=Page[TerrainSummary])
 async def list_terrains(
-    pagination: dict = Depends(get_skip_limit),
+    page: PageParams = Depends(),
     search: Optional[str] = Query(None, description="Search by name"),
     terrain_service: TerrainService = Depends(ServiceDependencies.get_terrain_service),
     current_user_id: int = 1,  # TODO: Replace with actual auth dependency
-) -> List[TerrainSummary]:
+) -> Page[TerrainSummary]:
     """
-    List terrains for the current user.
+    List terrains for the current user, one page at a time.
 
-    - **skip**: Number of terrains to skip (pagination)
     - **limit**: Maximum number of terrains to return
+    - **after**: Cursor (next_cursor of the previous page)
     - **search**: Optional search by terrain name
     """
     if search:
-        return terrain_service.search_terrains(search, current_user_id)
+        return await terrain_service.search_terrains(
+            search, current_user_id, limit=page.limit, after=page.after
+        )
 
-    return terrain_service.list_user_terrains(
-        current_user_id, skip=pagination["skip"], limit=pagination["limit"]
+    return await terrain_service.list_user_terrains(
+        current_user_id, limit=page.limit, after=page.after
     )
 
 
@@ -121,7 +125,7 @@ async def update_terrain(
     All fields are optional - only provided fields will be updated.
     """
     try:
-        return terrain_service.update_terrain(
+        return await terrain_service.update_terrain(
             terrain_id, terrain_update, current_user_id
         )
     except DomainException as e:
@@ -140,6 +144,6 @@ async def delete_terrain(
     Note: Terrain must not have any parcels to be deleted.
     """
     try:
-        terrain_service.delete_terrain(terrain_id, current_user_id)
+        await terrain_service.delete_terrain(terrain_id, current_user_id)
     except DomainException as e:
         raise domain_exception_to_http(e)
@@ -4,9 +4,8 @@ Contains business logic for terrain management.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
-from app.core.config import Settings
 from app.core.exceptions import AuthorizationException, TerrainNotFoundException
 from app.domain.farming.schemas import (
     Terrain,
@@ -14,19 +13,42 @@ from app.domain.farming.schemas import (
     TerrainSummary,
     TerrainUpdate,
 )
-from app.infrastructure.repositories.terrain_repository import TerrainRepository
+from app.infrastructure.repositories.terrain_repository import (
+    AsyncTerrainRepository,
+)
+from app.pagination import DEFAULT_PAGE_SIZE
+from app.schemas import Page
 
 logger = logging.getLogger(__name__)
 
 
+def terrain_summary(terrain: Any, parcel_count: int) -> TerrainSummary:
+    """Summary of a terrain whose parcels were counted by the query."""
+    return TerrainSummary(
+        id=terrain.id,
+        name=terrain.name,
+        description=terrain.description,
+        parcel_count=parcel_count,
+    )
+
+
+def summary_page(page: Dict[str, Any]) -> Page[TerrainSummary]:
+    """Page of summaries from a page of (terrain, parcel count) rows."""
+    return Page[TerrainSummary](
+        items=[terrain_summary(terrain, count) for terrain, count in page["items"]],
+        next_cursor=page["next_cursor"],
+    )
+
+
 class TerrainService:
     """Service for terrain business operations."""
 
-    def __init__(self, terrain_repository: TerrainRepository, settings: Settings):
+    def __init__(self, terrain_repository: AsyncTerrainRepository):
         self.terrain_repo = terrain_repository
-        self.settings = settings
 
-    def create_terrain(self, terrain_data: TerrainCreate, user_id: int) -> Terrain:
+    async def create_terrain(
+        self, terrain_data: TerrainCreate, user_id: int
+    ) -> Terrain:
         """
         Create a new terrain.
 
@@ -44,13 +66,14 @@ class TerrainService:
             raise AuthorizationException("create", "terrain for another user")
 
         # Create terrain
-        terrain_dict = terrain_data.dict()
-        db_terrain = self.terrain_repo.create(terrain_dict)
+        terrain_dict = terrain_data.model_dump()
+        db_terrain = await self.terrain_repo.create(terrain_dict)
 
         logger.info(f"Terrain created with ID: {db_terrain.id}")
-        return Terrain.from_orm(db_terrain)
+        db_terrain = await self.terrain_repo.get_with_parcels(db_terrain.id)
+        return Terrain.model_validate(db_terrain)
 
-    def get_terrain(self, terrain_id: int, user_id: int) -> Dict[str, Any]:
+    async def get_terrain(self, terrain_id: int, user_id: int) -> Dict[str, Any]:
         """
         Get terrain by ID with authorization check.
 
@@ -65,7 +88,7 @@ class TerrainService:
             TerrainNotFoundException: If terrain not found
             AuthorizationException: If user not authorized
         """
-        terrain_data = self.terrain_repo.get_with_stats(terrain_id)
+        terrain_data = await self.terrain_repo.get_with_stats(terrain_id)
 
         if not terrain_data:
             raise TerrainNotFoundException(terrain_id)
@@ -77,40 +100,30 @@ class TerrainService:
             raise AuthorizationException("view", "terrain")
 
         return {
-            "terrain": Terrain.from_orm(terrain),
+            "terrain": Terrain.model_validate(terrain),
             "statistics": terrain_data["statistics"],
         }
 
-    def list_user_terrains(
-        self, user_id: int, skip: int = 0, limit: int = 100
-    ) -> List[TerrainSummary]:
+    async def list_user_terrains(
+        self, user_id: int, limit: int = DEFAULT_PAGE_SIZE, after: Optional[int] = None
+    ) -> Page[TerrainSummary]:
         """
-        List all terrains owned by a user.
+        List the terrains owned by a user, one page at a time.
 
         Args:
             user_id: ID of the user
-            skip: Number of records to skip
             limit: Maximum number of records
+            after: Cursor (``next_cursor`` of the previous page)
 
         Returns:
-            List of terrain summaries
+            Page of terrain summaries
         """
-        terrains = self.terrain_repo.get_by_owner(user_id, skip, limit)
-
-        # Convert to summary format with parcel count
-        summaries = []
-        for terrain in terrains:
-            summary = TerrainSummary(
-                id=terrain.id,
-                name=terrain.name,
-                description=terrain.description,
-                parcel_count=len(terrain.parcels) if terrain.parcels else 0,
-            )
-            summaries.append(summary)
-
-        return summaries
-
-    def update_terrain(
+        page = await self.terrain_repo.get_by_owner_with_parcel_counts(
+            user_id, limit, after
+        )
+        return summary_page(page)
+
+    async def update_terrain(
         self, terrain_id: int, terrain_update: TerrainUpdate, user_id: int
     ) -> Terrain:
         """
@@ -129,7 +142,7 @@ class TerrainService:
             AuthorizationException: If user not authorized
         """
         # Get existing terrain
-        db_terrain = self.terrain_repo.get(terrain_id)
+        db_terrain = await self.terrain_repo.get_with_parcels(terrain_id)
         if not db_terrain:
             raise TerrainNotFoundException(terrain_id)
 
@@ -138,15 +151,16 @@ class TerrainService:
             raise AuthorizationException("update", "terrain")
 
         # Update only provided fields
-        update_data = terrain_update.dict(exclude_unset=True)
+        update_data = terrain_update.model_dump(exclude_unset=True)
         if update_data:
-            updated_terrain = self.terrain_repo.update(terrain_id, update_data)
+            await self.terrain_repo.update(terrain_id, update_data)
             logger.info(f"Terrain {terrain_id} updated")
-            return Terrain.from_orm(updated_terrain)
+            updated_terrain = await self.terrain_repo.get_with_parcels(terrain_id)
+            return Terrain.model_validate(updated_terrain)
 
-        return Terrain.from_orm(db_terrain)
+        return Terrain.model_validate(db_terrain)
 
-    def delete_terrain(self, terrain_id: int, user_id: int) -> bool:
+    async def delete_terrain(self, terrain_id: int, user_id: int) -> bool:
         """
         Delete a terrain.
 
@@ -163,7 +177,7 @@ class TerrainService:
             InvalidOperationException: If terrain has parcels
         """
         # Get existing terrain
-        db_terrain = self.terrain_repo.get(terrain_id)
+        db_terrain = await self.terrain_repo.get(terrain_id)
         if not db_terrain:
             raise TerrainNotFoundException(terrain_id)
 
@@ -172,32 +186,33 @@ class TerrainService:
             raise AuthorizationException("delete", "terrain")
 
         # Delete with validation (checks for parcels)
-        result = self.terrain_repo.delete_with_validation(terrain_id)
+        result = await self.terrain_repo.delete_with_validation(terrain_id)
 
         if result:
             logger.info(f"Terrain {terrain_id} deleted by user {user_id}")
 
         return result
 
-    def search_terrains(self, name: str, user_id: int) -> List[TerrainSummary]:
+    async def search_terrains(
+        self,
+        name: str,
+        user_id: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[int] = None,
+    ) -> Page[TerrainSummary]:
         """
-        Search terrains by name for a specific user.
+        Search terrains by name for a specific user, one page at a time.
 
         Args:
             name: Name pattern to search
             user_id: ID of the user
+            limit: Maximum number of records
+            after: Cursor (``next_cursor`` of the previous page)
 
         Returns:
-            List of matching terrain summaries
+            Page of matching terrain summaries
         """
-        terrains = self.terrain_repo.search_by_name(name, user_id)
-
-        return [
-            TerrainSummary(
-                id=t.id,
-                name=t.name,
-                description=t.description,
-                parcel_count=len(t.parcels) if t.parcels else 0,
-            )
-            for t in terrains
-        ]
+        page = await self.terrain_repo.search_by_name_with_parcel_counts(
+            name, user_id, limit, after
+        )
+        return summary_page(page)
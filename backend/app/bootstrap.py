@@ -0,0 +1,124 @@
+"""
+Start-up snapshot for the frontend.
+
+One request returns the terrains, parcels, recent activities and the
+locations they reference, each as a ``schemas.Table`` (column names plus
+rows of values), instead of one paginated request per terrain and per
+parcel. Geometries are converted to GeoJSON by the database
+(``ST_AsGeoJSON``).
+"""
+
+import json
+from datetime import date, timedelta
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import Text
+
+from app import models
+
+# Default window of the activities included in the snapshot
+BOOTSTRAP_ACTIVITY_DAYS = 365
+
+
+class as_geojson(FunctionElement):
+    """A geometry column as GeoJSON text."""
+
+    type = Text()
+    inherit_cache = True
+
+
+@compiles(as_geojson)
+def _as_geojson_default(element, compiler, **kw):
+    return "ST_AsGeoJSON(%s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(as_geojson, "sqlite")
+def _as_geojson_sqlite(element, compiler, **kw):
+    # Geometries are stored as GeoJSON text without PostGIS
+    return compiler.process(element.clauses, **kw)
+
+
+def load_table(db: Session, statement: Any) -> Dict[str, Any]:
+    """Run a select and return its column names and rows."""
+    result = db.execute(statement)
+    return {"columns": list(result.keys()), "rows": [list(row) for row in result]}
+
+
+def _columns(model: Any, names: Sequence[str]) -> list:
+    return [getattr(model, name) for name in names]
+
+
+def load_snapshot(
+    db: Session,
+    activity_days: int = BOOTSTRAP_ACTIVITY_DAYS,
+    today: Optional[date] = None,
+) -> Dict[str, Any]:
+    """
+    Load the start-up snapshot.
+
+    Args:
+        db: Database session
+        activity_days: Include activities of the last ``activity_days`` days
+        today: Reference date for the activity window (defaults to today)
+
+    Returns:
+        Dictionary matching schemas.BootstrapOut
+    """
+    since = (today or date.today()) - timedelta(days=activity_days)
+    terrain, parcel = models.Terrain, models.Parcel
+    activity, location = models.Activity, models.Location
+
+    terrains = load_table(
+        db,
+        select(
+            *_columns(terrain, ["id", "name", "description", "owner_id", "location_id"])
+        ).order_by(terrain.id),
+    )
+    parcels = load_table(
+        db,
+        select(
+            *_columns(
+                parcel,
+                ["id", "name", "current_use", "status", "terrain_id", "location_id"],
+            )
+        ).order_by(parcel.id),
+    )
+    activities = load_table(
+        db,
+        select(
+            *_columns(
+                activity, ["id", "type", "date", "description", "user_id", "parcel_id"]
+            )
+        )
+        .where(activity.date >= since)
+        .order_by(activity.parcel_id, activity.date, activity.id),
+    )
+    locations = load_table(
+        db,
+        select(
+            location.id,
+            location.type,
+            as_geojson(location.coordinates).label("coordinates"),
+        )
+        .where(
+            or_(
+                location.id.in_(select(terrain.location_id)),
+                location.id.in_(select(parcel.location_id)),
+            )
+        )
+        .order_by(location.id),
+    )
+    for row in locations["rows"]:
+        row[2] = json.loads(row[2]) if row[2] else None
+
+    return {
+        "terrains": terrains,
+        "parcels": parcels,
+        "activities": activities,
+        "locations": locations,
+        "activities_since": since,
+    }
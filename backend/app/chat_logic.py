@@ -1,28 +1,122 @@
-import json
+import asyncio
+import logging
 import os
-import tempfile
-from typing import Dict, List
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Hashable, Iterator, List, Optional, Union
 
 import pandas as pd
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
-from langchain.text_splitter import CharacterTextSplitter
-from langchain_community.document_loaders import CSVLoader, JSONLoader
 from langchain_community.vectorstores import FAISS
-from langchain_huggingface import HuggingFaceEmbeddings
+from langchain_core.documents import Document
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
 
+from app.context_documents import stream_context_documents
+from app.context_index import ContextIndex, context_index, dataframe_documents
+from app.core.config import get_chat_settings
 from app.data_simulation import parcels, simulate_data
-from app.utils import evaluate_parcel_status
+from app.db import SessionLocal
+from app.utils import evaluate_parcel_status, sanitize_string
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables and setup Claude 3.5
 load_dotenv()
-anthropic_key = os.getenv("ANTHROPIC_API_KEY")
+chat_settings = get_chat_settings()
+anthropic_key = chat_settings.ANTHROPIC_API_KEY
 if anthropic_key:
     os.environ["ANTHROPIC_API_KEY"] = anthropic_key
     llm = init_chat_model("anthropic:claude-3-5-sonnet-latest", temperature=0)
+elif chat_settings.CHAT_FAKE_LLM:
+    # Canned stand-in for local testing without an API key
+    llm = FakeListChatModel(
+        responses=["This is a test answer from the fake agricultural assistant."]
+    )
 else:
     llm = None
 
+LLM_UNAVAILABLE_MESSAGE = "AI assistant unavailable - ANTHROPIC_API_KEY not configured"
+CHAT_ANSWER_CACHE_SIZE = chat_settings.CHAT_ANSWER_CACHE_SIZE
+CHAT_ANSWER_CACHE_TTL = chat_settings.CHAT_ANSWER_CACHE_TTL
+RETRIEVAL_K = 3
+
+
+class AnswerCache:
+    """Thread-safe LRU cache of chat answers with a time-to-live."""
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of answers kept (0 disables caching)
+            ttl: Seconds an answer stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return the cached answer, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, answer = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return answer
+
+    def set(self, key: Hashable, answer: str) -> None:
+        """Store an answer, evicting the least recently used one when full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+answer_cache = AnswerCache(CHAT_ANSWER_CACHE_SIZE, CHAT_ANSWER_CACHE_TTL)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so trivially different phrasings share a cache entry."""
+    return sanitize_string(prompt).lower().rstrip("?!. ")
+
+
+def _cache_key(prompt: str, version: int) -> tuple:
+    """Answer cache key; a context index update invalidates old answers."""
+    return (normalize_prompt(prompt), version)
+
+
+def load_context_documents() -> Iterator[Document]:
+    """
+    Stream the documents used to build the chat context index.
+
+    Returns:
+        Iterator over documents read from the database in chunks
+    """
+    db = SessionLocal()
+    try:
+        yield from stream_context_documents(db)
+    finally:
+        db.close()
+
 
 def prepare_context(
     activities_df: pd.DataFrame,
@@ -30,7 +124,10 @@ def prepare_context(
     parcel_status_dict: Dict[int, List[str]],
 ) -> FAISS:
     """
-    Prepare context for agricultural chat assistant.
+    Prepare a standalone context index for the given data.
+
+    The chat endpoint uses the shared ``context_index`` instead; this builds
+    a one-off FAISS store directly from memory without temporary files.
 
     Args:
         activities_df: DataFrame containing activity data
@@ -40,75 +137,58 @@ def prepare_context(
     Returns:
         FAISS vector database with embedded context
     """
-    # Create temporary CSV files for activities and details
-    with (
-        tempfile.NamedTemporaryFile(delete=False, suffix="_activities.csv") as f1,
-        tempfile.NamedTemporaryFile(delete=False, suffix="_details.csv") as f2,
-    ):
-        activities_df.to_csv(f1.name, index=False)
-        details_df.to_csv(f2.name, index=False)
-
-    # Create JSON data for parcel status
-    json_data = [
-        {"id": k, "content": " - ".join(v)} for k, v in parcel_status_dict.items()
-    ]
-    with tempfile.NamedTemporaryFile(
-        "w", delete=False, suffix="_status.json", encoding="utf-8"
-    ) as f3:
-        json.dump(json_data, f3, ensure_ascii=False, indent=4)
-
-    # Load documents from files
-    docs = (
-        CSVLoader(f1.name).load()
-        + CSVLoader(f2.name).load()
-        + JSONLoader(f3.name, jq_schema=".[] | .content", text_content=False).load()
-    )
-
-    # Split documents into chunks
-    splitter = CharacterTextSplitter(chunk_size=1000, chunk_overlap=50)
-    docs_split = splitter.split_documents(docs)
-
-    # Create embeddings and vector database
-    embeddings = HuggingFaceEmbeddings(
-        model_name="sentence-transformers/all-MiniLM-L6-v2"
+    docs = dataframe_documents(activities_df, details_df, parcel_status_dict)
+    db = FAISS.from_documents(
+        docs, context_index.embeddings, ids=[doc.id for doc in docs]
     )
-    db = FAISS.from_documents(docs_split, embeddings)
+    logger.info(f"Context prepared (embedding cache: {context_index.cache_stats()})")
     return db
 
 
-def answer_query(prompt: str, db: FAISS) -> str:
+def answer_query(prompt: str, db: Union[FAISS, ContextIndex]) -> str:
     """
     Generate answer for agricultural query using context database.
 
     Args:
         prompt: User query/prompt
-        db: FAISS vector database with context
+        db: FAISS vector database or shared context index
 
     Returns:
         AI-generated response string
     """
     if llm is None:
-        return "AI assistant unavailable - ANTHROPIC_API_KEY not configured"
+        return LLM_UNAVAILABLE_MESSAGE
+
+    relevant_docs = db.similarity_search(prompt, k=RETRIEVAL_K)
+    result = llm.invoke(build_messages(prompt, relevant_docs))
+    return result.content
 
-    relevant_docs = db.similarity_search(prompt, k=3)
-    context = "\n\n".join([doc.page_content for doc in relevant_docs])
 
-    result = llm.invoke(
-        [
-            {
-                "role": "system",
-                "content": f"""
+def build_messages(prompt: str, documents: List[Document]) -> List[Dict[str, str]]:
+    """
+    Build the LLM messages for a query and its retrieved context.
+
+    Args:
+        prompt: User query/prompt
+        documents: Retrieved context documents
+
+    Returns:
+        System and user messages
+    """
+    context = "\n\n".join([doc.page_content for doc in documents])
+    return [
+        {
+            "role": "system",
+            "content": f"""
         You are an agricultural assistant. Use the following context to help:
         {context}
         
         Provide helpful, accurate agricultural advice based on the data provided.
         Focus on practical recommendations for farm management.
         """,
-            },
-            {"role": "user", "content": prompt},
-        ]
-    )
-    return result.content
+        },
+        {"role": "user", "content": prompt},
+    ]
 
 
 def generate_context_and_respond(
@@ -133,6 +213,84 @@ def generate_context_and_respond(
     return answer_query(prompt, db)
 
 
+def respond(prompt: str) -> str:
+    """
+    Answer a query using the shared, incrementally updated context index.
+
+    Args:
+        prompt: User query
+
+    Returns:
+        AI-generated response string
+    """
+    if llm is None:
+        return LLM_UNAVAILABLE_MESSAGE
+
+    version = _current_index_version()
+    key = _cache_key(prompt, version)
+    answer = answer_cache.get(key)
+    if answer is None:
+        documents, built_from = context_index.similarity_search_with_version(
+            prompt, RETRIEVAL_K
+        )
+        answer = llm.invoke(build_messages(prompt, documents)).content
+        _store_answer(key, version, built_from, answer)
+    return answer
+
+
+def _current_index_version() -> int:
+    """Build the context index if needed, apply queued updates, return its version."""
+    context_index.ensure_built(load_context_documents)
+    context_index.apply_pending()
+    return context_index.version
+
+
+def _store_answer(key: tuple, version: int, built_from: int, answer: str) -> None:
+    """
+    Cache an answer under the version snapshot it was looked up with.
+
+    If the index changed between the lookup and retrieval, the answer was
+    built from a newer index than the key describes and is not cached.
+    """
+    if built_from == version:
+        answer_cache.set(key, answer)
+
+
+async def stream_response(prompt: str) -> AsyncIterator[str]:
+    """
+    Stream an answer token by token using the shared context index.
+
+    Index building and retrieval run in a worker thread so the event loop
+    is never blocked; cached answers are returned as a single chunk.
+
+    Args:
+        prompt: User query
+
+    Yields:
+        Response text chunks
+    """
+    if llm is None:
+        yield LLM_UNAVAILABLE_MESSAGE
+        return
+
+    version = await asyncio.to_thread(_current_index_version)
+    key = _cache_key(prompt, version)
+    cached = answer_cache.get(key)
+    if cached is not None:
+        yield cached
+        return
+
+    documents, built_from = await asyncio.to_thread(
+        context_index.similarity_search_with_version, prompt, RETRIEVAL_K
+    )
+    parts: List[str] = []
+    async for chunk in llm.astream(build_messages(prompt, documents)):
+        if isinstance(chunk.content, str) and chunk.content:
+            parts.append(chunk.content)
+            yield chunk.content
+    _store_answer(key, version, built_from, "".join(parts))
+
+
 # Legacy function names for backwards compatibility
 def preparar_contexto(
     df_actividades: pd.DataFrame,
@@ -162,7 +320,7 @@ def generar_contexto_y_responder(
 
 if __name__ == "__main__":
     # Example usage
-    activities, details = simulate_data(parcels)
+    activities, details, *_ = simulate_data(parcels)
     parcel_status = evaluate_parcel_status(activities)
     context = prepare_context(activities, details, parcel_status)
     prompt = "Which parcels are active? Which are pending intervention? And which are inactive?"
@@ -0,0 +1,189 @@
+"""
+Chat context documents streamed directly from the database.
+
+Rows are read with ``yield_per`` (server-side cursors on PostgreSQL) and
+turned into documents one chunk at a time, so memory use depends on the
+chunk size rather than on the size of the tables.
+"""
+
+from typing import Any, Iterable, Iterator, List
+
+import pandas as pd
+from langchain_core.documents import Document
+from sqlalchemy.orm import Session
+
+from app import models
+from app.context_index import (
+    CHAT_CONTEXT_CHUNK_SIZE,
+    activity_document,
+    context_index,
+    detail_document,
+    parcel_status_document,
+    record_document,
+)
+from app.utils import evaluate_parcel_status
+
+TRANSACTION_COLUMNS = (
+    models.Transaction.id,
+    models.Transaction.parcel_id,
+    models.Transaction.date,
+    models.Transaction.type,
+    models.Transaction.category,
+    models.Transaction.description,
+    models.Transaction.amount,
+)
+
+INVENTORY_COLUMNS = (
+    models.Inventory.id,
+    models.Inventory.parcel_id,
+    models.Inventory.name,
+    models.Inventory.type,
+    models.Inventory.current_quantity,
+    models.Inventory.unit,
+)
+
+
+def _parcel_status(parcel_id: int, rows: List[dict]) -> Document:
+    """Evaluate the status document for one parcel's activity rows."""
+    statuses = evaluate_parcel_status(pd.DataFrame(rows))
+    return parcel_status_document(parcel_id, statuses[parcel_id])
+
+
+def stream_activity_documents(
+    db: Session, chunk_size: int = CHAT_CONTEXT_CHUNK_SIZE
+) -> Iterator[Document]:
+    """
+    Stream activity documents, plus one status document per parcel.
+
+    Activities are read ordered by parcel, so each parcel's status is
+    evaluated as soon as its last activity has been seen.
+
+    Args:
+        db: Database session
+        chunk_size: Number of rows fetched per round trip
+    """
+    query = (
+        db.query(
+            models.Activity.id,
+            models.Activity.parcel_id,
+            models.Activity.type,
+            models.Activity.description,
+            models.Activity.date,
+        )
+        .filter(models.Activity.parcel_id.isnot(None))
+        .order_by(models.Activity.parcel_id, models.Activity.date)
+        .execution_options(yield_per=chunk_size)
+    )
+
+    current_parcel_id = None
+    parcel_rows: List[dict] = []
+    for row in query:
+        record = row._asdict()
+        if record["parcel_id"] != current_parcel_id:
+            if parcel_rows:
+                yield _parcel_status(current_parcel_id, parcel_rows)
+            current_parcel_id = record["parcel_id"]
+            parcel_rows = []
+        parcel_rows.append(
+            {
+                "parcel_id": record["parcel_id"],
+                "date": record["date"],
+                "type": record["type"],
+            }
+        )
+        yield activity_document(record)
+
+    if parcel_rows:
+        yield _parcel_status(current_parcel_id, parcel_rows)
+
+
+def stream_detail_documents(
+    db: Session, chunk_size: int = CHAT_CONTEXT_CHUNK_SIZE
+) -> Iterator[Document]:
+    """Stream activity detail documents."""
+    query = (
+        db.query(
+            models.ActivityDetail.id,
+            models.ActivityDetail.activity_id,
+            models.ActivityDetail.name,
+            models.ActivityDetail.value,
+            models.ActivityDetail.unit,
+        )
+        .order_by(models.ActivityDetail.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for row in query:
+        record = row._asdict()
+        yield detail_document(record, record["id"])
+
+
+def stream_transaction_documents(
+    db: Session, chunk_size: int = CHAT_CONTEXT_CHUNK_SIZE
+) -> Iterator[Document]:
+    """Stream financial transaction documents."""
+    query = (
+        db.query(*TRANSACTION_COLUMNS)
+        .order_by(models.Transaction.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for row in query:
+        yield record_document("transaction", row._asdict())
+
+
+def stream_inventory_documents(
+    db: Session, chunk_size: int = CHAT_CONTEXT_CHUNK_SIZE
+) -> Iterator[Document]:
+    """Stream inventory item documents."""
+    query = (
+        db.query(*INVENTORY_COLUMNS)
+        .order_by(models.Inventory.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for row in query:
+        yield record_document("inventory", row._asdict())
+
+
+def stream_context_documents(
+    db: Session, chunk_size: int = CHAT_CONTEXT_CHUNK_SIZE
+) -> Iterator[Document]:
+    """
+    Stream every chat context document from the database.
+
+    Args:
+        db: Database session
+        chunk_size: Number of rows fetched per round trip
+
+    Returns:
+        Iterator over activity, status, detail, transaction and inventory
+        documents
+    """
+    yield from stream_activity_documents(db, chunk_size)
+    yield from stream_detail_documents(db, chunk_size)
+    yield from stream_transaction_documents(db, chunk_size)
+    yield from stream_inventory_documents(db, chunk_size)
+
+
+# ----------------------
+# WRITE HOOKS
+# ----------------------
+
+
+def _record(obj: Any, columns: Iterable[Any]) -> dict:
+    """Read the given model columns from an ORM object."""
+    return {column.key: getattr(obj, column.key) for column in columns}
+
+
+def index_transaction(transaction: models.Transaction) -> None:
+    """Queue a context update for a created or modified transaction."""
+    if context_index.is_built:
+        context_index.upsert(
+            [record_document("transaction", _record(transaction, TRANSACTION_COLUMNS))]
+        )
+
+
+def index_inventory(inventory: models.Inventory) -> None:
+    """Queue a context update for a created or modified inventory item."""
+    if context_index.is_built:
+        context_index.upsert(
+            [record_document("inventory", _record(inventory, INVENTORY_COLUMNS))]
+        )
@@ -0,0 +1,392 @@
+"""
+Persistent context index for the agricultural chat assistant.
+
+The FAISS vector store is built once per process (or loaded from disk when
+CHAT_INDEX_DIR is set) and kept current by applying queued document changes
+before each search, so a chat request only pays for a similarity search.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import get_chat_settings
+from app.infrastructure.external.embedding_cache import get_cached_embeddings
+from app.utils import evaluate_parcel_status
+
+logger = logging.getLogger(__name__)
+
+CHAT_INDEX_DIR = get_chat_settings().CHAT_INDEX_DIR
+CHAT_CONTEXT_CHUNK_SIZE = get_chat_settings().CHAT_CONTEXT_CHUNK_SIZE
+
+
+# ----------------------
+# DOCUMENT BUILDERS
+# ----------------------
+
+
+def _row_to_text(row: Dict[str, Any]) -> str:
+    """Render a record as "field: value" lines (same layout as CSVLoader)."""
+    return "\n".join(f"{key}: {value}" for key, value in row.items())
+
+
+def activity_document(row: Dict[str, Any]) -> Document:
+    """Build the context document for a single activity record."""
+    return Document(
+        id=f"activity:{row['id']}",
+        page_content=_row_to_text(row),
+        metadata={"source": "activities", "parcel_id": row.get("parcel_id")},
+    )
+
+
+def detail_document(row: Dict[str, Any], key: Any) -> Document:
+    """Build the context document for a single activity detail record."""
+    return Document(
+        id=f"detail:{key}",
+        page_content=_row_to_text(row),
+        metadata={"source": "activity_details", "activity_id": row.get("activity_id")},
+    )
+
+
+def parcel_status_document(parcel_id: int, statuses: List[str]) -> Document:
+    """Build the context document describing the status of a parcel."""
+    return Document(
+        id=f"parcel_status:{parcel_id}",
+        page_content=" - ".join(statuses),
+        metadata={"source": "parcel_status", "parcel_id": parcel_id},
+    )
+
+
+def dataframe_documents(
+    activities_df: pd.DataFrame,
+    details_df: pd.DataFrame,
+    parcel_status: Dict[int, List[str]],
+) -> List[Document]:
+    """
+    Convert activity, detail and status data into context documents.
+
+    Args:
+        activities_df: DataFrame containing activity data
+        details_df: DataFrame containing activity details
+        parcel_status: Dictionary mapping parcel_id to status list
+
+    Returns:
+        List of documents with stable ids
+    """
+    documents = [
+        activity_document(row) for row in activities_df.to_dict(orient="records")
+    ]
+    for position, row in enumerate(details_df.to_dict(orient="records")):
+        documents.append(detail_document(row, row.get("id", position)))
+    documents += [
+        parcel_status_document(parcel_id, statuses)
+        for parcel_id, statuses in parcel_status.items()
+    ]
+    return documents
+
+
+def record_document(source: str, row: Dict[str, Any]) -> Document:
+    """Build the context document for a generic record with an ``id`` field."""
+    return Document(
+        id=f"{source}:{row['id']}",
+        page_content=_row_to_text(row),
+        metadata={"source": source, "parcel_id": row.get("parcel_id")},
+    )
+
+
+# ----------------------
+# CONTEXT INDEX
+# ----------------------
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of at most ``size`` items from an iterable."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ContextIndex:
+    """In-process FAISS index with incremental, id-based updates."""
+
+    def __init__(
+        self,
+        embeddings_factory: Callable[[], Embeddings],
+        persist_dir: Optional[str] = None,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            embeddings_factory: Callable returning the embedding model to use
+            persist_dir: Optional directory where the index is saved and loaded
+        """
+        self._embeddings_factory = embeddings_factory
+        self._embeddings: Optional[Embeddings] = None
+        self.persist_dir = persist_dir
+        self._store: Optional[FAISS] = None
+        self._built = False
+        self._pending_upserts: Dict[str, Document] = {}
+        self._pending_removals: set = set()
+        self._lock = threading.RLock()
+        self.version = 0
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index has been built or loaded."""
+        return self._built
+
+    @property
+    def embeddings(self) -> Embeddings:
+        """Embedding model, created on first use."""
+        if self._embeddings is None:
+            self._embeddings = self._embeddings_factory()
+        return self._embeddings
+
+    def ensure_built(self, loader: Callable[[], Iterable[Document]]) -> None:
+        """
+        Build the index unless it already exists in memory or on disk.
+
+        Args:
+            loader: Callable returning (or streaming) all context documents
+        """
+        with self._lock:
+            if self._built:
+                return
+            if self._load():
+                return
+            self.build(loader())
+
+    def build(
+        self, documents: Iterable[Document], chunk_size: int = CHAT_CONTEXT_CHUNK_SIZE
+    ) -> None:
+        """
+        Replace the whole index with the given documents.
+
+        Documents are consumed and embedded ``chunk_size`` at a time, so a
+        streaming source is never fully materialised before indexing.
+        """
+        with self._lock:
+            store = None
+            total = 0
+            for chunk in _chunked(documents, chunk_size):
+                if store is None:
+                    store = self._create_store(chunk)
+                else:
+                    store.add_documents(chunk, ids=[document.id for document in chunk])
+                total += len(chunk)
+
+            self._store = store
+            self._pending_upserts.clear()
+            self._pending_removals.clear()
+            self._built = True
+            self.version += 1
+            self._save()
+            logger.info(
+                f"Chat context index built with {total} documents "
+                f"(embedding cache: {self.cache_stats()})"
+            )
+
+    def upsert(self, documents: Iterable[Document]) -> None:
+        """
+        Queue documents to be added or replaced on the next search.
+
+        Changes received before the index is built are ignored, since the
+        initial build already reads the current data.
+        """
+        with self._lock:
+            if not self._built:
+                return
+            for document in documents:
+                self._pending_upserts[document.id] = document
+                self._pending_removals.discard(document.id)
+
+    def remove(self, doc_ids: Iterable[str]) -> None:
+        """Queue documents to be removed on the next search."""
+        with self._lock:
+            if not self._built:
+                return
+            for doc_id in doc_ids:
+                self._pending_upserts.pop(doc_id, None)
+                self._pending_removals.add(doc_id)
+
+    def apply_pending(self) -> None:
+        """Apply queued upserts and removals to the vector store."""
+        with self._lock:
+            if not self._pending_upserts and not self._pending_removals:
+                return
+
+            upserts = list(self._pending_upserts.values())
+            touched = set(self._pending_upserts) | self._pending_removals
+            self._pending_upserts.clear()
+            self._pending_removals.clear()
+
+            if self._store is not None:
+                existing = touched.intersection(
+                    self._store.index_to_docstore_id.values()
+                )
+                if existing:
+                    self._store.delete(list(existing))
+
+            if upserts:
+                if self._store is None:
+                    self._store = self._create_store(upserts)
+                else:
+                    self._store.add_documents(
+                        upserts, ids=[document.id for document in upserts]
+                    )
+
+            self.version += 1
+            self._save()
+
+    def similarity_search(self, query: str, k: int = 3) -> List[Document]:
+        """Return the k documents most similar to the query."""
+        return self.similarity_search_with_version(query, k)[0]
+
+    def similarity_search_with_version(
+        self, query: str, k: int = 3
+    ) -> Tuple[List[Document], int]:
+        """
+        Return the k most similar documents and the index version they came from.
+
+        Queued changes are applied first, under the same lock, so the version
+        always describes the index the documents were retrieved from.
+        """
+        with self._lock:
+            self.apply_pending()
+            if self._store is None:
+                return [], self.version
+            return self._store.similarity_search(query, k=k), self.version
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Embedding cache hit/miss counters, when the model is cached."""
+        stats = getattr(self.embeddings, "stats", None)
+        return stats() if stats else {}
+
+    def _create_store(self, documents: List[Document]) -> Optional[FAISS]:
+        """Create a FAISS store, or None when there is nothing to index."""
+        if not documents:
+            return None
+        return FAISS.from_documents(
+            documents, self.embeddings, ids=[document.id for document in documents]
+        )
+
+    def _save(self) -> None:
+        """Persist the index when a persistence directory is configured."""
+        if self.persist_dir and self._store is not None:
+            self._store.save_local(self.persist_dir)
+
+    def _load(self) -> bool:
+        """Load a previously saved index. Returns True on success."""
+        if not self.persist_dir or not os.path.isdir(self.persist_dir):
+            return False
+        try:
+            self._store = FAISS.load_local(
+                self.persist_dir,
+                self.embeddings,
+                allow_dangerous_deserialization=True,
+            )
+        except Exception as e:
+            logger.warning(f"Could not load chat context index: {e}")
+            return False
+        self._built = True
+        self.version += 1
+        return True
+
+
+# Process-wide index used by the chat endpoint
+context_index = ContextIndex(get_cached_embeddings, persist_dir=CHAT_INDEX_DIR)
+
+
+# ----------------------
+# WRITE HOOKS
+# ----------------------
+
+
+def _parcel_status_documents(db: Session, parcel_ids: Iterable[int]) -> List[Document]:
+    """Recompute status documents for the given parcels from the database."""
+    parcel_ids = {parcel_id for parcel_id in parcel_ids if parcel_id is not None}
+    if not parcel_ids:
+        return []
+    rows = (
+        db.query(models.Activity.parcel_id, models.Activity.date, models.Activity.type)
+        .filter(models.Activity.parcel_id.in_(parcel_ids))
+        .all()
+    )
+    activities_df = pd.DataFrame(rows, columns=["parcel_id", "date", "type"])
+    statuses = evaluate_parcel_status(activities_df) if rows else {}
+    return [
+        parcel_status_document(parcel_id, statuses.get(parcel_id, ["Inactive"]))
+        for parcel_id in parcel_ids
+    ]
+
+
+def index_activities(
+    db: Session,
+    activities: Iterable[models.Activity],
+    extra_parcel_ids: Iterable[int] = (),
+) -> None:
+    """
+    Queue context updates for created or modified activities.
+
+    Args:
+        db: Database session
+        activities: Activities whose documents should be refreshed
+        extra_parcel_ids: Additional parcels whose status may have changed
+    """
+    if not context_index.is_built:
+        return
+    activities = list(activities)
+    documents = [
+        activity_document(
+            {
+                "id": activity.id,
+                "parcel_id": activity.parcel_id,
+                "type": activity.type,
+                "description": activity.description,
+                "date": activity.date,
+            }
+        )
+        for activity in activities
+    ]
+    parcel_ids = {activity.parcel_id for activity in activities} | set(extra_parcel_ids)
+    context_index.upsert(documents + _parcel_status_documents(db, parcel_ids))
+
+
+def unindex_activity(db: Session, activity_id: int, parcel_id: Optional[int]) -> None:
+    """Queue removal of a deleted activity and refresh its parcel status."""
+    if not context_index.is_built:
+        return
+    context_index.remove([f"activity:{activity_id}"])
+    context_index.upsert(_parcel_status_documents(db, [parcel_id]))
+
+
+def index_activity_details(details: Iterable[models.ActivityDetail]) -> None:
+    """Queue context updates for created activity details."""
+    if not context_index.is_built:
+        return
+    context_index.upsert(
+        detail_document(
+            {
+                "activity_id": detail.activity_id,
+                "name": detail.name,
+                "value": detail.value,
+                "unit": detail.unit,
+            },
+            detail.id,
+        )
+        for detail in details
+    )
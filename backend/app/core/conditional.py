@@ -0,0 +1,120 @@
+"""
+Conditional GET support: ``ETag`` and ``304 Not Modified``.
+
+``ConditionalGetMiddleware`` tags every successful GET response that has
+no ETag of its own with a strong ETag, a hash of its body. When the
+request's ``If-None-Match`` already names the tag, the body is replaced
+by an empty ``304``, so clients polling unchanged lists only pay for the
+round trip.
+
+This saves bandwidth, not server work: the route still runs and
+renders the full body on every revalidation, since the tag is its hash.
+No ``Last-Modified`` is sent, so clients revalidate with the ETag only.
+Streaming responses (sent in several chunks) are passed through
+untagged.
+"""
+
+import hashlib
+from typing import List, Set
+
+# Headers describing the body, not sent with a 304
+BODY_HEADERS = {b"content-length", b"content-type", b"content-encoding"}
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag of a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def parse_if_none_match(value: str) -> Set[str]:
+    """
+    Entity tags listed in an If-None-Match header.
+
+    Weak tags (``W/"..."``) are reduced to their opaque tag, as
+    If-None-Match uses the weak comparison.
+
+    Args:
+        value: Header value, e.g. '"a", W/"b"' or '*'
+
+    Returns:
+        Set of tags with their quotes, e.g. {'"a"', '"b"'}
+    """
+    tags = set()
+    for tag in value.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag:
+            tags.add(tag)
+    return tags
+
+
+class ConditionalGetMiddleware:
+    """ASGI middleware answering conditional GETs with 304 Not Modified."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # HEAD responses have no body to hash
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if_none_match = parse_if_none_match(
+            headers.get(b"if-none-match", b"").decode("latin-1")
+        )
+        start_message = None
+
+        async def send_with_etag(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] == 200:
+                    # Held until the body is known
+                    start_message = message
+                    return
+                await send(message)
+                return
+
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            if message.get("more_body", False):
+                await send(start)  # Streaming: not tagged
+                await send(message)
+                return
+
+            response_headers: List = list(start.get("headers", []))
+            etag = next(
+                (
+                    value.decode("latin-1")
+                    for name, value in response_headers
+                    if name.lower() == b"etag"
+                ),
+                None,
+            )
+            if etag is None:
+                # Routes may set their own ETag; the others get the body hash
+                etag = body_etag(message.get("body", b""))
+                response_headers.append((b"etag", etag.encode()))
+            if etag.removeprefix("W/") in if_none_match or "*" in if_none_match:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": [
+                            (name, value)
+                            for name, value in response_headers
+                            if name.lower() not in BODY_HEADERS
+                        ],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send({**start, "headers": response_headers})
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
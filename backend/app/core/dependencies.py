@@ -4,32 +4,23 @@ Provides centralized dependency management for the application.
 """
 
 import logging
-from typing import Generator
 
 from fastapi import Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.application.services.terrain_service import TerrainService
 from app.core.config import Settings, get_settings
-from app.db import SessionLocal
-from app.infrastructure.repositories.terrain_repository import TerrainRepository
+from app.db import get_async_db, get_db
+from app.infrastructure.repositories.terrain_repository import (
+    AsyncTerrainRepository,
+    TerrainRepository,
+)
 
 # Logger instance
 logger = logging.getLogger(__name__)
 
 
-def get_db() -> Generator[Session, None, None]:
-    """
-    Database session dependency.
-    Yields database session and ensures it's closed after use.
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 def get_current_settings() -> Settings:
     """Get current application settings."""
     return get_settings()
@@ -44,6 +35,11 @@ class RepositoryDependencies:
         """Get terrain repository instance."""
         return TerrainRepository(db)
 
+    @staticmethod
+    def get_async_terrain_repository(db: AsyncSession = Depends(get_async_db)):
+        """Get terrain repository instance on an async session."""
+        return AsyncTerrainRepository(db)
+
     @staticmethod
     def get_parcel_repository(db: Session = Depends(get_db)):
         """Get parcel repository instance."""
@@ -76,11 +72,10 @@ class ServiceDependencies:
 
     @staticmethod
     def get_terrain_service(
-        terrain_repo=Depends(RepositoryDependencies.get_terrain_repository),
-        settings: Settings = Depends(get_current_settings),
+        terrain_repo=Depends(RepositoryDependencies.get_async_terrain_repository),
     ) -> TerrainService:
-        """Get terrain service instance."""
-        return TerrainService(terrain_repo, settings)
+        """Get terrain service instance (it reads no settings)."""
+        return TerrainService(terrain_repo)
 
     @staticmethod
     def get_parcel_service(
@@ -11,9 +11,6 @@ from typing import Optional
 
 from app.core.config import get_settings
 
-# Get settings
-settings = get_settings()
-
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter that adds colors to log levels."""
@@ -43,6 +40,8 @@ def setup_logging(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
     """
+    settings = get_settings()
+
     # Use setting from config if not provided
     if log_level is None:
         log_level = settings.LOG_LEVEL
@@ -0,0 +1,202 @@
+"""
+Per-request SQL and latency instrumentation.
+
+``MetricsMiddleware`` gives every request a ``RequestStats`` (in a
+context variable, next to ``request_id_ctx_var``). SQLAlchemy cursor
+events, installed on all engines by ``instrument_sql``, add each
+statement's count, duration and row count to it. When the response
+starts, the totals are sent in a ``Server-Timing`` header and added to
+the in-memory per-route histograms served at ``/metrics``.
+"""
+
+import bisect
+import contextvars
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.logging import request_id_ctx_var
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (milliseconds) of the request latency histogram buckets
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+# Longest client X-Request-ID logged and echoed back
+MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestStats:
+    """SQL activity of the current request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+
+
+request_stats_ctx_var: contextvars.ContextVar[Optional[RequestStats]] = (
+    contextvars.ContextVar("request_stats", default=None)
+)
+
+
+# The start time is kept on the statement's execution context, which is
+# discarded with the statement, even when it fails (no after event then)
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if request_stats_ctx_var.get() is not None and context is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = request_stats_ctx_var.get()
+    start = getattr(context, "_metrics_start", None)
+    if stats is None or start is None:
+        return
+    stats.queries += 1
+    stats.db_seconds += time.perf_counter() - start
+    # Rows affected or returned, when the driver reports it (SQLite: -1)
+    stats.rows += max(cursor.rowcount, 0)
+
+
+def instrument_sql() -> None:
+    """Record the statements of every engine into the current request."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class RouteMetrics:
+    """Totals and latency histogram of one route."""
+
+    def __init__(self):
+        self.requests = 0
+        self.handler_seconds = 0.0
+        self.db_seconds = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.rows = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)  # Last one: +Inf
+
+    def observe(self, handler_seconds: float, stats: RequestStats) -> None:
+        self.requests += 1
+        self.handler_seconds += handler_seconds
+        self.db_seconds += stats.db_seconds
+        self.queries += stats.queries
+        self.max_queries = max(self.max_queries, stats.queries)
+        self.rows += stats.rows
+        self.buckets[
+            bisect.bisect_left(LATENCY_BUCKETS_MS, handler_seconds * 1000)
+        ] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        bounds: List[Any] = [*LATENCY_BUCKETS_MS, "+Inf"]
+        return {
+            "requests": self.requests,
+            "handler_ms_total": round(self.handler_seconds * 1000, 3),
+            "db_ms_total": round(self.db_seconds * 1000, 3),
+            "queries_total": self.queries,
+            "queries_max": self.max_queries,
+            "queries_mean": round(self.queries / self.requests, 2),
+            "rows_total": self.rows,
+            "latency_ms_buckets": {
+                str(bound): count for bound, count in zip(bounds, self.buckets)
+            },
+        }
+
+
+class MetricsRegistry:
+    """In-memory per-route metrics since startup (per worker process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, RouteMetrics] = {}
+
+    def observe(self, route: str, handler_seconds: float, stats: RequestStats):
+        with self._lock:
+            self._routes.setdefault(route, RouteMetrics()).observe(
+                handler_seconds, stats
+            )
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                route: metrics.to_dict()
+                for route, metrics in sorted(self._routes.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+route_metrics = MetricsRegistry()
+
+
+def server_timing(handler_seconds: float, stats: RequestStats) -> str:
+    """Server-Timing header value for a request."""
+    return (
+        f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries, '
+        f'{stats.rows} rows", app;dur={handler_seconds * 1000:.2f}'
+    )
+
+
+def request_id_from(headers: Dict[bytes, bytes]) -> str:
+    """
+    Request id sent by the client, or a new one.
+
+    Header bytes are decoded as latin-1, which never fails. Ids that are
+    not printable ASCII (they would break log lines or the echoed header)
+    are replaced; long ids are truncated to ``MAX_REQUEST_ID_LENGTH``.
+    """
+    value = headers.get(b"x-request-id", b"").decode("latin-1").strip()
+    value = value[:MAX_REQUEST_ID_LENGTH]
+    if value and value.isascii() and value.isprintable():
+        return value
+    return uuid.uuid4().hex
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the SQL activity and latency of requests."""
+
+    def __init__(self, app, registry: MetricsRegistry = route_metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = request_id_from(dict(scope["headers"]))
+        stats = RequestStats()
+        request_id_token = request_id_ctx_var.set(request_id)
+        stats_token = request_stats_ctx_var.set(stats)
+        start = time.perf_counter()
+
+        async def send_with_metrics(message):
+            if message["type"] == "http.response.start":
+                handler_seconds = time.perf_counter() - start
+                route = scope.get("route")
+                name = f"{scope['method']} {route.path if route else 'unmatched'}"
+                self.registry.observe(name, handler_seconds, stats)
+                logger.debug(
+                    f"{request_id} {name}: {stats.queries} queries, "
+                    f"{stats.db_seconds * 1000:.1f}ms in db, "
+                    f"{handler_seconds * 1000:.1f}ms total"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", server_timing(handler_seconds, stats).encode()),
+                    (b"x-request-id", request_id.encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            request_stats_ctx_var.reset(stats_token)
+            request_id_ctx_var.reset(request_id_token)
@@ -15,7 +15,7 @@ class LocationBase(BaseModel):
 
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = None
-    type: str = Field(default="point", regex="^(point|polygon|linestring)$")
+    type: str = Field(default="point", pattern="^(point|polygon|linestring)$")
     coordinates: Optional[Dict[str, Any]] = None
     metadata: Optional[Dict[str, Any]] = None
 
@@ -32,7 +32,7 @@ class ParcelBase(BaseModel):
 
     name: str = Field(..., min_length=1, max_length=100)
     current_use: Optional[str] = Field(None, max_length=50)
-    status: str = Field(default="active", regex="^(active|maintenance|fallow)$")
+    status: str = Field(default="active", pattern="^(active|maintenance|fallow)$")
 
     @validator("status")
     def validate_status(cls, v):
@@ -69,7 +69,7 @@ class LocationUpdate(BaseModel):
 
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
-    type: Optional[str] = Field(None, regex="^(point|polygon|linestring)$")
+    type: Optional[str] = Field(None, pattern="^(point|polygon|linestring)$")
     coordinates: Optional[Dict[str, Any]] = None
     metadata: Optional[Dict[str, Any]] = None
 
@@ -87,7 +87,7 @@ class ParcelUpdate(BaseModel):
 
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     current_use: Optional[str] = Field(None, max_length=50)
-    status: Optional[str] = Field(None, regex="^(active|maintenance|fallow)$")
+    status: Optional[str] = Field(None, pattern="^(active|maintenance|fallow)$")
     location_id: Optional[int] = None
 
 
@@ -101,7 +101,7 @@ class Location(LocationBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 
 class TerrainSummary(BaseModel):
@@ -113,7 +113,7 @@ class TerrainSummary(BaseModel):
     parcel_count: int = 0
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 
 class Terrain(TerrainBase):
@@ -128,7 +128,7 @@ class Terrain(TerrainBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 
 class ParcelSummary(BaseModel):
@@ -140,7 +140,7 @@ class ParcelSummary(BaseModel):
     status: str
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 
 class Parcel(ParcelBase):
@@ -157,7 +157,7 @@ class Parcel(ParcelBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 
 # Update forward references
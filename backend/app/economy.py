@@ -0,0 +1,231 @@
+"""
+Budget and expense aggregations for the economy routes.
+
+Expenses are read from ``transaction_monthly_rollup`` (see
+``app.transaction_rollup``), so a report touches one row per parcel,
+category and month instead of every transaction. Transactions are
+bucketed into months with ``month_start`` (``date_trunc``) and selected
+by half-open date ranges so the date indexes can be used.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Query
+from sqlalchemy import (
+    Date,
+    Integer,
+    String,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import FunctionElement
+
+from app import models
+
+# Relative budget deviation above which a category is flagged
+ALERT_THRESHOLD = 0.15
+
+
+class month_start(FunctionElement):
+    """First day of the month of a date column, as a date."""
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(month_start)
+def _month_start_default(element, compiler, **kw):
+    return "CAST(date_trunc('month', %s) AS DATE)" % compiler.process(
+        element.clauses, **kw
+    )
+
+
+@compiles(month_start, "sqlite")
+def _month_start_sqlite(element, compiler, **kw):
+    return "date(%s, 'start of month')" % compiler.process(element.clauses, **kw)
+
+
+class ParcelScope:
+    """Query parameters restricting a report to some parcels."""
+
+    def __init__(
+        self,
+        parcel_id: Optional[int] = Query(None, description="Filter by parcel"),
+        terrain_id: Optional[int] = Query(
+            None, description="Filter by the parcels of a terrain"
+        ),
+        parcel_ids: Optional[List[int]] = Query(
+            None, description="Filter by a list of parcels"
+        ),
+    ):
+        self.parcel_id = parcel_id
+        self.terrain_id = terrain_id
+        self.parcel_ids = parcel_ids
+
+    def criteria(self, column: Any) -> List[Any]:
+        """Criteria restricting a parcel_id ``column`` to the scope."""
+        criteria = []
+        if self.parcel_id:
+            criteria.append(column == self.parcel_id)
+        if self.parcel_ids:
+            criteria.append(column.in_(self.parcel_ids))
+        if self.terrain_id is not None:
+            criteria.append(
+                column.in_(
+                    select(models.Parcel.id).where(
+                        models.Parcel.terrain_id == self.terrain_id
+                    )
+                )
+            )
+        return criteria
+
+
+ALL_PARCELS = ParcelScope(parcel_id=None, terrain_id=None, parcel_ids=None)
+
+
+def expense_filters(year: int, scope: ParcelScope = ALL_PARCELS) -> List[Any]:
+    """Criteria selecting the expense rollup rows of a year."""
+    rollup = models.TransactionMonthlyRollup
+    return [
+        rollup.type == "expense",
+        rollup.year == year,
+        *scope.criteria(rollup.parcel_id),
+    ]
+
+
+def budget_filters(year: int, scope: ParcelScope = ALL_PARCELS) -> List[Any]:
+    """Criteria selecting the budgets of a year."""
+    return [models.Budget.year == year, *scope.criteria(models.Budget.parcel_id)]
+
+
+def has_alert(planned: float, actual: float) -> bool:
+    """Whether actual spending deviates too far from the plan."""
+    return abs(planned - actual) > ALERT_THRESHOLD * planned if planned > 0 else False
+
+
+def compare_categories(
+    budgeted: Dict[str, float], executed: Dict[str, float]
+) -> List[Dict[str, Any]]:
+    """
+    Merge budgeted and executed amounts per category.
+
+    Args:
+        budgeted: Budgeted amount by category
+        executed: Executed amount by category
+
+    Returns:
+        One comparison row per category found in either input
+    """
+    result = []
+    for category in set(budgeted).union(executed):
+        planned = budgeted.get(category, 0.0)
+        actual = executed.get(category, 0.0)
+        result.append(
+            {
+                "category": category,
+                "budgeted_amount": round(planned, 2),
+                "executed_amount": round(actual, 2),
+                "difference": round(planned - actual, 2),
+                "alert": has_alert(planned, actual),
+            }
+        )
+    return result
+
+
+def summarize_totals(budget_total: float, executed_total: float) -> Dict[str, Any]:
+    """Global budget vs execution totals."""
+    return {
+        "budget_total": round(budget_total, 2),
+        "executed_total": round(executed_total, 2),
+        "difference_total": round(budget_total - executed_total, 2),
+        "global_alert": has_alert(budget_total, executed_total),
+    }
+
+
+def monthly_series(rows: Iterable[Tuple[int, float]]) -> List[Dict[str, Any]]:
+    """Monthly expense rows as (month, amount) to API dictionaries."""
+    return [
+        {"month": month, "executed_amount": round(amount, 2)}
+        for month, amount in sorted(rows)
+    ]
+
+
+def expenses_by_category_query(year: int, scope: ParcelScope = ALL_PARCELS):
+    """Select expenses summed by category."""
+    rollup = models.TransactionMonthlyRollup
+    return (
+        select(rollup.category, func.sum(rollup.total_amount))
+        .where(*expense_filters(year, scope))
+        .group_by(rollup.category)
+    )
+
+
+def monthly_expenses_query(
+    year: int, category: Optional[str] = None, scope: ParcelScope = ALL_PARCELS
+):
+    """Select expenses summed by month."""
+    rollup = models.TransactionMonthlyRollup
+    query = select(rollup.month, func.sum(rollup.total_amount)).where(
+        *expense_filters(year, scope)
+    )
+    if category:
+        query = query.where(rollup.category == category)
+    return query.group_by(rollup.month)
+
+
+def economic_overview(
+    db: Session,
+    year: int,
+    scope: ParcelScope = ALL_PARCELS,
+    category: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Budget comparison, global summary and monthly series in one query.
+
+    The three aggregations are combined with UNION ALL, each branch tagged
+    with the kind of row it produces, so the database is queried once.
+
+    Args:
+        db: Database session
+        year: Analysis year
+        scope: Parcels to include
+        category: Optional category filter for the monthly series
+
+    Returns:
+        Dictionary with "comparison", "summary" and "monthly" entries
+    """
+    no_month = cast(null(), Integer)
+    budgets = (
+        select(
+            literal("budget").label("kind"),
+            models.Budget.category.label("category"),
+            no_month.label("month"),
+            func.sum(models.Budget.estimated_amount).label("amount"),
+        )
+        .where(*budget_filters(year, scope))
+        .group_by(models.Budget.category)
+    )
+    expenses = expenses_by_category_query(year, scope).subquery()
+    months = monthly_expenses_query(year, category, scope).subquery()
+    statement = union_all(
+        budgets,
+        select(literal("expense"), expenses.c[0], no_month, expenses.c[1]),
+        select(literal("month"), cast(null(), String), *months.c),
+    )
+    rows = db.execute(statement).all()
+
+    budgeted = {row.category: row.amount for row in rows if row.kind == "budget"}
+    executed = {row.category: row.amount for row in rows if row.kind == "expense"}
+    return {
+        "comparison": compare_categories(budgeted, executed),
+        "summary": summarize_totals(sum(budgeted.values()), sum(executed.values())),
+        "monthly": monthly_series(
+            (row.month, row.amount) for row in rows if row.kind == "month"
+        ),
+    }
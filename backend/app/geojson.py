@@ -0,0 +1,99 @@
+"""
+GeoJSON FeatureCollections of terrains and parcels for the map.
+
+Each kind of feature is read with one query joining the terrains or
+parcels to their locations: the database converts the geometries to
+GeoJSON (``as_geojson``) and the entity's columns become the feature
+properties, so the map needs no request per polygon. Feature ids are
+prefixed with their kind ("terrain-1", "parcel-1"), as terrains and parcels
+share a collection; the entity id is the "id" property.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.bootstrap import as_geojson
+
+# Columns inlined as the properties of each feature
+TERRAIN_PROPERTIES = ["id", "name", "description", "owner_id"]
+PARCEL_PROPERTIES = ["id", "name", "status", "current_use", "terrain_id"]
+
+
+def load_features(
+    db: Session, model: Any, names: Sequence[str], kind: str, *where: Any
+) -> List[Dict[str, Any]]:
+    """
+    Load the features of the terrains or parcels that have a location.
+
+    Args:
+        db: Database session
+        model: models.Terrain or models.Parcel
+        names: Columns to include in the properties
+        kind: "kind" property of the features
+        where: Filters on the model
+
+    Returns:
+        GeoJSON Feature dictionaries, ordered by id
+    """
+    location = models.Location
+    statement = (
+        select(
+            *(getattr(model, name) for name in names),
+            as_geojson(location.coordinates).label("geometry"),
+        )
+        .join(location, model.location_id == location.id)
+        .where(*where)
+        .order_by(model.id)
+    )
+    return [
+        {
+            "type": "Feature",
+            "id": f"{kind}-{row['id']}",
+            "geometry": json.loads(row["geometry"]) if row["geometry"] else None,
+            "properties": {"kind": kind, **{name: row[name] for name in names}},
+        }
+        for row in db.execute(statement).mappings()
+    ]
+
+
+def terrain_features(
+    db: Session, terrain_id: Optional[int] = None, include_parcels: bool = False
+) -> Dict[str, Any]:
+    """
+    Geometries of the terrains, optionally followed by those of their parcels.
+
+    Args:
+        db: Database session
+        terrain_id: Only this terrain (None: all terrains)
+        include_parcels: Add the features of the terrains' parcels
+
+    Returns:
+        Dictionary matching schemas.FeatureCollection
+    """
+    terrain = models.Terrain
+    where = [terrain.id == terrain_id] if terrain_id is not None else []
+    features = load_features(db, terrain, TERRAIN_PROPERTIES, "terrain", *where)
+    if include_parcels:
+        features += parcel_features(db, terrain_id)["features"]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def parcel_features(db: Session, terrain_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Geometries of the parcels.
+
+    Args:
+        db: Database session
+        terrain_id: Only the parcels of this terrain (None: all parcels)
+
+    Returns:
+        Dictionary matching schemas.FeatureCollection
+    """
+    parcel = models.Parcel
+    where = [parcel.terrain_id == terrain_id] if terrain_id is not None else []
+    features = load_features(db, parcel, PARCEL_PROPERTIES, "parcel", *where)
+    return {"type": "FeatureCollection", "features": features}
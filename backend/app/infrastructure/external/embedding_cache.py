@@ -0,0 +1,137 @@
+"""
+On-disk embedding cache.
+Stores document vectors in SQLite keyed by a hash of the text and model name,
+so unchanged chunks are never embedded twice.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import get_chat_settings
+from app.infrastructure.external.embeddings import (
+    EmbeddingService,
+    get_embedding_service,
+)
+
+EMBEDDING_CACHE_PATH = get_chat_settings().EMBEDDING_CACHE_PATH
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that only embeds texts missing from the cache."""
+
+    def __init__(self, embeddings: Embeddings, model_name: str, path: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            embeddings: Embedding model used for cache misses
+            model_name: Model name, part of every cache key
+            path: SQLite file path
+        """
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+        )
+        self._conn.commit()
+
+    def cache_key(self, text: str) -> str:
+        """Hash of the model name and text."""
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache hit/miss counters since the cache was opened."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Fetch cached vectors for the given keys."""
+        found = {}
+        for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+            batch = keys[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                batch,
+            )
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, reusing cached vectors for unchanged texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per text, in input order
+        """
+        keys = [self.cache_key(text) for text in texts]
+        with self._lock:
+            cached = self._lookup(list(set(keys)))
+
+            missing: Dict[str, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in cached:
+                    missing.setdefault(key, text)
+
+            if missing:
+                vectors = self.embeddings.embed_documents(list(missing.values()))
+                new_vectors = {
+                    key: np.asarray(vector, dtype=np.float32)
+                    for key, vector in zip(missing.keys(), vectors)
+                }
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in new_vectors.items()],
+                )
+                self._conn.commit()
+                # Return stored precision so hits and misses are identical
+                cached.update(
+                    (key, vector.tolist()) for key, vector in new_vectors.items()
+                )
+
+            self.misses += len(missing)
+            self.hits += len(texts) - len(missing)
+
+        return [list(cached[key]) for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query text (queries are not cached)."""
+        return self.embeddings.embed_query(text)
+
+
+_cached_embeddings: Optional[CachedEmbeddings] = None
+_cache_lock = threading.Lock()
+
+
+def get_cached_embeddings() -> CachedEmbeddings:
+    """Get the process-wide cached embeddings backed by the shared model."""
+    global _cached_embeddings
+    if _cached_embeddings is None:
+        with _cache_lock:
+            if _cached_embeddings is None:
+                service: EmbeddingService = get_embedding_service()
+                _cached_embeddings = CachedEmbeddings(
+                    service, service.model_name, EMBEDDING_CACHE_PATH
+                )
+    return _cached_embeddings
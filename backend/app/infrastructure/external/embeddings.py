@@ -0,0 +1,104 @@
+"""
+Embedding model service.
+Loads the sentence-transformers model once per worker and shares it.
+"""
+
+import logging
+import threading
+from typing import Callable, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import get_chat_settings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL_NAME = get_chat_settings().EMBEDDING_MODEL_NAME
+EMBEDDING_BATCH_SIZE = get_chat_settings().EMBEDDING_BATCH_SIZE
+
+
+def _huggingface_model(model_name: str) -> Embeddings:
+    """Create the HuggingFace embedding model."""
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    return HuggingFaceEmbeddings(model_name=model_name)
+
+
+class EmbeddingService(Embeddings):
+    """Lazily loaded, thread-safe wrapper around an embedding model."""
+
+    def __init__(
+        self,
+        model_name: str = EMBEDDING_MODEL_NAME,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        model_factory: Callable[[str], Embeddings] = _huggingface_model,
+    ):
+        """
+        Initialize the service without loading the model.
+
+        Args:
+            model_name: Name of the embedding model
+            batch_size: Maximum number of texts embedded per model call
+            model_factory: Callable creating the model from its name
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model_factory = model_factory
+        self._model: Optional[Embeddings] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model weights have been loaded."""
+        return self._model is not None
+
+    @property
+    def model(self) -> Embeddings:
+        """Underlying model, loaded on first access."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    logger.info(f"Loading embedding model {self.model_name}")
+                    self._model = self._model_factory(self.model_name)
+        return self._model
+
+    def warm_up(self) -> None:
+        """Load the model and run one embedding so the first request is fast."""
+        self.model.embed_query("warm up")
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in batches of at most ``batch_size``.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per text, in input order
+        """
+        vectors: List[List[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            vectors += self.model.embed_documents(
+                texts[start : start + self.batch_size]
+            )
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query text."""
+        return self.model.embed_query(text)
+
+
+_embedding_service: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get the process-wide embedding service instance."""
+    global _embedding_service
+    if _embedding_service is None:
+        with _service_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService()
+    return _embedding_service
@@ -1,15 +1,18 @@
 """
 Base repository pattern implementation.
-Provides common database operations for all repositories.
+Provides common database operations for all repositories, with a sync
+(Session) and an async (AsyncSession) variant.
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Optional, Type, TypeVar
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models import Base
+from app.pagination import keyset_paginate
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -33,15 +36,21 @@ class BaseRepository(Generic[ModelType]):
         return self.db.query(self.model).filter(self.model.id == id).first()
 
     def get_multi(
-        self, skip: int = 0, limit: int = 100, filters: Optional[Dict[str, Any]] = None
-    ) -> List[ModelType]:
+        self,
+        limit: int = 100,
+        after: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
-        Get multiple entities with pagination and optional filters.
+        Get a page of entities with keyset pagination and optional filters.
 
         Args:
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            after: Cursor (``next_cursor`` of the previous page)
             filters: Dictionary of field:value pairs to filter by
+
+        Returns:
+            Dictionary with "items" and "next_cursor" (None on the last page)
         """
         query = self.db.query(self.model)
 
@@ -50,7 +59,7 @@ class BaseRepository(Generic[ModelType]):
                 if hasattr(self.model, field):
                     query = query.filter(getattr(self.model, field) == value)
 
-        return query.offset(skip).limit(limit).all()
+        return keyset_paginate(query, self.model.id, limit, after)
 
     def create(self, obj_in: Dict[str, Any]) -> ModelType:
         """
@@ -135,3 +144,132 @@ class BaseRepository(Generic[ModelType]):
     def rollback(self):
         """Rollback current transaction."""
         self.db.rollback()
+
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """Base repository with common CRUD operations on an AsyncSession."""
+
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
+        """
+        Initialize repository.
+
+        Args:
+            model: SQLAlchemy model class
+            db: Async database session
+        """
+        self.model = model
+        self.db = db
+
+    def _filtered(self, statement: Any, filters: Optional[Dict[str, Any]]) -> Any:
+        """Apply field:value equality filters to a select statement."""
+        for field, value in (filters or {}).items():
+            if hasattr(self.model, field):
+                statement = statement.where(getattr(self.model, field) == value)
+        return statement
+
+    async def get(self, id: int) -> Optional[ModelType]:
+        """Get entity by ID."""
+        return await self.db.get(self.model, id)
+
+    async def get_multi(
+        self,
+        limit: int = 100,
+        after: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get a page of entities with keyset pagination and optional filters.
+
+        Args:
+            limit: Maximum number of records to return
+            after: Cursor (``next_cursor`` of the previous page)
+            filters: Dictionary of field:value pairs to filter by
+
+        Returns:
+            Dictionary with "items" and "next_cursor" (None on the last page)
+        """
+        statement = self._filtered(select(self.model), filters)
+        if after is not None:
+            statement = statement.where(self.model.id > after)
+        # One extra row tells whether another page exists
+        rows = (
+            await self.db.scalars(statement.order_by(self.model.id).limit(limit + 1))
+        ).all()
+        items = rows[:limit]
+        next_cursor = items[-1].id if len(rows) > limit else None
+        return {"items": items, "next_cursor": next_cursor}
+
+    async def create(self, obj_in: Dict[str, Any]) -> ModelType:
+        """
+        Create new entity.
+
+        Args:
+            obj_in: Dictionary with entity data
+        """
+        db_obj = self.model(**obj_in)
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def update(self, id: int, obj_in: Dict[str, Any]) -> Optional[ModelType]:
+        """
+        Update existing entity.
+
+        Args:
+            id: Entity ID
+            obj_in: Dictionary with updated data
+        """
+        db_obj = await self.get(id)
+        if not db_obj:
+            return None
+
+        for field, value in obj_in.items():
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, value)
+
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def delete(self, id: int) -> bool:
+        """
+        Delete entity by ID.
+
+        Returns:
+            True if deleted, False if not found
+        """
+        db_obj = await self.get(id)
+        if not db_obj:
+            return False
+
+        await self.db.delete(db_obj)
+        await self.db.commit()
+        return True
+
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count entities with optional filters.
+
+        Args:
+            filters: Dictionary of field:value pairs to filter by
+        """
+        statement = self._filtered(select(func.count(self.model.id)), filters)
+        return await self.db.scalar(statement)
+
+    async def exists(self, **kwargs) -> bool:
+        """Check if entity exists with given criteria."""
+        statement = self._filtered(select(self.model.id), kwargs).limit(1)
+        return await self.db.scalar(statement) is not None
+
+    async def commit(self):
+        """Commit current transaction."""
+        try:
+            await self.db.commit()
+        except SQLAlchemyError:
+            await self.db.rollback()
+            raise
+
+    async def rollback(self):
+        """Rollback current transaction."""
+        await self.db.rollback()
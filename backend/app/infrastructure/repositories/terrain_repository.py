@@ -3,13 +3,46 @@ Terrain repository implementation.
 Handles data access for terrain entities.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.infrastructure.repositories.base import BaseRepository
+from app.infrastructure.repositories.base import AsyncBaseRepository, BaseRepository
 from app.models import Parcel, Terrain
+from app.pagination import DEFAULT_PAGE_SIZE
+
+TerrainCount = Tuple[Terrain, int]  # Terrain and its number of parcels
+
+
+def terrains_with_parcel_counts():
+    """
+    Select terrains with their number of parcels in one statement.
+
+    Parcels are counted with an outer join and GROUP BY instead of loading
+    each terrain's parcel list.
+    """
+    return (
+        select(Terrain, func.count(Parcel.id).label("parcel_count"))
+        .outerjoin(Parcel, Parcel.terrain_id == Terrain.id)
+        .group_by(Terrain.id)
+    )
+
+
+def page_statement(statement: Any, limit: int, after: Optional[int] = None) -> Any:
+    """Restrict a terrain statement to one keyset page, plus one row."""
+    if after is not None:
+        statement = statement.where(Terrain.id > after)
+    # One extra row tells whether another page exists
+    return statement.order_by(Terrain.id).limit(limit + 1)
+
+
+def count_page(rows: List[Any], limit: int) -> Dict[str, Any]:
+    """Page of (terrain, parcel count) rows fetched with page_statement."""
+    items = [tuple(row) for row in rows[:limit]]
+    next_cursor = items[-1][0].id if len(rows) > limit else None
+    return {"items": items, "next_cursor": next_cursor}
 
 
 class TerrainRepository(BaseRepository[Terrain]):
@@ -115,6 +148,53 @@ class TerrainRepository(BaseRepository[Terrain]):
 
         return query.all()
 
+    def get_by_owner_with_parcel_counts(
+        self, owner_id: int, limit: int = DEFAULT_PAGE_SIZE, after: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a page of the terrains owned by a user with their parcel counts.
+
+        Args:
+            owner_id: ID of the owner
+            limit: Maximum number of records
+            after: Cursor (``next_cursor`` of the previous page)
+
+        Returns:
+            Dictionary with "items" ((terrain, parcel count) tuples) and
+            "next_cursor"
+        """
+        statement = terrains_with_parcel_counts().where(Terrain.owner_id == owner_id)
+        rows = self.db.execute(page_statement(statement, limit, after)).all()
+        return count_page(rows, limit)
+
+    def search_by_name_with_parcel_counts(
+        self,
+        name: str,
+        owner_id: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search terrains by name, with their parcel counts, one page at a time.
+
+        Args:
+            name: Name pattern to search
+            owner_id: Optional owner filter
+            limit: Maximum number of records
+            after: Cursor (``next_cursor`` of the previous page)
+
+        Returns:
+            Dictionary with "items" ((terrain, parcel count) tuples) and
+            "next_cursor"
+        """
+        statement = terrains_with_parcel_counts().where(Terrain.name.ilike(f"%{name}%"))
+
+        if owner_id:
+            statement = statement.where(Terrain.owner_id == owner_id)
+
+        rows = self.db.execute(page_statement(statement, limit, after)).all()
+        return count_page(rows, limit)
+
     def has_parcels(self, terrain_id: int) -> bool:
         """
         Check if terrain has any parcels.
@@ -150,3 +230,152 @@ class TerrainRepository(BaseRepository[Terrain]):
             )
 
         return self.delete(terrain_id)
+
+
+class AsyncTerrainRepository(AsyncBaseRepository[Terrain]):
+    """
+    Repository for terrain data access on an AsyncSession.
+
+    Async sessions cannot lazy-load, so terrains are returned with the
+    relationships the response schemas read (parcels, location) loaded.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Terrain, db)
+
+    def _with_relationships(self):
+        """Select terrains with parcels and location eagerly loaded."""
+        return (
+            select(Terrain)
+            .options(selectinload(Terrain.parcels), selectinload(Terrain.location))
+            .execution_options(populate_existing=True)
+        )
+
+    async def get_with_parcels(self, terrain_id: int) -> Optional[Terrain]:
+        """
+        Get terrain with its parcels loaded.
+
+        Args:
+            terrain_id: ID of the terrain
+
+        Returns:
+            Terrain with parcels or None
+        """
+        return await self.db.scalar(
+            self._with_relationships().where(Terrain.id == terrain_id)
+        )
+
+    async def get_with_stats(self, terrain_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get terrain with statistics.
+
+        Args:
+            terrain_id: ID of the terrain
+
+        Returns:
+            Dictionary with terrain data and stats
+        """
+        terrain = await self.get_with_parcels(terrain_id)
+        if not terrain:
+            return None
+
+        total_parcels, active_parcels = (
+            await self.db.execute(
+                select(
+                    func.count(Parcel.id),
+                    func.count(case((Parcel.status == "active", Parcel.id))),
+                ).where(Parcel.terrain_id == terrain_id)
+            )
+        ).one()
+
+        return {
+            "terrain": terrain,
+            "statistics": {
+                "total_parcels": total_parcels,
+                "active_parcels": active_parcels,
+                "inactive_parcels": total_parcels - active_parcels,
+            },
+        }
+
+    async def get_by_owner_with_parcel_counts(
+        self, owner_id: int, limit: int = DEFAULT_PAGE_SIZE, after: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a page of the terrains owned by a user with their parcel counts.
+
+        Args:
+            owner_id: ID of the owner
+            limit: Maximum number of records
+            after: Cursor (``next_cursor`` of the previous page)
+
+        Returns:
+            Dictionary with "items" ((terrain, parcel count) tuples) and
+            "next_cursor"
+        """
+        statement = terrains_with_parcel_counts().where(Terrain.owner_id == owner_id)
+        rows = (await self.db.execute(page_statement(statement, limit, after))).all()
+        return count_page(rows, limit)
+
+    async def search_by_name_with_parcel_counts(
+        self,
+        name: str,
+        owner_id: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search terrains by name, with their parcel counts, one page at a time.
+
+        Args:
+            name: Name pattern to search
+            owner_id: Optional owner filter
+            limit: Maximum number of records
+            after: Cursor (``next_cursor`` of the previous page)
+
+        Returns:
+            Dictionary with "items" ((terrain, parcel count) tuples) and
+            "next_cursor"
+        """
+        statement = terrains_with_parcel_counts().where(Terrain.name.ilike(f"%{name}%"))
+
+        if owner_id:
+            statement = statement.where(Terrain.owner_id == owner_id)
+
+        rows = (await self.db.execute(page_statement(statement, limit, after))).all()
+        return count_page(rows, limit)
+
+    async def has_parcels(self, terrain_id: int) -> bool:
+        """
+        Check if terrain has any parcels.
+
+        Args:
+            terrain_id: ID of the terrain
+
+        Returns:
+            True if terrain has parcels
+        """
+        return await self.db.scalar(
+            select(exists().where(Parcel.terrain_id == terrain_id))
+        )
+
+    async def delete_with_validation(self, terrain_id: int) -> bool:
+        """
+        Delete terrain only if it has no parcels.
+
+        Args:
+            terrain_id: ID of the terrain
+
+        Returns:
+            True if deleted
+
+        Raises:
+            InvalidOperationException: If terrain has parcels
+        """
+        from app.core.exceptions import InvalidOperationException
+
+        if await self.has_parcels(terrain_id):
+            raise InvalidOperationException(
+                "Cannot delete terrain with existing parcels. Delete parcels first."
+            )
+
+        return await self.delete(terrain_id)
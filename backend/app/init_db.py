@@ -1,10 +1,17 @@
+from pathlib import Path
+
 import psycopg2
+from alembic import command
+from alembic.config import Config
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
+from app.activity_summary import rebuild_parcel_summaries
 from app.db import DATABASE_URL, SessionLocal
 from app.models import Base
 from app.populate_db import create_terrains_and_parcels, create_users
+from app.transaction_rollup import rebuild_transaction_rollup
 
 DB_NAME = "agrovista"
 DB_USER = "usuario"
@@ -12,6 +19,8 @@ DB_PASSWORD = "password"
 DB_HOST = "localhost"
 DB_PORT = "5434"
 
+ALEMBIC_CONFIG = Path(__file__).resolve().parent.parent / "alembic.ini"
+
 
 def create_database() -> None:
     """Create the AgroVista database if it doesn't exist."""
@@ -54,14 +63,35 @@ def create_tables() -> None:
     engine = create_engine(DATABASE_URL)
     Base.metadata.drop_all(bind=engine)  # Optional: clean if already exists
     Base.metadata.create_all(bind=engine)
+    stamp_migrations(engine)
     print("Tables created successfully.")
 
 
+def alembic_config() -> Config:
+    """Alembic configuration for the backend migrations."""
+    return Config(str(ALEMBIC_CONFIG))
+
+
+def stamp_migrations(engine: Engine) -> None:
+    """
+    Mark a schema built by create_all as up to date with all migrations.
+
+    create_all already creates every table and index declared in the
+    models, so the migrations must not run again on a fresh database.
+    """
+    config = alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.stamp(config, "head")
+
+
 def populate_data() -> None:
     """Populate the database with initial data."""
     db: Session = SessionLocal()
     owners = create_users(db)
     create_terrains_and_parcels(db, owners)
+    rebuild_parcel_summaries(db)
+    rebuild_transaction_rollup(db)
     db.close()
     print("Initial data inserted.")
 
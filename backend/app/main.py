@@ -1,13 +1,22 @@
-from typing import Dict
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Dict
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.conditional import ConditionalGetMiddleware
+from app.core.metrics import MetricsMiddleware, instrument_sql, route_metrics
+from app.db import engine, pool_metrics
+from app.infrastructure.external.embeddings import get_embedding_service
 from app.routes import (
     activities,
+    bootstrap,
     chat,
     control,
     economy,
+    export,
     inventory,
     locations,
     parcels,
@@ -15,11 +24,28 @@ from app.routes import (
     terrains,
 )
 
+logger = logging.getLogger(__name__)
+
+TESTING = os.getenv("TESTING", "False").lower() == "true"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm shared resources before serving requests."""
+    if not TESTING:
+        try:
+            get_embedding_service().warm_up()
+        except Exception as e:
+            logger.warning(f"Embedding model warm-up failed: {e}")
+    yield
+
+
 # Create FastAPI application
 app = FastAPI(
     title="AgroVista API",
     description="Agricultural land management platform API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware for development (adjust allow_origins for production)
@@ -31,8 +57,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Cursor of legacy list endpoints
 )
 
+# ETag on GET responses, 304 Not Modified when If-None-Match matches it
+app.add_middleware(ConditionalGetMiddleware)
+
+# Per-request SQL count and latency: Server-Timing header and /metrics
+instrument_sql()
+app.add_middleware(MetricsMiddleware)
+
 # Include all route modules
 app.include_router(terrains.router)
 app.include_router(parcels.router)
@@ -43,6 +77,8 @@ app.include_router(economy.router)
 app.include_router(inventory.router)
 app.include_router(simulation.router)
 app.include_router(control.router)
+app.include_router(export.router)
+app.include_router(bootstrap.router)
 
 
 @app.get("/")
@@ -52,3 +88,15 @@ def read_root() -> Dict[str, str]:
         "message": "Welcome to AgroVista API. Use the endpoints to interact with agricultural data.",
         "docs": "Visit /docs for interactive API documentation",
     }
+
+
+@app.get("/health/pool")
+def database_pool() -> Dict[str, Any]:
+    """Database connection pool usage (connections in use, checkout waits)."""
+    return pool_metrics(engine)
+
+
+@app.get("/metrics")
+def metrics() -> Dict[str, Any]:
+    """Per-route request count, SQL activity and latency histogram."""
+    return route_metrics.snapshot()
@@ -4,14 +4,21 @@ from sqlalchemy import (
     JSON,
     Column,
     Date,
+    DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.sql.expression import FunctionElement
+
+from app.utils import generate_unique_id
 
 # Conditional imports for geo types
 TESTING = os.getenv("TESTING", "False").lower() == "true"
@@ -33,6 +40,29 @@ else:
 Base = declarative_base()
 
 
+class utc_timestamp(FunctionElement):
+    """
+    Current UTC time as a naive timestamp, read from the database clock.
+
+    Sync watermarks must come from one clock: the database's, not each
+    app server's.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utc_timestamp, "postgresql")
+def _utc_timestamp_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+@compiles(utc_timestamp, "sqlite")
+def _utc_timestamp_sqlite(element, compiler, **kw):
+    # Microseconds, in the format SQLAlchemy stores datetimes in
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
 class User(Base):
     """User model for authentication and authorization."""
 
@@ -58,6 +88,7 @@ class Terrain(Base):
     """Terrain model representing large land areas containing multiple parcels."""
 
     __tablename__ = "terrains"
+    __table_args__ = (Index("ix_terrains_owner_id", "owner_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)  # Terrain name
@@ -74,6 +105,7 @@ class Parcel(Base):
     """Parcel model representing individual land units for specific agricultural activities."""
 
     __tablename__ = "parcels"
+    __table_args__ = (Index("ix_parcels_terrain_id", "terrain_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)  # Parcel name
@@ -104,6 +136,12 @@ class Activity(Base):
     """Activity model for tracking agricultural operations performed on parcels."""
 
     __tablename__ = "activities"
+    __table_args__ = (
+        Index("ix_activities_parcel_id_date", "parcel_id", "date"),
+        Index("ix_activities_date", "date"),
+        Index("ix_activities_client_uuid", "client_uuid", unique=True),
+        Index("ix_activities_updated_at_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     type = Column(
@@ -113,6 +151,16 @@ class Activity(Base):
     description = Column(Text)  # Optional detailed description
     user_id = Column(Integer, ForeignKey("users.id"))  # User who performed the activity
     parcel_id = Column(Integer, ForeignKey("parcels.id"))  # Target parcel
+    client_uuid = Column(
+        String(36), default=generate_unique_id
+    )  # Idempotency key, generated by the recording device when offline
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=utc_timestamp(),
+        server_default=utc_timestamp(),
+        onupdate=utc_timestamp(),
+    )  # Last change (UTC, database clock), the watermark for device sync
 
     # Relationships
     user = relationship("User", back_populates="activities")
@@ -125,10 +173,60 @@ class Activity(Base):
     )
 
 
+class ActivityTombstone(Base):
+    """Deleted activity, reported to devices by the sync pull."""
+
+    __tablename__ = "activity_tombstones"
+    __table_args__ = (
+        Index("ix_activity_tombstones_deleted_at_id", "deleted_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    activity_id = Column(Integer, nullable=False)  # id of the deleted activity
+    client_uuid = Column(String(36))  # Its idempotency key, known to devices
+    deleted_at = Column(
+        DateTime,
+        nullable=False,
+        default=utc_timestamp(),
+        server_default=utc_timestamp(),
+    )  # Deletion time (UTC, database clock), the watermark for device sync
+
+
+@event.listens_for(Activity, "after_delete")
+def record_activity_tombstone(mapper, connection, target):
+    """Leave a tombstone in the transaction that deletes an activity."""
+    connection.execute(
+        ActivityTombstone.__table__.insert().values(
+            activity_id=target.id, client_uuid=target.client_uuid
+        )
+    )
+
+
+class ParcelActivitySummary(Base):
+    """Per-parcel activity aggregates, kept up to date by the activity routes."""
+
+    __tablename__ = "parcel_activity_summary"
+
+    parcel_id = Column(
+        Integer, ForeignKey("parcels.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_activity_date = Column(Date)  # Date of the most recent activity
+    last_harvest_date = Column(Date)  # Date of the most recent harvest
+    activity_count = Column(Integer, nullable=False, default=0)  # Total activities
+    type_counts = Column(JSON_TYPE, nullable=False, default=dict)  # {type: count}
+    daily_counts = Column(
+        JSON_TYPE, nullable=False, default=dict
+    )  # {"YYYY-MM-DD": count} over the trailing summary window
+
+    # Relationships
+    parcel = relationship("Parcel")
+
+
 class ActivityDetail(Base):
     """Activity detail model for storing specific measurements and data from activities."""
 
     __tablename__ = "activity_details"
+    __table_args__ = (Index("ix_activity_details_activity_id", "activity_id"),)
 
     id = Column(Integer, primary_key=True)
     activity_id = Column(Integer, ForeignKey("activities.id"))
@@ -166,6 +264,7 @@ class Inventory(Base):
     """Inventory model for tracking supplies and materials."""
 
     __tablename__ = "inventories"
+    __table_args__ = (Index("ix_inventories_parcel_id", "parcel_id"),)
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)  # Item name: "NPK fertilizer", "Pesticide 1"
@@ -184,6 +283,9 @@ class InventoryEvent(Base):
     """Inventory event model for tracking inventory movements (in/out)."""
 
     __tablename__ = "inventory_events"
+    __table_args__ = (
+        Index("ix_inventory_events_inventory_id_date", "inventory_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True)
     inventory_id = Column(Integer, ForeignKey("inventories.id"))
@@ -210,6 +312,10 @@ class Transaction(Base):
     """Transaction model for financial tracking (income and expenses)."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_type_date_parcel_id", "type", "date", "parcel_id"),
+        Index("ix_transactions_parcel_id_date", "parcel_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True)
     date = Column(Date, nullable=False)  # Transaction date
@@ -225,10 +331,46 @@ class Transaction(Base):
     )  # Related activity
 
 
+class TransactionMonthlyRollup(Base):
+    """
+    Monthly transaction totals, kept up to date by the economy routes.
+
+    Transactions without a parcel are rolled up in buckets whose
+    parcel_id is NULL, so unscoped totals match a SUM over the ledger.
+    """
+
+    __tablename__ = "transaction_monthly_rollup"
+    __table_args__ = (
+        Index(
+            "ux_transaction_monthly_rollup_bucket",
+            "parcel_id",
+            "year",
+            "month",
+            "category",
+            "type",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index("ix_transaction_monthly_rollup_year_type_month", "year", "type", "month"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    parcel_id = Column(
+        Integer, ForeignKey("parcels.id", ondelete="CASCADE"), nullable=True
+    )  # NULL for transactions without a parcel
+    year = Column(Integer, nullable=False)  # Transaction year
+    month = Column(Integer, nullable=False)  # Transaction month (1-12)
+    category = Column(String, nullable=False)  # Transaction category
+    type = Column(String, nullable=False)  # Type: "expense" or "income"
+    total_amount = Column(Float, nullable=False, default=0.0)  # Sum of amounts
+    transaction_count = Column(Integer, nullable=False, default=0)  # Transactions
+
+
 class Budget(Base):
     """Budget model for planning yearly expenses by category."""
 
     __tablename__ = "budgets"
+    __table_args__ = (Index("ix_budgets_year_parcel_id", "year", "parcel_id"),)
 
     id = Column(Integer, primary_key=True)
     year = Column(Integer, nullable=False)  # Budget year
@@ -295,6 +437,7 @@ class Indicator(Base):
     """Indicator model for storing KPIs and performance metrics."""
 
     __tablename__ = "indicators"
+    __table_args__ = (Index("ix_indicators_parcel_id_date", "parcel_id", "date"),)
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)  # Indicator name
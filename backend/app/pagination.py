@@ -0,0 +1,158 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are ordered by primary key and continue from the last id seen
+(``WHERE id > :after ORDER BY id LIMIT :limit``), so every page costs the
+same index range scan no matter how deep the client has paged.
+"""
+
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy.orm import Query as SQLQuery
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class PageParams:
+    """Query parameters selecting one page of a list."""
+
+    def __init__(
+        self,
+        limit: int = Query(
+            DEFAULT_PAGE_SIZE,
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="Maximum number of items to return",
+        ),
+        after: Optional[int] = Query(
+            None, description="Cursor: next_cursor of the previous page"
+        ),
+    ):
+        self.limit = limit
+        self.after = after
+
+
+class LegacyPageParams(PageParams):
+    """
+    Page parameters of the legacy (Spanish) list endpoints.
+
+    Those endpoints returned the whole list before pagination existed, so
+    ``limit`` is optional there: without it, every row is returned.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = Query(
+            None,
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="Maximum number of items to return (default: all)",
+        ),
+        after: Optional[int] = Query(
+            None, description="Cursor: X-Next-Cursor of the previous page"
+        ),
+    ):
+        super().__init__(limit, after)
+
+
+class DateRange:
+    """Query parameters filtering a list by an inclusive date range."""
+
+    def __init__(
+        self,
+        date_from: Optional[date] = Query(None, description="Earliest date"),
+        date_to: Optional[date] = Query(None, description="Latest date"),
+    ):
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(
+                status_code=400, detail="date_from must not be after date_to"
+            )
+        self.date_from = date_from
+        self.date_to = date_to
+
+    def apply(self, query: SQLQuery, column: Any) -> SQLQuery:
+        """Restrict a query to rows whose ``column`` falls in the range."""
+        if self.date_from is not None:
+            query = query.filter(column >= self.date_from)
+        if self.date_to is not None:
+            query = query.filter(column <= self.date_to)
+        return query
+
+
+def keyset_paginate(
+    query: SQLQuery, id_column: Any, limit: int, after: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Fetch one page of a query using keyset pagination.
+
+    Args:
+        query: Filtered query without ordering or limit
+        id_column: Unique, indexed column used as the cursor
+        limit: Maximum number of items
+        after: Cursor returned with the previous page
+
+    Returns:
+        Dictionary with "items" and "next_cursor" (None on the last page)
+    """
+    if after is not None:
+        query = query.filter(id_column > after)
+    # One extra row tells whether another page exists
+    rows = query.order_by(id_column).limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = getattr(items[-1], id_column.key) if len(rows) > limit else None
+    return {"items": items, "next_cursor": next_cursor}
+
+
+def paginate(query: SQLQuery, id_column: Any, page: PageParams) -> Dict[str, Any]:
+    """
+    Fetch the page selected by the request's page parameters.
+
+    Args:
+        query: Filtered query without ordering or limit
+        id_column: Unique, indexed column used as the cursor
+        page: Page parameters from the request
+
+    Returns:
+        Dictionary with "items" and "next_cursor"
+    """
+    return keyset_paginate(query, id_column, page.limit, page.after)
+
+
+def legacy_list(
+    response: Response,
+    page: LegacyPageParams,
+    fetch_page: Callable[[PageParams], Dict[str, Any]],
+) -> List[Any]:
+    """
+    Items for a legacy list endpoint, which returns a bare list.
+
+    Without ``limit`` every page is fetched, ``MAX_PAGE_SIZE`` rows per
+    keyset query, so old clients still get the full list. With ``limit``
+    one page is returned, and the cursor to the next one is sent in the
+    ``X-Next-Cursor`` header (absent on the last page).
+
+    Args:
+        response: Response of the request, to set the cursor header
+        page: Page parameters from the request
+        fetch_page: The paginated list route, called with PageParams
+
+    Returns:
+        Items of the page, or of the whole list
+    """
+    if page.limit is not None:
+        result = fetch_page(page)
+        if result["next_cursor"] is not None:
+            response.headers["X-Next-Cursor"] = str(result["next_cursor"])
+        return result["items"]
+
+    items: List[Any] = []
+    chunk = PageParams(MAX_PAGE_SIZE, page.after)
+    while True:
+        result = fetch_page(chunk)
+        items += result["items"]
+        if result["next_cursor"] is None:
+            return items
+        chunk = PageParams(MAX_PAGE_SIZE, result["next_cursor"])
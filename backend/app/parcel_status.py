@@ -0,0 +1,64 @@
+"""
+Parcel status computed inside the database.
+Applies the same rules as ``app.utils.evaluate_parcel_status`` to the
+per-parcel activity summary, so activity rows never have to be loaded.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app import models
+from app.activity_summary import recent_activity_count
+from app.utils import PRODUCTIVE_ACTIVITY_TYPES, parcel_statuses
+
+
+def summary_statuses(
+    summaries: Iterable[models.ParcelActivitySummary], today: Optional[date] = None
+) -> Dict[int, List[str]]:
+    """
+    Evaluate parcel statuses from activity summary rows.
+
+    Args:
+        summaries: Parcel activity summary rows
+        today: Reference date (defaults to the current date)
+
+    Returns:
+        Dictionary mapping parcel_id to list of status strings
+    """
+    today = today or date.today()
+    recent_since = today - timedelta(days=3)
+    statuses = {}
+    for summary in summaries:
+        last_date = summary.last_activity_date
+        statuses[summary.parcel_id] = parcel_statuses(
+            (today - last_date).days if last_date else None,
+            summary.last_harvest_date is not None
+            and summary.last_harvest_date >= recent_since,
+            recent_activity_count(summary, 3, today),
+            any(
+                activity_type in PRODUCTIVE_ACTIVITY_TYPES
+                for activity_type in summary.type_counts or {}
+            ),
+        )
+    return statuses
+
+
+def query_parcel_statuses(
+    db: Session, today: Optional[date] = None
+) -> Dict[int, List[str]]:
+    """
+    Evaluate the status of every parcel that has activities.
+
+    Args:
+        db: Database session
+        today: Reference date (defaults to the current date)
+
+    Returns:
+        Dictionary mapping parcel_id to list of status strings
+    """
+    summaries = db.query(models.ParcelActivitySummary).order_by(
+        models.ParcelActivitySummary.parcel_id
+    )
+    return summary_statuses(summaries, today)
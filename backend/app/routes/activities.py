@@ -1,18 +1,40 @@
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.activity_ingest import ingest_activities
+from app.activity_summary import refresh_parcel_summaries
+from app.activity_sync import pull_activities, push_activities
+from app.context_index import index_activities, index_activity_details, unindex_activity
 from app.db import get_db
+from app.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    DateRange,
+    LegacyPageParams,
+    PageParams,
+    legacy_list,
+    paginate,
+)
 
 router = APIRouter(prefix="/activities", tags=["Activities"])
 
 
-@router.get("/", response_model=List[schemas.ActivityOut])
-def get_activities(db: Session = Depends(get_db)) -> List[models.Activity]:
-    """Get all activities."""
-    return db.query(models.Activity).all()
+@router.get("/", response_model=schemas.Page[schemas.ActivityOut])
+def get_activities(
+    page: PageParams = Depends(),
+    date_range: DateRange = Depends(),
+    parcel_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """Get a page of activities, optionally filtered by date and parcel."""
+    query = date_range.apply(db.query(models.Activity), models.Activity.date)
+    if parcel_id is not None:
+        query = query.filter(models.Activity.parcel_id == parcel_id)
+    return paginate(query, models.Activity.id, page)
 
 
 @router.post("/", response_model=schemas.ActivityOut)
@@ -22,8 +44,10 @@ def register_activity(
     """Register a new activity."""
     new_activity = models.Activity(**activity.model_dump())
     db.add(new_activity)
+    refresh_parcel_summaries(db, [new_activity.parcel_id])
     db.commit()
     db.refresh(new_activity)
+    index_activities(db, [new_activity])
     return new_activity
 
 
@@ -51,11 +75,14 @@ def update_activity(
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
+    previous_parcel_id = activity.parcel_id
     for field, value in activity_data.dict(exclude_unset=True).items():
         setattr(activity, field, value)
 
+    refresh_parcel_summaries(db, [previous_parcel_id, activity.parcel_id])
     db.commit()
     db.refresh(activity)
+    index_activities(db, [activity], extra_parcel_ids=[previous_parcel_id])
     return activity
 
 
@@ -68,19 +95,23 @@ def delete_activity(activity_id: int, db: Session = Depends(get_db)):
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
+    parcel_id = activity.parcel_id
     db.delete(activity)
+    refresh_parcel_summaries(db, [parcel_id])
     db.commit()
+    unindex_activity(db, activity_id, parcel_id)
     return {"message": "Activity deleted successfully"}
 
 
-@router.get("/by-parcel/{parcel_id}", response_model=List[schemas.ActivityOut])
+@router.get("/by-parcel/{parcel_id}", response_model=schemas.Page[schemas.ActivityOut])
 def list_activities_by_parcel(
-    parcel_id: int, db: Session = Depends(get_db)
-) -> List[models.Activity]:
-    """Get all activities for a specific parcel."""
-    return (
-        db.query(models.Activity).filter(models.Activity.parcel_id == parcel_id).all()
-    )
+    parcel_id: int,
+    page: PageParams = Depends(),
+    date_range: DateRange = Depends(),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """Get a page of activities for a specific parcel."""
+    return get_activities(page, date_range, parcel_id, db)
 
 
 @router.post("/bulk/", response_model=List[schemas.ActivityOut])
@@ -90,9 +121,11 @@ def register_bulk_activities(
     """Register multiple activities at once."""
     new_activities = [models.Activity(**a.model_dump()) for a in activities]
     db.add_all(new_activities)
+    refresh_parcel_summaries(db, [a.parcel_id for a in new_activities])
     db.commit()
     for activity in new_activities:
         db.refresh(activity)
+    index_activities(db, new_activities)
     return new_activities
 
 
@@ -106,9 +139,63 @@ def register_bulk_activity_details(
     db.commit()
     for detail in new_details:
         db.refresh(detail)
+    index_activity_details(new_details)
     return new_details
 
 
+@router.post("/ingest/", response_model=schemas.IngestResult)
+def ingest_activity_batch(
+    rows: List[Any] = Body(..., description="Activities with nested details"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Ingest a large batch of activities with their details.
+
+    Rows that fail validation are reported by index in "errors"; the
+    others are stored with batched inserts in a single transaction.
+    """
+    return ingest_activities(db, rows)
+
+
+@router.post("/sync/", response_model=schemas.ActivitySyncResult)
+def push_activity_sync(
+    activities: List[schemas.ActivitySync], db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Upload activities recorded offline.
+
+    Activities whose client_uuid is already stored are skipped, so retried
+    uploads are safe. Only the newly created activities are returned.
+    """
+    return {"created": push_activities(db, activities)}
+
+
+@router.get("/sync/", response_model=schemas.ActivitySyncPage)
+def pull_activity_sync(
+    since: Optional[datetime] = Query(
+        None, description="Watermark returned by the previous pull"
+    ),
+    after_id: Optional[int] = Query(
+        None, description="after_id returned by the previous pull"
+    ),
+    deleted_since: Optional[datetime] = Query(
+        None, description="deleted_since returned by the previous pull"
+    ),
+    deleted_after_id: Optional[int] = Query(
+        None, description="deleted_after_id returned by the previous pull"
+    ),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Download activities created, changed or deleted since the last pull.
+
+    Changes of the last SYNC_SAFETY_LAG are held back until no open
+    transaction can still commit behind the returned watermarks.
+    """
+    return pull_activities(db, since, after_id, limit, deleted_since, deleted_after_id)
+
+
 # Legacy endpoints for backwards compatibility
 @router.post("/registrar/", response_model=schemas.ActivityOut)
 def registrar_actividad(
@@ -120,10 +207,18 @@ def registrar_actividad(
 
 @router.get("/por-parcela/{parcela_id}", response_model=List[schemas.ActivityOut])
 def listar_actividades_parcela(
-    parcela_id: int, db: Session = Depends(get_db)
+    parcela_id: int,
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    date_range: DateRange = Depends(),
+    db: Session = Depends(get_db),
 ) -> List[models.Activity]:
     """Legacy: List activities by parcel (Spanish name)."""
-    return list_activities_by_parcel(parcela_id, db)
+    return legacy_list(
+        response,
+        page,
+        lambda page: list_activities_by_parcel(parcela_id, page, date_range, db),
+    )
 
 
 @router.post("/masivo/", response_model=List[schemas.ActivityOut])
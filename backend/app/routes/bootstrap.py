@@ -0,0 +1,26 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.bootstrap import BOOTSTRAP_ACTIVITY_DAYS, load_snapshot
+from app.db import get_db
+
+router = APIRouter(prefix="/bootstrap", tags=["Bootstrap"])
+
+
+@router.get("/", response_model=schemas.BootstrapOut)
+def get_bootstrap(
+    activity_days: int = Query(
+        BOOTSTRAP_ACTIVITY_DAYS, ge=1, description="Days of activities to include"
+    ),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Get terrains, parcels, recent activities and their locations at once.
+
+    Each table is returned as column names plus rows, to keep the payload
+    small. Replaces one request per terrain and per parcel on start-up.
+    """
+    return load_snapshot(db, activity_days)
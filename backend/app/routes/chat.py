@@ -1,11 +1,11 @@
-from typing import Dict
+import json
+from typing import AsyncIterator, Dict
 
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
-from app.chat_logic import generate_context_and_respond
-from app.data_simulation import parcels, simulate_data
+from app.chat_logic import respond, stream_response
 from app.schemas import ChatRequest
-from app.utils import evaluate_parcel_status
 
 router = APIRouter()
 
@@ -21,12 +21,35 @@ def chat_endpoint(chat_input: ChatRequest) -> Dict[str, str]:
     Returns:
         Dictionary containing the AI response
     """
-    activities_df, details_df = simulate_data(parcels)
-    parcel_status = evaluate_parcel_status(activities_df)
-    response = generate_context_and_respond(
-        chat_input.prompt, activities_df, details_df, parcel_status
+    return {"response": respond(chat_input.prompt)}
+
+
+async def _server_sent_events(prompt: str) -> AsyncIterator[str]:
+    """Wrap response chunks as Server-Sent Events, ending with a ``done`` event."""
+    async for chunk in stream_response(prompt):
+        yield f"data: {json.dumps({'token': chunk})}\n\n"
+    yield "event: done\ndata: {}\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream_endpoint(chat_input: ChatRequest) -> StreamingResponse:
+    """
+    Streaming chat endpoint.
+
+    Tokens are sent as Server-Sent Events (``data: {"token": ...}``) as soon
+    as the model produces them, followed by a final ``done`` event.
+
+    Args:
+        chat_input: Request containing the user prompt
+
+    Returns:
+        Event stream of response tokens
+    """
+    return StreamingResponse(
+        _server_sent_events(chat_input.prompt),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return {"response": response}
 
 
 # Legacy response format for backwards compatibility
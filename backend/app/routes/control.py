@@ -1,10 +1,17 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.db import get_db
+from app.pagination import (
+    DateRange,
+    LegacyPageParams,
+    PageParams,
+    legacy_list,
+    paginate,
+)
 
 router = APIRouter(prefix="/control", tags=["Control and KPIs"])
 
@@ -35,10 +42,15 @@ def get_change(id: int, db: Session = Depends(get_db)) -> models.ChangeHistory:
     return db_change
 
 
-@router.get("/changes/", response_model=List[schemas.ChangeHistoryOut])
-def list_changes(db: Session = Depends(get_db)) -> List[models.ChangeHistory]:
-    """List all change records."""
-    return db.query(models.ChangeHistory).all()
+@router.get("/changes/", response_model=schemas.Page[schemas.ChangeHistoryOut])
+def list_changes(
+    page: PageParams = Depends(),
+    date_range: DateRange = Depends(),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """List a page of change records, optionally filtered by date."""
+    query = date_range.apply(db.query(models.ChangeHistory), models.ChangeHistory.date)
+    return paginate(query, models.ChangeHistory.id, page)
 
 
 # ---------- INDICATORS ----------
@@ -65,10 +77,18 @@ def get_indicator(id: int, db: Session = Depends(get_db)) -> models.Indicator:
     return db_indicator
 
 
-@router.get("/indicators/", response_model=List[schemas.IndicatorOut])
-def list_indicators(db: Session = Depends(get_db)) -> List[models.Indicator]:
-    """List all KPI indicators."""
-    return db.query(models.Indicator).all()
+@router.get("/indicators/", response_model=schemas.Page[schemas.IndicatorOut])
+def list_indicators(
+    page: PageParams = Depends(),
+    date_range: DateRange = Depends(),
+    parcel_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """List a page of KPI indicators, optionally filtered by date and parcel."""
+    query = date_range.apply(db.query(models.Indicator), models.Indicator.date)
+    if parcel_id is not None:
+        query = query.filter(models.Indicator.parcel_id == parcel_id)
+    return paginate(query, models.Indicator.id, page)
 
 
 # ----------------------
@@ -92,9 +112,14 @@ def obtener_cambio(id: int, db: Session = Depends(get_db)) -> models.ChangeHisto
 
 
 @router.get("/cambios/", response_model=List[schemas.ChangeHistoryOut])
-def listar_cambios(db: Session = Depends(get_db)) -> List[models.ChangeHistory]:
+def listar_cambios(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    date_range: DateRange = Depends(),
+    db: Session = Depends(get_db),
+) -> List[models.ChangeHistory]:
     """Legacy: List changes (Spanish name)."""
-    return list_changes(db)
+    return legacy_list(response, page, lambda page: list_changes(page, date_range, db))
 
 
 # Indicator legacy endpoints
@@ -113,6 +138,14 @@ def obtener_indicador(id: int, db: Session = Depends(get_db)) -> models.Indicato
 
 
 @router.get("/indicadores/", response_model=List[schemas.IndicatorOut])
-def listar_indicadores(db: Session = Depends(get_db)) -> List[models.Indicator]:
+def listar_indicadores(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    date_range: DateRange = Depends(),
+    parcela_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> List[models.Indicator]:
     """Legacy: List indicators (Spanish name)."""
-    return list_indicators(db)
+    return legacy_list(
+        response, page, lambda page: list_indicators(page, date_range, parcela_id, db)
+    )
@@ -1,11 +1,20 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app import models, schemas
+from app import economy, models, schemas
+from app.context_documents import index_transaction
 from app.db import get_db
+from app.pagination import (
+    DateRange,
+    LegacyPageParams,
+    PageParams,
+    legacy_list,
+    paginate,
+)
+from app.transaction_rollup import refresh_transaction_rollup
 
 router = APIRouter(prefix="/economy", tags=["Economy"])
 
@@ -20,8 +29,10 @@ def create_transaction(
     """Create a new financial transaction."""
     db_transaction = models.Transaction(**transaction.model_dump())
     db.add(db_transaction)
+    refresh_transaction_rollup(db, [db_transaction])
     db.commit()
     db.refresh(db_transaction)
+    index_transaction(db_transaction)
     return db_transaction
 
 
@@ -36,10 +47,18 @@ def get_transaction(id: int, db: Session = Depends(get_db)) -> models.Transactio
     return db_transaction
 
 
-@router.get("/transactions/", response_model=List[schemas.TransactionOut])
-def list_transactions(db: Session = Depends(get_db)) -> List[models.Transaction]:
-    """List all transactions."""
-    return db.query(models.Transaction).all()
+@router.get("/transactions/", response_model=schemas.Page[schemas.TransactionOut])
+def list_transactions(
+    page: PageParams = Depends(),
+    date_range: DateRange = Depends(),
+    parcel_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """List a page of transactions, optionally filtered by date and parcel."""
+    query = date_range.apply(db.query(models.Transaction), models.Transaction.date)
+    if parcel_id is not None:
+        query = query.filter(models.Transaction.parcel_id == parcel_id)
+    return paginate(query, models.Transaction.id, page)
 
 
 # ----- BUDGETS -----
@@ -66,139 +85,89 @@ def get_budget(id: int, db: Session = Depends(get_db)) -> models.Budget:
     return db_budget
 
 
-@router.get("/budgets/", response_model=List[schemas.BudgetOut])
-def list_budgets(db: Session = Depends(get_db)) -> List[models.Budget]:
-    """List all budgets."""
-    return db.query(models.Budget).all()
+@router.get("/budgets/", response_model=schemas.Page[schemas.BudgetOut])
+def list_budgets(
+    page: PageParams = Depends(),
+    year: Optional[int] = Query(None, description="Filter by budget year"),
+    parcel_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """List a page of budgets, optionally filtered by year and parcel."""
+    query = db.query(models.Budget)
+    if year is not None:
+        query = query.filter(models.Budget.year == year)
+    if parcel_id is not None:
+        query = query.filter(models.Budget.parcel_id == parcel_id)
+    return paginate(query, models.Budget.id, page)
 
 
 @router.get("/comparison/")
 def budget_vs_actual_comparison(
     year: int = Query(..., description="Analysis year"),
-    parcel_id: int = Query(None, description="Filter by parcel"),
+    scope: economy.ParcelScope = Depends(),
     db: Session = Depends(get_db),
 ) -> List[Dict[str, Any]]:
-    """Compare budgeted vs actual expenses by category."""
-    # BUDGET grouped by category
-    budget_query = db.query(
-        models.Budget.category,
-        func.sum(models.Budget.estimated_amount).label("budgeted_amount"),
-    ).filter(models.Budget.year == year)
-
-    if parcel_id:
-        budget_query = budget_query.filter(models.Budget.parcel_id == parcel_id)
-
-    budget_data = {
-        row.category: row.budgeted_amount
-        for row in budget_query.group_by(models.Budget.category).all()
-    }
-
-    # TRANSACTIONS grouped by category
-    transaction_query = db.query(
-        models.Transaction.category,
-        func.sum(models.Transaction.amount).label("executed_amount"),
-    ).filter(
-        func.extract("year", models.Transaction.date) == year,
-        models.Transaction.type == "expense",
+    """
+    Compare budgeted vs actual expenses by category.
+
+    Amounts are summed over every parcel in scope: one parcel, a list of
+    parcels or all parcels of a terrain.
+    """
+    budget_rows = (
+        db.query(models.Budget.category, func.sum(models.Budget.estimated_amount))
+        .filter(*economy.budget_filters(year, scope))
+        .group_by(models.Budget.category)
     )
-
-    if parcel_id:
-        transaction_query = transaction_query.filter(
-            models.Transaction.parcel_id == parcel_id
-        )
-
-    transaction_data = {
-        row.category: row.executed_amount
-        for row in transaction_query.group_by(models.Transaction.category).all()
-    }
-
-    # Merge results
-    categories = set(budget_data.keys()).union(transaction_data.keys())
-    result = []
-    for category in categories:
-        planned = budget_data.get(category, 0.0)
-        actual = transaction_data.get(category, 0.0)
-        difference = planned - actual
-        alert = abs(difference) > (0.15 * planned) if planned > 0 else False
-
-        result.append(
-            {
-                "category": category,
-                "budgeted_amount": round(planned, 2),
-                "executed_amount": round(actual, 2),
-                "difference": round(difference, 2),
-                "alert": alert,
-            }
-        )
-
-    return result
+    expense_rows = db.execute(economy.expenses_by_category_query(year, scope))
+    return economy.compare_categories(dict(budget_rows.all()), dict(expense_rows.all()))
 
 
 @router.get("/global-summary/")
 def global_economic_summary(
     year: int = Query(..., description="Analysis year"),
-    parcel_id: int = Query(None, description="Filter by parcel"),
+    scope: economy.ParcelScope = Depends(),
     db: Session = Depends(get_db),
 ) -> Dict[str, Any]:
     """Get global economic summary with totals and alerts."""
-    budget_query = db.query(func.sum(models.Budget.estimated_amount)).filter(
-        models.Budget.year == year
+    budget_total = (
+        db.query(func.sum(models.Budget.estimated_amount))
+        .filter(*economy.budget_filters(year, scope))
+        .scalar()
     )
-    transaction_query = db.query(func.sum(models.Transaction.amount)).filter(
-        func.extract("year", models.Transaction.date) == year,
-        models.Transaction.type == "expense",
+    executed_total = (
+        db.query(func.sum(models.TransactionMonthlyRollup.total_amount))
+        .filter(*economy.expense_filters(year, scope))
+        .scalar()
     )
-
-    if parcel_id:
-        budget_query = budget_query.filter(models.Budget.parcel_id == parcel_id)
-        transaction_query = transaction_query.filter(
-            models.Transaction.parcel_id == parcel_id
-        )
-
-    budget_total = budget_query.scalar() or 0.0
-    executed_total = transaction_query.scalar() or 0.0
-    difference = budget_total - executed_total
-    global_alert = (
-        abs(difference) > (0.15 * budget_total) if budget_total > 0 else False
-    )
-
-    return {
-        "budget_total": round(budget_total, 2),
-        "executed_total": round(executed_total, 2),
-        "difference_total": round(difference, 2),
-        "global_alert": global_alert,
-    }
+    return economy.summarize_totals(budget_total or 0.0, executed_total or 0.0)
 
 
 @router.get("/monthly-comparison/")
 def monthly_comparison(
     year: int = Query(...),
     category: str = Query(None),
-    parcel_id: int = Query(None),
+    scope: economy.ParcelScope = Depends(),
     db: Session = Depends(get_db),
 ) -> List[Dict[str, Any]]:
     """Get monthly expense comparison."""
-    query = db.query(
-        func.extract("month", models.Transaction.date).label("month"),
-        func.sum(models.Transaction.amount).label("executed_amount"),
-    ).filter(
-        func.extract("year", models.Transaction.date) == year,
-        models.Transaction.type == "expense",
-    )
+    query = economy.monthly_expenses_query(year, category, scope)
+    return economy.monthly_series(db.execute(query).all())
 
-    if category:
-        query = query.filter(models.Transaction.category == category)
-    if parcel_id:
-        query = query.filter(models.Transaction.parcel_id == parcel_id)
 
-    query = query.group_by(func.extract("month", models.Transaction.date)).order_by(
-        "month"
-    )
+@router.get("/overview/")
+def economic_overview(
+    year: int = Query(..., description="Analysis year"),
+    scope: economy.ParcelScope = Depends(),
+    category: str = Query(None, description="Category for the monthly series"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Get the comparison, global summary and monthly series together.
 
-    return [
-        {"month": int(row.month), "executed_amount": round(row.executed_amount, 2)}
-        for row in query.all()
-    ]
+    Same data as /comparison/, /global-summary/ and /monthly-comparison/,
+    computed in a single database query.
+    """
+    return economy.economic_overview(db, year, scope, category)
 
 
 # ----------------------
@@ -222,9 +191,17 @@ def obtener_transaccion(id: int, db: Session = Depends(get_db)) -> models.Transa
 
 
 @router.get("/transacciones/", response_model=List[schemas.TransactionOut])
-def listar_transacciones(db: Session = Depends(get_db)) -> List[models.Transaction]:
+def listar_transacciones(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    date_range: DateRange = Depends(),
+    parcela_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> List[models.Transaction]:
     """Legacy: List transactions (Spanish name)."""
-    return list_transactions(db)
+    return legacy_list(
+        response, page, lambda page: list_transactions(page, date_range, parcela_id, db)
+    )
 
 
 # Budget legacy endpoints
@@ -243,12 +220,25 @@ def obtener_presupuesto(id: int, db: Session = Depends(get_db)) -> models.Budget
 
 
 @router.get("/presupuestos/", response_model=List[schemas.BudgetOut])
-def listar_presupuestos(db: Session = Depends(get_db)) -> List[models.Budget]:
+def listar_presupuestos(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    anio: Optional[int] = Query(None, description="Filter by budget year"),
+    parcela_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> List[models.Budget]:
     """Legacy: List budgets (Spanish name)."""
-    return list_budgets(db)
+    return legacy_list(
+        response, page, lambda page: list_budgets(page, anio, parcela_id, db)
+    )
 
 
 # Analysis legacy endpoints
+def parcel_scope(parcel_id: Optional[int]) -> economy.ParcelScope:
+    """Scope of the legacy analysis endpoints, which filter by one parcel."""
+    return economy.ParcelScope(parcel_id=parcel_id, terrain_id=None, parcel_ids=None)
+
+
 @router.get("/comparativo/")
 def comparativo_presupuesto_vs_real(
     anio: int = Query(..., description="Analysis year"),
@@ -256,7 +246,7 @@ def comparativo_presupuesto_vs_real(
     db: Session = Depends(get_db),
 ) -> List[Dict[str, Any]]:
     """Legacy: Budget vs actual comparison (Spanish name)."""
-    return budget_vs_actual_comparison(anio, parcela_id, db)
+    return budget_vs_actual_comparison(anio, parcel_scope(parcela_id), db)
 
 
 @router.get("/resumen-global/")
@@ -266,7 +256,7 @@ def resumen_economico_global(
     db: Session = Depends(get_db),
 ) -> Dict[str, Any]:
     """Legacy: Global economic summary (Spanish name)."""
-    return global_economic_summary(anio, parcela_id, db)
+    return global_economic_summary(anio, parcel_scope(parcela_id), db)
 
 
 @router.get("/comparativo-mensual/")
@@ -277,4 +267,4 @@ def comparativo_mensual(
     db: Session = Depends(get_db),
 ) -> List[Dict[str, Any]]:
     """Legacy: Monthly comparison (Spanish name)."""
-    return monthly_comparison(anio, categoria, parcela_id, db)
+    return monthly_comparison(anio, categoria, parcel_scope(parcela_id), db)
@@ -0,0 +1,158 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import get_batch_settings
+from app.db import get_db
+from app.pagination import DateRange
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+# Rows fetched per server-side cursor round trip and written per chunk
+EXPORT_BATCH_SIZE = get_batch_settings().EXPORT_BATCH_SIZE
+
+
+class ExportTable(str, Enum):
+    """Tables available for export."""
+
+    activities = "activities"
+    activity_details = "activity_details"
+    transactions = "transactions"
+    inventory_events = "inventory_events"
+
+
+class ExportFormat(str, Enum):
+    """Export file formats."""
+
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+EXPORT_MODELS = {
+    ExportTable.activities: models.Activity,
+    ExportTable.activity_details: models.ActivityDetail,
+    ExportTable.transactions: models.Transaction,
+    ExportTable.inventory_events: models.InventoryEvent,
+}
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+def stream_rows(
+    db: Session, table: ExportTable, date_range: DateRange
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream table rows as dictionaries using a server-side cursor.
+
+    Args:
+        db: Database session
+        table: Table to export
+        date_range: Date filter, applied when the table has a date column
+
+    Yields:
+        One dictionary per row, in id order
+    """
+    model = EXPORT_MODELS[table]
+    query = db.query(*model.__table__.columns)
+    if "date" in model.__table__.columns:
+        query = date_range.apply(query, model.date)
+    query = query.order_by(model.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    for row in query:
+        yield row._asdict()
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize dates and other non-JSON values."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _batched(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group rows into lists of at most ``size`` items."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def encode_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode rows as newline-delimited JSON, one chunk per batch."""
+    for batch in _batched(rows, EXPORT_BATCH_SIZE):
+        lines = [json.dumps(row, default=_json_default) for row in batch]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def encode_csv(rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[bytes]:
+    """Encode rows as CSV with a header line, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    for batch in _batched(rows, EXPORT_BATCH_SIZE):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream into a gzip stream on the fly."""
+    compressor = zlib.compressobj(wbits=31)  # 31: gzip header and trailer
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+@router.get("/{table}")
+def export_table(
+    table: ExportTable,
+    format: ExportFormat = Query(ExportFormat.ndjson, description="File format"),
+    gzip: bool = Query(False, description="Compress the file with gzip"),
+    date_range: DateRange = Depends(),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream a full table export as NDJSON or CSV.
+
+    Rows are read with a server-side cursor and written in batches, so
+    memory use does not grow with the size of the table.
+    """
+    rows = stream_rows(db, table, date_range)
+    if format == ExportFormat.csv:
+        columns = [column.name for column in EXPORT_MODELS[table].__table__.columns]
+        chunks = encode_csv(rows, columns)
+    else:
+        chunks = encode_ndjson(rows)
+
+    filename = f"{table.value}.{format.value}"
+    media_type = MEDIA_TYPES[format]
+    if gzip:
+        chunks = gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,10 +1,18 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.context_documents import index_inventory
 from app.db import get_db
+from app.pagination import (
+    DateRange,
+    LegacyPageParams,
+    PageParams,
+    legacy_list,
+    paginate,
+)
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
@@ -21,6 +29,7 @@ def create_inventory(
     db.add(db_inventory)
     db.commit()
     db.refresh(db_inventory)
+    index_inventory(db_inventory)
     return db_inventory
 
 
@@ -33,10 +42,17 @@ def get_inventory(id: int, db: Session = Depends(get_db)) -> models.Inventory:
     return db_inventory
 
 
-@router.get("/", response_model=List[schemas.InventoryOut])
-def list_inventories(db: Session = Depends(get_db)) -> List[models.Inventory]:
-    """List all inventory items."""
-    return db.query(models.Inventory).all()
+@router.get("/", response_model=schemas.Page[schemas.InventoryOut])
+def list_inventories(
+    page: PageParams = Depends(),
+    parcel_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """List a page of inventory items, optionally filtered by parcel."""
+    query = db.query(models.Inventory)
+    if parcel_id is not None:
+        query = query.filter(models.Inventory.parcel_id == parcel_id)
+    return paginate(query, models.Inventory.id, page)
 
 
 # ----- INVENTORY EVENTS -----
@@ -70,6 +86,7 @@ def create_inventory_event(
 
     db.commit()
     db.refresh(db_event)
+    index_inventory(inventory)
     return db_event
 
 
@@ -86,10 +103,25 @@ def get_inventory_event(
     return db_event
 
 
-@router.get("/events/", response_model=List[schemas.InventoryEventOut])
-def list_inventory_events(db: Session = Depends(get_db)) -> List[models.InventoryEvent]:
-    """List all inventory events."""
-    return db.query(models.InventoryEvent).all()
+@router.get("/events/", response_model=schemas.Page[schemas.InventoryEventOut])
+def list_inventory_events(
+    page: PageParams = Depends(),
+    date_range: DateRange = Depends(),
+    inventory_id: Optional[int] = Query(None, description="Filter by item"),
+    parcel_id: Optional[int] = Query(None, description="Filter by item parcel"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """List a page of inventory events, optionally filtered by date and item."""
+    query = date_range.apply(
+        db.query(models.InventoryEvent), models.InventoryEvent.date
+    )
+    if inventory_id is not None:
+        query = query.filter(models.InventoryEvent.inventory_id == inventory_id)
+    if parcel_id is not None:
+        query = query.join(models.Inventory).filter(
+            models.Inventory.parcel_id == parcel_id
+        )
+    return paginate(query, models.InventoryEvent.id, page)
 
 
 # ----------------------
@@ -113,9 +145,16 @@ def obtener_inventario(id: int, db: Session = Depends(get_db)) -> models.Invento
 
 
 @router.get("/inventarios/", response_model=List[schemas.InventoryOut])
-def listar_inventarios(db: Session = Depends(get_db)) -> List[models.Inventory]:
+def listar_inventarios(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    parcela_id: Optional[int] = Query(None, description="Filter by parcel"),
+    db: Session = Depends(get_db),
+) -> List[models.Inventory]:
     """Legacy: List inventories (Spanish name)."""
-    return list_inventories(db)
+    return legacy_list(
+        response, page, lambda page: list_inventories(page, parcela_id, db)
+    )
 
 
 # Event legacy endpoints
@@ -134,6 +173,19 @@ def obtener_evento(id: int, db: Session = Depends(get_db)) -> models.InventoryEv
 
 
 @router.get("/eventos/", response_model=List[schemas.InventoryEventOut])
-def listar_eventos(db: Session = Depends(get_db)) -> List[models.InventoryEvent]:
+def listar_eventos(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    date_range: DateRange = Depends(),
+    inventario_id: Optional[int] = Query(None, description="Filter by item"),
+    parcela_id: Optional[int] = Query(None, description="Filter by item parcel"),
+    db: Session = Depends(get_db),
+) -> List[models.InventoryEvent]:
     """Legacy: List inventory events (Spanish name)."""
-    return list_inventory_events(db)
+    return legacy_list(
+        response,
+        page,
+        lambda page: list_inventory_events(
+            page, date_range, inventario_id, parcela_id, db
+        ),
+    )
@@ -1,29 +1,79 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models, schemas
+from app.activity_summary import SUMMARY_WINDOW_DAYS, recent_activity_count
 from app.db import get_db
+from app.geojson import parcel_features
+from app.pagination import LegacyPageParams, PageParams, legacy_list, paginate
+from app.parcel_status import query_parcel_statuses
+from app.utils import summarize_parcel_status
 
 router = APIRouter(prefix="/parcels", tags=["Parcels"])
 
 
-@router.get("/", response_model=List[schemas.ParcelOut])
-def list_parcels(db: Session = Depends(get_db)) -> List[models.Parcel]:
-    """Get all parcels."""
-    return db.query(models.Parcel).all()
+@router.get("/", response_model=schemas.Page[schemas.ParcelOut])
+def list_parcels(
+    page: PageParams = Depends(), db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """Get a page of parcels."""
+    return paginate(db.query(models.Parcel), models.Parcel.id, page)
 
 
-@router.get("/by-terrain/{terrain_id}", response_model=List[schemas.ParcelOut])
+@router.get("/by-terrain/{terrain_id}", response_model=schemas.Page[schemas.ParcelOut])
 def list_parcels_by_terrain(
-    terrain_id: int, db: Session = Depends(get_db)
-) -> List[models.Parcel]:
-    """Get parcels by terrain ID."""
-    parcels = (
-        db.query(models.Parcel).filter(models.Parcel.terrain_id == terrain_id).all()
+    terrain_id: int, page: PageParams = Depends(), db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """Get a page of parcels by terrain ID."""
+    query = db.query(models.Parcel).filter(models.Parcel.terrain_id == terrain_id)
+    return paginate(query, models.Parcel.id, page)
+
+
+@router.get("/geojson", response_model=schemas.FeatureCollection)
+def get_parcels_geojson(
+    terrain_id: Optional[int] = Query(None, description="Only this terrain's parcels"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Get parcel geometries as a GeoJSON FeatureCollection.
+
+    Features carry the parcel's name, status, current use and terrain as
+    properties. Parcels without a location are left out.
+    """
+    return parcel_features(db, terrain_id)
+
+
+@router.get("/status", response_model=schemas.ParcelStatusOut)
+def get_parcel_statuses(db: Session = Depends(get_db)) -> schemas.ParcelStatusOut:
+    """Get the status of every parcel with activities, plus a summary."""
+    statuses = query_parcel_statuses(db)
+    return schemas.ParcelStatusOut(
+        statuses=statuses, summary=summarize_parcel_status(statuses)
+    )
+
+
+@router.get("/activity-summary", response_model=List[schemas.ParcelActivitySummaryOut])
+def list_parcel_activity_summaries(
+    days: int = Query(7, ge=1, le=SUMMARY_WINDOW_DAYS),
+    db: Session = Depends(get_db),
+) -> List[schemas.ParcelActivitySummaryOut]:
+    """Get the activity summary of every parcel with activities."""
+    summaries = db.query(models.ParcelActivitySummary).order_by(
+        models.ParcelActivitySummary.parcel_id
     )
-    return parcels
+    return [
+        schemas.ParcelActivitySummaryOut(
+            parcel_id=summary.parcel_id,
+            last_activity_date=summary.last_activity_date,
+            last_harvest_date=summary.last_harvest_date,
+            activity_count=summary.activity_count,
+            recent_activity_count=recent_activity_count(summary, days),
+            type_counts=summary.type_counts or {},
+        )
+        for summary in summaries
+    ]
 
 
 @router.get("/{parcel_id}", response_model=schemas.ParcelOut)
@@ -49,17 +99,26 @@ def create_parcel(
 
 # Legacy endpoints for backwards compatibility
 @router.get("/listar", response_model=List[schemas.ParcelOut])
-def listar_parcelas(db: Session = Depends(get_db)) -> List[models.Parcel]:
-    """Legacy: Get all parcels (Spanish name)."""
-    return list_parcels(db)
+def listar_parcelas(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    db: Session = Depends(get_db),
+) -> List[models.Parcel]:
+    """Legacy: Get parcels (Spanish name)."""
+    return legacy_list(response, page, lambda page: list_parcels(page, db))
 
 
 @router.get("/listar-por-terreno/{terreno_id}", response_model=List[schemas.ParcelOut])
 def listar_parcelas_por_terreno(
-    terreno_id: int, db: Session = Depends(get_db)
+    terreno_id: int,
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    db: Session = Depends(get_db),
 ) -> List[models.Parcel]:
     """Legacy: Get parcels by terrain (Spanish name)."""
-    return list_parcels_by_terrain(terreno_id, db)
+    return legacy_list(
+        response, page, lambda page: list_parcels_by_terrain(terreno_id, page, db)
+    )
 
 
 @router.get("/obtener/{parcela_id}", response_model=schemas.ParcelOut)
@@ -1,11 +1,18 @@
 from datetime import date
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.db import get_db
+from app.pagination import (
+    DateRange,
+    LegacyPageParams,
+    PageParams,
+    legacy_list,
+    paginate,
+)
 
 router = APIRouter(prefix="/simulation", tags=["Simulation"])
 
@@ -36,10 +43,17 @@ def get_simulation(id: int, db: Session = Depends(get_db)) -> models.Simulation:
     return db_simulation
 
 
-@router.get("/", response_model=List[schemas.SimulationOut])
-def list_simulations(db: Session = Depends(get_db)) -> List[models.Simulation]:
-    """List all simulations."""
-    return db.query(models.Simulation).all()
+@router.get("/", response_model=schemas.Page[schemas.SimulationOut])
+def list_simulations(
+    page: PageParams = Depends(),
+    date_range: DateRange = Depends(),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """List a page of simulations, optionally filtered by creation date."""
+    query = date_range.apply(
+        db.query(models.Simulation), models.Simulation.creation_date
+    )
+    return paginate(query, models.Simulation.id, page)
 
 
 # ----- BIOLOGICAL PARAMETERS -----
@@ -72,12 +86,17 @@ def get_biological_parameter(
     return db_parameter
 
 
-@router.get("/parameters/", response_model=List[schemas.BiologicalParameterOut])
+@router.get("/parameters/", response_model=schemas.Page[schemas.BiologicalParameterOut])
 def list_biological_parameters(
+    page: PageParams = Depends(),
+    parcel_id: Optional[int] = Query(None, description="Filter by parcel"),
     db: Session = Depends(get_db),
-) -> List[models.BiologicalParameter]:
-    """List all biological parameters."""
-    return db.query(models.BiologicalParameter).all()
+) -> Dict[str, Any]:
+    """List a page of biological parameters, optionally filtered by parcel."""
+    query = db.query(models.BiologicalParameter)
+    if parcel_id is not None:
+        query = query.filter(models.BiologicalParameter.parcel_id == parcel_id)
+    return paginate(query, models.BiologicalParameter.id, page)
 
 
 def simulate_growth(
@@ -147,9 +166,16 @@ def obtener_simulacion(id: int, db: Session = Depends(get_db)) -> models.Simulat
 
 
 @router.get("/simulaciones/", response_model=List[schemas.SimulationOut])
-def listar_simulaciones(db: Session = Depends(get_db)) -> List[models.Simulation]:
+def listar_simulaciones(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    date_range: DateRange = Depends(),
+    db: Session = Depends(get_db),
+) -> List[models.Simulation]:
     """Legacy: List simulations (Spanish name)."""
-    return list_simulations(db)
+    return legacy_list(
+        response, page, lambda page: list_simulations(page, date_range, db)
+    )
 
 
 # Parameter legacy endpoints
@@ -171,10 +197,15 @@ def obtener_parametro(
 
 @router.get("/parametros/", response_model=List[schemas.BiologicalParameterOut])
 def listar_parametros(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    parcela_id: Optional[int] = Query(None, description="Filter by parcel"),
     db: Session = Depends(get_db),
 ) -> List[models.BiologicalParameter]:
     """Legacy: List biological parameters (Spanish name)."""
-    return list_biological_parameters(db)
+    return legacy_list(
+        response, page, lambda page: list_biological_parameters(page, parcela_id, db)
+    )
 
 
 # Simulation legacy endpoint
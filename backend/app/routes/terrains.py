@@ -1,18 +1,38 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.db import get_db
+from app.geojson import terrain_features
+from app.pagination import LegacyPageParams, PageParams, legacy_list, paginate
 
 router = APIRouter(prefix="/terrains", tags=["Terrains"])
 
 
-@router.get("/", response_model=List[schemas.TerrainOut])
-def list_terrains(db: Session = Depends(get_db)) -> List[models.Terrain]:
-    """Get all terrains."""
-    return db.query(models.Terrain).all()
+@router.get("/", response_model=schemas.Page[schemas.TerrainOut])
+def list_terrains(
+    page: PageParams = Depends(), db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """Get a page of terrains."""
+    return paginate(db.query(models.Terrain), models.Terrain.id, page)
+
+
+@router.get("/geojson", response_model=schemas.FeatureCollection)
+def get_terrains_geojson(
+    terrain_id: Optional[int] = Query(None, description="Only this terrain"),
+    include_parcels: bool = Query(False, description="Add the terrains' parcels"),
+    db: Session = Depends(get_db),
+) -> Dict[str, Any]:
+    """
+    Get terrain geometries as a GeoJSON FeatureCollection.
+
+    Features carry the terrain's fields as properties, with "kind" set to
+    "terrain" (or "parcel" for the parcels added by include_parcels).
+    Terrains without a location are left out.
+    """
+    return terrain_features(db, terrain_id, include_parcels)
 
 
 @router.get("/{terrain_id}", response_model=schemas.TerrainOut)
@@ -38,9 +58,13 @@ def create_terrain(
 
 # Legacy endpoints for backwards compatibility
 @router.get("/listar", response_model=List[schemas.TerrainOut])
-def listar_terrenos(db: Session = Depends(get_db)) -> List[models.Terrain]:
-    """Legacy: Get all terrains (Spanish name)."""
-    return list_terrains(db)
+def listar_terrenos(
+    response: Response,
+    page: LegacyPageParams = Depends(),
+    db: Session = Depends(get_db),
+) -> List[models.Terrain]:
+    """Legacy: Get terrains (Spanish name)."""
+    return legacy_list(response, page, lambda page: list_terrains(page, db))
 
 
 @router.get("/obtener/{terreno_id}", response_model=schemas.TerrainOut)
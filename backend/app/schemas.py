@@ -1,8 +1,44 @@
-from datetime import date
-from typing import Any, Dict, Optional
+from datetime import date, datetime
+from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar
+from uuid import UUID
 
 from pydantic import BaseModel, EmailStr
 
+ItemT = TypeVar("ItemT")
+
+# ---------- PAGINATION ----------
+
+
+class Page(BaseModel, Generic[ItemT]):
+    """One page of a list, with the cursor to the next page."""
+
+    items: List[ItemT]
+    next_cursor: Optional[int] = None  # Pass as "after"; None on the last page
+
+
+class Table(BaseModel):
+    """Rows of one table in column order, a compact alternative to objects."""
+
+    columns: List[str]
+    rows: List[List[Any]]
+
+
+class Feature(BaseModel):
+    """A GeoJSON Feature: the geometry of a terrain or parcel with its fields."""
+
+    type: Literal["Feature"] = "Feature"
+    id: str  # Kind and entity id, e.g. "parcel-3", unique in a collection
+    geometry: Optional[Dict[str, Any]] = None  # GeoJSON geometry
+    properties: Dict[str, Any]  # "kind" ("terrain" or "parcel") and columns
+
+
+class FeatureCollection(BaseModel):
+    """A GeoJSON FeatureCollection."""
+
+    type: Literal["FeatureCollection"] = "FeatureCollection"
+    features: List[Feature]
+
+
 # ---------- USER ----------
 
 
@@ -106,6 +142,24 @@ class ParcelOut(ParcelBase):
     model_config = {"from_attributes": True}
 
 
+class ParcelStatusOut(BaseModel):
+    """Schema for computed parcel statuses."""
+
+    statuses: Dict[int, List[str]]  # Status strings per parcel ID
+    summary: Dict[str, int]  # Counts per category: "Optimal", "Attention", "Critical"
+
+
+class ParcelActivitySummaryOut(BaseModel):
+    """Schema for a parcel's aggregated activity summary."""
+
+    parcel_id: int
+    last_activity_date: Optional[date] = None  # Most recent activity
+    last_harvest_date: Optional[date] = None  # Most recent harvest
+    activity_count: int  # Total number of activities
+    recent_activity_count: int  # Activities in the requested last N days
+    type_counts: Dict[str, int]  # Number of activities per type
+
+
 # ---------- ACTIVITY ----------
 
 
@@ -153,6 +207,94 @@ class ActivityDetailOut(ActivityDetailCreate):
     model_config = {"from_attributes": True}
 
 
+class ActivityDetailIngest(BaseModel):
+    """Schema for a detail nested in an ingested activity."""
+
+    name: str  # Detail name: "Fertilizer", "Kg harvested", "Water used"
+    value: str  # Value (can be number, text, or measurement)
+    unit: Optional[str] = None  # Unit: "kg", "l", "m3"
+
+
+class ActivityIngest(ActivityBase):
+    """Schema for one activity of an ingest batch, with its details."""
+
+    details: List[ActivityDetailIngest] = []
+
+
+class IngestRowError(BaseModel):
+    """Validation errors of one rejected ingest row."""
+
+    index: int  # Position of the row in the request
+    errors: List[str]  # "field: message" entries
+
+
+class IngestResult(BaseModel):
+    """Outcome of an activity ingest batch."""
+
+    inserted: int  # Number of activities stored
+    details_inserted: int  # Number of activity details stored
+    activity_ids: List[int]  # IDs of the stored activities, in request order
+    errors: List[IngestRowError]  # Rows that were rejected
+
+
+class ActivitySync(ActivityBase):
+    """Schema for an activity uploaded by a device during sync."""
+
+    client_uuid: UUID  # Key generated on the device, identical across retries
+
+
+class ActivitySyncCreated(BaseModel):
+    """Server id assigned to a newly synced activity."""
+
+    client_uuid: str
+    id: int
+
+
+class ActivitySyncResult(BaseModel):
+    """Outcome of a sync upload; activities already stored are omitted."""
+
+    created: List[ActivitySyncCreated]
+
+
+class ActivitySyncOut(ActivityOut):
+    """Schema for activities pulled by a device."""
+
+    client_uuid: Optional[str] = None
+    updated_at: datetime
+
+
+class ActivityTombstoneOut(BaseModel):
+    """An activity deleted on the server, for devices to drop."""
+
+    id: int
+    activity_id: int
+    client_uuid: Optional[str] = None
+    deleted_at: datetime
+    model_config = {"from_attributes": True}
+
+
+class ActivitySyncPage(BaseModel):
+    """Activities changed and deleted since the watermarks, oldest first."""
+
+    items: List[ActivitySyncOut]
+    since: Optional[datetime] = None  # Watermark to send with the next pull
+    after_id: Optional[int] = None  # Tie-breaker to send with the next pull
+    deleted: List[ActivityTombstoneOut] = []
+    deleted_since: Optional[datetime] = None  # Deletion watermark
+    deleted_after_id: Optional[int] = None  # Deletion tie-breaker
+    has_more: bool  # Whether more changes or deletions are waiting
+
+
+class BootstrapOut(BaseModel):
+    """Everything the frontend loads on start-up, in one payload."""
+
+    terrains: Table
+    parcels: Table
+    activities: Table  # Activities since activities_since
+    locations: Table  # Locations of the terrains and parcels, as GeoJSON
+    activities_since: date
+
+
 # ---------- CHAT ----------
 
 
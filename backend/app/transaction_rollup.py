@@ -0,0 +1,175 @@
+"""
+Materialized monthly transaction rollup.
+
+``transaction_monthly_rollup`` holds one row per (parcel_id, year, month,
+category, type) with the sum and count of the matching transactions.
+Transactions without a parcel share the buckets whose parcel_id is NULL,
+so unscoped totals agree with a SUM over the transactions table.
+Writers call ``refresh_transaction_rollup`` for the transactions they
+touched, in the same transaction, so the economy reports read
+O(categories x months) rows however large the ledger grows.
+
+Back-fill after bulk loads with::
+
+    python -m app.transaction_rollup
+"""
+
+from datetime import date
+from typing import Iterable, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.economy import month_start
+
+# parcel_id (None when unassigned), year, month, category, type
+RollupKey = Tuple[Optional[int], int, int, str, str]
+
+
+def rollup_key(transaction: models.Transaction) -> RollupKey:
+    """Rollup bucket a transaction belongs to."""
+    return (
+        transaction.parcel_id,
+        transaction.date.year,
+        transaction.date.month,
+        transaction.category,
+        transaction.type,
+    )
+
+
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """Half-open date range [start, end) covering a calendar month."""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def refresh_transaction_rollup(
+    db: Session, transactions: Iterable[models.Transaction]
+) -> None:
+    """
+    Recompute the rollup buckets of the given transactions.
+
+    Pending changes are flushed first; the caller commits. Buckets left
+    without transactions lose their row. To move a transaction between
+    buckets, refresh both its old and its new state.
+
+    Args:
+        db: Database session
+        transactions: Transactions that were added, changed or deleted
+    """
+    keys: Set[RollupKey] = {rollup_key(transaction) for transaction in transactions}
+    if not keys:
+        return
+    db.flush()
+
+    # Serialize concurrent refreshes of the same parcels (no-op on SQLite)
+    parcel_ids = sorted({key[0] for key in keys if key[0] is not None})
+    db.execute(
+        select(models.Parcel.id)
+        .where(models.Parcel.id.in_(parcel_ids))
+        .with_for_update()
+    )
+
+    transaction = models.Transaction
+    rollup = models.TransactionMonthlyRollup
+    for key in sorted(keys, key=lambda key: (key[0] or 0, *key[1:])):
+        parcel_id, year, month, category, transaction_type = key
+        start, end = month_bounds(year, month)
+        # Comparing with None renders IS NULL, selecting the unassigned bucket
+        total, count = (
+            db.query(func.sum(transaction.amount), func.count(transaction.id))
+            .filter(
+                transaction.parcel_id == parcel_id,
+                transaction.category == category,
+                transaction.type == transaction_type,
+                transaction.date >= start,
+                transaction.date < end,
+            )
+            .one()
+        )
+        row = (
+            db.query(rollup)
+            .filter(
+                rollup.parcel_id == parcel_id,
+                rollup.year == year,
+                rollup.month == month,
+                rollup.category == category,
+                rollup.type == transaction_type,
+            )
+            .one_or_none()
+        )
+        if not count:
+            if row is not None:
+                db.delete(row)
+        elif row is None:
+            db.add(
+                rollup(
+                    parcel_id=parcel_id,
+                    year=year,
+                    month=month,
+                    category=category,
+                    type=transaction_type,
+                    total_amount=total,
+                    transaction_count=count,
+                )
+            )
+        else:
+            row.total_amount = total
+            row.transaction_count = count
+    db.flush()
+
+
+def rebuild_transaction_rollup(db: Session) -> int:
+    """
+    Rebuild the whole rollup table from the transactions table and commit.
+
+    Use after bulk loads that bypass the economy routes.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of rollup rows written
+    """
+    db.flush()
+    transaction = models.Transaction
+    month = month_start(transaction.date)
+    buckets = (
+        db.query(
+            transaction.parcel_id,
+            month,
+            transaction.category,
+            transaction.type,
+            func.sum(transaction.amount),
+            func.count(transaction.id),
+        )
+        .group_by(transaction.parcel_id, month, transaction.category, transaction.type)
+        .all()
+    )
+    db.query(models.TransactionMonthlyRollup).delete(synchronize_session=False)
+    db.add_all(
+        models.TransactionMonthlyRollup(
+            parcel_id=parcel_id,
+            year=first_day.year,
+            month=first_day.month,
+            category=category,
+            type=transaction_type,
+            total_amount=total,
+            transaction_count=count,
+        )
+        for parcel_id, first_day, category, transaction_type, total, count in buckets
+    )
+    db.commit()
+    return len(buckets)
+
+
+if __name__ == "__main__":
+    from app.db import SessionLocal
+
+    session = SessionLocal()
+    try:
+        print(f"Rebuilt {rebuild_transaction_rollup(session)} rollup rows.")
+    finally:
+        session.close()
@@ -1,7 +1,7 @@
 import re
 import uuid
 from collections import Counter
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
@@ -30,53 +30,98 @@ def summarize_parcel_status(parcel_status: Dict[int, List[str]]) -> Counter:
     return summary
 
 
+# Activity types with their Spanish aliases, which legacy clients still send
+HARVEST_ACTIVITY_TYPES = ["Harvest", "Cosecha"]
+PRODUCTIVE_ACTIVITY_TYPES = HARVEST_ACTIVITY_TYPES + [
+    "Milking",
+    "Ordeño",
+    "Weighing",
+    "Pesaje",
+]
+
+
 def evaluate_parcel_status(activities_df: pd.DataFrame) -> Dict[int, List[str]]:
     """
     Evaluate parcel status based on activity data.
 
+    All parcels are evaluated at once: dates are parsed a single time and
+    each status flag is a groupby aggregation over the whole frame.
+
     Args:
         activities_df: DataFrame with columns: parcel_id, date, type
 
     Returns:
         Dictionary mapping parcel_id to list of status strings
     """
-    today = pd.Timestamp.today().normalize()
-    parcel_status = {}
-
-    for parcel_id, group in activities_df.groupby("parcel_id"):
-        group = group.copy()
-        group["date"] = pd.to_datetime(group["date"], errors="coerce")
-
-        last_date = group["date"].max()
-        days_without_activity = (today - last_date).days
-        status = []
-
-        # Activity recency status
-        if days_without_activity <= 5:
-            status.append("Active")
-        elif days_without_activity <= 10:
-            status.append("Pending intervention")
-        else:
-            status.append("Inactive")
+    if activities_df.empty:
+        return {}
 
-        # Recent harvest status
-        if "Harvest" in group["type"].tolist():
-            harvest_dates = group[group["type"] == "Harvest"]["date"]
-            if any((today - harvest_dates).dt.days <= 3):
-                status.append("Recently harvested")
+    today = pd.Timestamp.today().normalize()
+    dates = pd.to_datetime(activities_df["date"], errors="coerce")
+    days_ago = (today - dates).dt.days
+    types = activities_df["type"]
+
+    flags = pd.DataFrame(
+        {
+            "parcel_id": activities_df["parcel_id"],
+            "days_ago": days_ago,
+            "recent_harvest": types.isin(HARVEST_ACTIVITY_TYPES) & (days_ago <= 3),
+            "recent_task": dates >= today - timedelta(days=3),
+            "productive": types.isin(PRODUCTIVE_ACTIVITY_TYPES),
+        }
+    )
+    parcels = flags.groupby("parcel_id").agg(
+        days_without_activity=("days_ago", "min"),
+        recently_harvested=("recent_harvest", "any"),
+        recent_tasks=("recent_task", "sum"),
+        has_productivity=("productive", "any"),
+    )
+
+    return {
+        parcel_id: parcel_statuses(days, harvested, recent_tasks, productive)
+        for parcel_id, days, harvested, recent_tasks, productive in zip(
+            parcels.index.tolist(),
+            parcels["days_without_activity"].tolist(),
+            parcels["recently_harvested"].tolist(),
+            parcels["recent_tasks"].tolist(),
+            parcels["has_productivity"].tolist(),
+        )
+    }
 
-        # High task load status
-        recent_tasks = group[group["date"] >= today - timedelta(days=3)]
-        if len(recent_tasks) >= 3:
-            status.append("High task load")
 
-        # Productivity status
-        if group["type"].isin(["Harvest", "Milking", "Weighing"]).any():
-            status.append("Has productivity")
+def parcel_statuses(
+    days_without_activity: Optional[float],
+    recently_harvested: bool,
+    recent_tasks: int,
+    has_productivity: bool,
+) -> List[str]:
+    """
+    Turn one parcel's aggregated activity flags into status strings.
 
-        parcel_status[parcel_id] = status
+    Args:
+        days_without_activity: Days since the last activity (None/NaN if unknown)
+        recently_harvested: Whether there was a harvest in the last 3 days
+        recent_tasks: Number of activities in the last 3 days
+        has_productivity: Whether any productive activity was recorded
 
-    return parcel_status
+    Returns:
+        List of status strings
+    """
+    # Activity recency status (no valid date counts as inactive)
+    if days_without_activity is not None and days_without_activity <= 5:
+        status = ["Active"]
+    elif days_without_activity is not None and days_without_activity <= 10:
+        status = ["Pending intervention"]
+    else:
+        status = ["Inactive"]
+
+    if recently_harvested:
+        status.append("Recently harvested")
+    if recent_tasks >= 3:
+        status.append("High task load")
+    if has_productivity:
+        status.append("Has productivity")
+    return status
 
 
 # Date utilities
@@ -85,6 +130,11 @@ def get_current_date() -> str:
     return datetime.now().strftime("%Y-%m-%d")
 
 
+def utc_now() -> datetime:
+    """Get the current UTC time as a naive datetime, as stored in the database."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def format_date(date_input: Union[datetime, str]) -> str:
     """Format date to YYYY-MM-DD string."""
     if isinstance(date_input, str):
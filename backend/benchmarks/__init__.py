@@ -0,0 +1,4 @@
+"""
+Standalone performance benchmarks.
+Run from the backend directory, e.g. ``python -m benchmarks.parcel_status``.
+"""
@@ -0,0 +1,252 @@
+"""
+Benchmark the route filter indexes: query plans and latency before and after.
+
+Loads synthetic activities and transactions into a scratch database, runs
+the filters used by the list and economy routes without the indexes
+declared in app.models, creates the indexes and runs them again.
+
+Usage:
+    python -m benchmarks.indexes [--rows 1000000] [--url sqlite:///indexes.db]
+
+The default URL is a SQLite file in the temporary directory. Pass a
+PostgreSQL URL to benchmark against a real server; the tables are dropped
+and recreated, so never point it at a database holding real data.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import create_engine, func, insert, select, text
+
+BATCH_SIZE = 50_000
+START_DATE = date(2020, 1, 1)
+DAYS = 5 * 365
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--parcels", type=int, default=1_000)
+    parser.add_argument("--terrains", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--url",
+        default="sqlite:///" + os.path.join(tempfile.gettempdir(), "indexes.db"),
+    )
+    return parser.parse_args()
+
+
+def insert_batched(connection, table, rows) -> None:
+    """Insert a list of row dictionaries in batches."""
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(insert(table), rows[start : start + BATCH_SIZE])
+
+
+def load_data(engine, models, args) -> None:
+    """Fill the scratch database with random rows."""
+    rng = np.random.default_rng(0)
+    days = rng.integers(0, DAYS, args.rows).tolist()
+    parcels = rng.integers(1, args.parcels + 1, args.rows).tolist()
+    with engine.begin() as connection:
+        connection.execute(
+            insert(models.User),
+            [
+                {
+                    "id": 1,
+                    "name": "Bench",
+                    "email": "b@x.io",
+                    "password": "-",
+                    "role": "admin",
+                }
+            ],
+        )
+        insert_batched(
+            connection,
+            models.Terrain,
+            [
+                {"id": i, "name": f"T{i}", "owner_id": 1}
+                for i in range(1, args.terrains + 1)
+            ],
+        )
+        insert_batched(
+            connection,
+            models.Parcel,
+            [
+                {"id": i, "name": f"P{i}", "terrain_id": i % args.terrains + 1}
+                for i in range(1, args.parcels + 1)
+            ],
+        )
+        activity_types = rng.choice(["Sowing", "Irrigation", "Harvest"], args.rows)
+        insert_batched(
+            connection,
+            models.Activity,
+            [
+                {
+                    "type": activity_type,
+                    "date": START_DATE + timedelta(days=day),
+                    "user_id": 1,
+                    "parcel_id": parcel,
+                }
+                for activity_type, day, parcel in zip(activity_types, days, parcels)
+            ],
+        )
+        transaction_types = rng.choice(["expense", "income"], args.rows)
+        amounts = rng.uniform(10, 1000, args.rows).round(2).tolist()
+        insert_batched(
+            connection,
+            models.Transaction,
+            [
+                {
+                    "type": transaction_type,
+                    "category": "supplies",
+                    "date": START_DATE + timedelta(days=day),
+                    "amount": amount,
+                    "parcel_id": parcel,
+                }
+                for transaction_type, day, amount, parcel in zip(
+                    transaction_types, days[::-1], amounts, parcels[::-1]
+                )
+            ],
+        )
+        insert_batched(
+            connection,
+            models.Budget,
+            [
+                {
+                    "year": year,
+                    "category": "supplies",
+                    "estimated_amount": 1000.0,
+                    "parcel_id": parcel,
+                }
+                for year in range(2020, 2025)
+                for parcel in range(1, args.parcels + 1)
+            ],
+        )
+
+
+def route_queries(models) -> dict:
+    """Statements equivalent to the filters used by the routes."""
+    Activity, Transaction = models.Activity, models.Transaction
+    year_start, year_end = date(2023, 1, 1), date(2024, 1, 1)
+    return {
+        "activities by parcel (page)": select(Activity)
+        .where(Activity.parcel_id == 42)
+        .order_by(Activity.id)
+        .limit(100),
+        "activities by parcel and date": select(Activity).where(
+            Activity.parcel_id == 42,
+            Activity.date >= year_start,
+            Activity.date < year_end,
+        ),
+        "parcels by terrain": select(models.Parcel).where(
+            models.Parcel.terrain_id == 7
+        ),
+        "expenses in a year": select(func.sum(Transaction.amount)).where(
+            Transaction.type == "expense",
+            Transaction.date >= year_start,
+            Transaction.date < year_end,
+        ),
+        "parcel expenses in a year": select(func.sum(Transaction.amount)).where(
+            Transaction.type == "expense",
+            Transaction.date >= year_start,
+            Transaction.date < year_end,
+            Transaction.parcel_id == 42,
+        ),
+        "budget by year and parcel": select(
+            func.sum(models.Budget.estimated_amount)
+        ).where(models.Budget.year == 2023, models.Budget.parcel_id == 42),
+    }
+
+
+def explain(connection, statement) -> str:
+    """Query plan of a statement, one line per plan node."""
+    sql = str(
+        statement.compile(
+            dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+    if connection.dialect.name == "sqlite":
+        rows = connection.execute(text("EXPLAIN QUERY PLAN " + sql))
+        return "\n".join(row[-1] for row in rows)
+    return "\n".join(row[0] for row in connection.execute(text("EXPLAIN " + sql)))
+
+
+def median_ms(connection, statement, repeat: int) -> float:
+    """Median wall time of a statement in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        connection.execute(statement).all()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def run_queries(engine, queries, repeat: int) -> dict:
+    """Plan and median latency of each query."""
+    results = {}
+    with engine.connect() as connection:
+        connection.execute(text("ANALYZE"))
+        for name, statement in queries.items():
+            results[name] = (
+                explain(connection, statement),
+                median_ms(connection, statement, repeat),
+            )
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    if args.url.startswith("sqlite"):
+        os.environ.setdefault("TESTING", "True")  # plain column types for SQLite
+    from app import models
+
+    engine = create_engine(args.url)
+    # Only the indexes under test; primary keys and unique constraints stay
+    indexes = [
+        index
+        for table in models.Base.metadata.sorted_tables
+        for index in table.indexes
+        if not all(column.primary_key for column in index.columns)
+    ]
+
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    for index in indexes:
+        index.drop(bind=engine)
+
+    start = time.perf_counter()
+    load_data(engine, models, args)
+    print(
+        f"{engine.dialect.name}: loaded {args.rows} activities and transactions "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+    queries = route_queries(models)
+    before = run_queries(engine, queries, args.repeat)
+
+    start = time.perf_counter()
+    for index in indexes:
+        index.create(bind=engine)
+    print(f"created {len(indexes)} indexes in {time.perf_counter() - start:.1f}s\n")
+
+    after = run_queries(engine, queries, args.repeat)
+
+    for name in queries:
+        (plan_before, ms_before), (plan_after, ms_after) = before[name], after[name]
+        print(
+            f"== {name}: {ms_before:.2f} ms -> {ms_after:.2f} ms "
+            f"({ms_before / ms_after:.0f}x)"
+        )
+        print("   before: " + plan_before.replace("\n", "\n           "))
+        print("   after:  " + plan_after.replace("\n", "\n           "))
+
+    models.Base.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark activity ingestion: per-object ORM bulk routes vs batched ingest.
+
+The ORM path mirrors POST /activities/bulk/ followed by
+POST /activities/details/ (add_all, commit, one refresh per object); the
+ingest path is app.activity_ingest.ingest_activities.
+
+Usage:
+    python -m benchmarks.ingest [--rows 100000] [--url sqlite:///ingest.db]
+
+The default URL is a SQLite file in the temporary directory. The tables
+are dropped and recreated, so never point it at a database holding real
+data.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Dict, List
+
+DETAILS_PER_ACTIVITY = 2
+PARCELS = 100
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument(
+        "--url",
+        default="sqlite:///" + os.path.join(tempfile.gettempdir(), "ingest.db"),
+    )
+    return parser.parse_args()
+
+
+def make_rows(count: int) -> List[Dict]:
+    """Activities with nested details, as sent by the field tablets."""
+    start = date(2024, 1, 1)
+    return [
+        {
+            "type": "Harvest" if i % 3 else "Irrigation",
+            "date": (start + timedelta(days=i % 365)).isoformat(),
+            "user_id": 1,
+            "parcel_id": i % PARCELS + 1,
+            "details": [
+                {"name": f"Measure {j}", "value": str(i * j), "unit": "kg"}
+                for j in range(DETAILS_PER_ACTIVITY)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def ingest_orm(db, rows: List[Dict]) -> None:
+    """Store rows the way the bulk routes do."""
+    from app import models, schemas
+    from app.activity_summary import refresh_parcel_summaries
+
+    payloads = [schemas.ActivityIngest.model_validate(row) for row in rows]
+    activities = [
+        models.Activity(**payload.model_dump(exclude={"details"}))
+        for payload in payloads
+    ]
+    db.add_all(activities)
+    refresh_parcel_summaries(db, [activity.parcel_id for activity in activities])
+    db.commit()
+    for activity in activities:
+        db.refresh(activity)
+
+    details = [
+        models.ActivityDetail(activity_id=activity.id, **detail.model_dump())
+        for activity, payload in zip(activities, payloads)
+        for detail in payload.details
+    ]
+    db.add_all(details)
+    db.commit()
+    for detail in details:
+        db.refresh(detail)
+
+
+def reset(engine, models) -> None:
+    """Recreate the schema with one user and the parcels."""
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(
+            models.User.__table__.insert(),
+            {
+                "id": 1,
+                "name": "Bench",
+                "email": "b@x.io",
+                "password": "-",
+                "role": "admin",
+            },
+        )
+        connection.execute(
+            models.Parcel.__table__.insert(),
+            [{"id": i, "name": f"P{i}"} for i in range(1, PARCELS + 1)],
+        )
+
+
+def main() -> None:
+    args = parse_args()
+    if args.url.startswith("sqlite"):
+        os.environ.setdefault("TESTING", "True")  # plain column types for SQLite
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app import models
+    from app.activity_ingest import ingest_activities
+
+    engine = create_engine(args.url)
+    Session = sessionmaker(bind=engine)
+    rows = make_rows(args.rows)
+    total = args.rows * (1 + DETAILS_PER_ACTIVITY)
+    print(f"{engine.dialect.name}: {args.rows} activities, {total} rows in total")
+
+    timings = {}
+    for name, ingest in [
+        ("orm bulk routes", ingest_orm),
+        ("batched ingest", ingest_activities),
+    ]:
+        reset(engine, models)
+        with Session() as db:
+            start = time.perf_counter()
+            ingest(db, rows)
+            timings[name] = time.perf_counter() - start
+        print(f"{name:16} {timings[name]:7.2f}s  {total / timings[name]:9.0f} rows/s")
+
+    speedup = timings["orm bulk routes"] / timings["batched ingest"]
+    print(f"batched ingest is {speedup:.1f}x faster")
+    models.Base.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    main()
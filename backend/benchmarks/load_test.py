@@ -0,0 +1,146 @@
+"""
+Load-test terrain listing: sync routes vs async (AsyncSession) routes.
+
+Each of ``--clients`` concurrent clients sends ``--requests`` requests to
+every path in turn, and the latency percentiles of each path are
+reported. The default paths are the sync ``GET /terrains/`` (blocking
+Session in the threadpool) and the async ``GET /api/v1/terrains/``
+(AsyncSession on the event loop).
+
+Usage:
+    python -m benchmarks.load_test [--clients 500] [--requests 20]
+        [--base-url http://localhost:8000] [--path /terrains/ ...]
+
+Without ``--base-url`` the app runs in-process (httpx ASGITransport) on a
+scratch SQLite database in the temporary directory, with the v1 API
+mounted (app.main does not serve it until it has real authentication).
+For representative numbers, start the API against PostgreSQL, e.g.
+``uvicorn app.main:app --workers 4``, and pass its URL; every worker
+then has its own sync and async pool (see DATABASE_POOL_SIZE).
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+import numpy as np
+
+DEFAULT_PATHS = ["/terrains/", "/api/v1/terrains/"]
+TERRAINS = 50
+PARCELS_PER_TERRAIN = 20
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--path", action="append", dest="paths")
+    return parser.parse_args()
+
+
+def in_process_app():
+    """The API on a seeded scratch SQLite database."""
+    database = os.path.join(tempfile.gettempdir(), "load_test.db")
+    os.environ.setdefault("TESTING", "True")  # plain column types for SQLite
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    from app import models
+    from app.api.v1 import api_router
+    from app.db import SessionLocal, engine
+    from app.main import app
+
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add(
+            models.User(id=1, name="Bench", email="b@x.io", password="-", role="owner")
+        )
+        db.add_all(
+            models.Terrain(id=t, name=f"Terrain {t}", owner_id=1)
+            for t in range(1, TERRAINS + 1)
+        )
+        db.add_all(
+            models.Parcel(name=f"P{t}-{p}", status="active", terrain_id=t)
+            for t in range(1, TERRAINS + 1)
+            for p in range(PARCELS_PER_TERRAIN)
+        )
+        db.commit()
+    app.include_router(api_router)
+    return app
+
+
+async def client_session(
+    client: httpx.AsyncClient,
+    path: str,
+    count: int,
+    latencies: List[float],
+    errors: List[int],
+) -> None:
+    """One client sending ``count`` sequential requests."""
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            failed = response.is_error
+        except httpx.HTTPError:
+            failed = True
+        latencies.append(time.perf_counter() - start)
+        errors.append(int(failed))
+
+
+async def load(client: httpx.AsyncClient, path: str, args) -> Dict[str, float]:
+    """Run all clients against one path and summarize the latencies."""
+    latencies: List[float] = []
+    errors: List[int] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client_session(client, path, args.requests, latencies, errors)
+            for _ in range(args.clients)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    return {
+        "p50": p50,
+        "p95": p95,
+        "p99": p99,
+        "rps": len(latencies) / elapsed,
+        "errors": sum(errors),
+    }
+
+
+async def main() -> None:
+    args = parse_args()
+    paths = args.paths or DEFAULT_PATHS
+    if args.base_url:
+        transport = None
+        base_url = args.base_url
+    else:
+        # Failed requests are counted as errors instead of aborting the run
+        transport = httpx.ASGITransport(
+            app=in_process_app(), raise_app_exceptions=False
+        )
+        base_url = "http://load-test"
+
+    limits = httpx.Limits(max_connections=args.clients)
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, limits=limits, timeout=120
+    ) as client:
+        print(f"{args.clients} clients x {args.requests} requests per path")
+        for path in paths:
+            await client.get(path)  # warm up
+            stats = await load(client, path, args)
+            print(
+                f"{path:24} p50 {stats['p50']:8.1f}ms  p95 {stats['p95']:8.1f}ms"
+                f"  p99 {stats['p99']:8.1f}ms  {stats['rps']:7.0f} req/s"
+                f"  {stats['errors']} errors"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
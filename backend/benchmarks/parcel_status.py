@@ -0,0 +1,98 @@
+"""
+Benchmark the vectorized evaluate_parcel_status against the per-parcel loop.
+
+Usage:
+    python -m benchmarks.parcel_status [--parcels 10000] [--activities 1000000]
+"""
+
+import argparse
+import time
+from datetime import timedelta
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from app.utils import evaluate_parcel_status
+
+ACTIVITY_TYPES = ["Sowing", "Irrigation", "Fertilization", "Harvest", "Milking"]
+
+
+def evaluate_parcel_status_loop(activities_df: pd.DataFrame) -> Dict[int, List[str]]:
+    """Previous implementation: one pandas pass per parcel group."""
+    today = pd.Timestamp.today().normalize()
+    parcel_status = {}
+
+    for parcel_id, group in activities_df.groupby("parcel_id"):
+        group = group.copy()
+        group["date"] = pd.to_datetime(group["date"], errors="coerce")
+
+        last_date = group["date"].max()
+        days_without_activity = (today - last_date).days
+        status = []
+
+        if days_without_activity <= 5:
+            status.append("Active")
+        elif days_without_activity <= 10:
+            status.append("Pending intervention")
+        else:
+            status.append("Inactive")
+
+        if "Harvest" in group["type"].tolist():
+            harvest_dates = group[group["type"] == "Harvest"]["date"]
+            if any((today - harvest_dates).dt.days <= 3):
+                status.append("Recently harvested")
+
+        recent_tasks = group[group["date"] >= today - timedelta(days=3)]
+        if len(recent_tasks) >= 3:
+            status.append("High task load")
+
+        if group["type"].isin(["Harvest", "Milking", "Weighing"]).any():
+            status.append("Has productivity")
+
+        parcel_status[parcel_id] = status
+
+    return parcel_status
+
+
+def make_activities(parcels: int, activities: int, seed: int = 0) -> pd.DataFrame:
+    """Random activities over the last 30 days, as date strings like the API."""
+    rng = np.random.default_rng(seed)
+    today = pd.Timestamp.today().normalize()
+    dates = today - pd.to_timedelta(rng.integers(0, 30, activities), unit="D")
+    return pd.DataFrame(
+        {
+            "parcel_id": rng.integers(1, parcels + 1, activities),
+            "date": dates.strftime("%Y-%m-%d"),
+            "type": rng.choice(ACTIVITY_TYPES, activities),
+        }
+    )
+
+
+def timed(func, *args):
+    """Run func once and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parcels", type=int, default=10_000)
+    parser.add_argument("--activities", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = make_activities(args.parcels, args.activities)
+    print(f"{args.parcels} parcels, {args.activities} activities")
+
+    vectorized, vectorized_time = timed(evaluate_parcel_status, df)
+    print(f"vectorized: {vectorized_time:.2f}s")
+    loop, loop_time = timed(evaluate_parcel_status_loop, df)
+    print(f"loop:       {loop_time:.2f}s ({loop_time / vectorized_time:.0f}x slower)")
+
+    assert vectorized == loop, "implementations disagree"
+    print("outputs identical")
+
+
+if __name__ == "__main__":
+    main()
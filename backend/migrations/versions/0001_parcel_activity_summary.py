@@ -0,0 +1,42 @@
+"""Create the parcel_activity_summary table.
+
+Databases created before migrations were introduced may already have
+this table (created by init_db), so it is only created when missing.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("parcel_activity_summary"):
+        return
+    json_type = sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+    op.create_table(
+        "parcel_activity_summary",
+        sa.Column(
+            "parcel_id",
+            sa.Integer(),
+            sa.ForeignKey("parcels.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("last_activity_date", sa.Date()),
+        sa.Column("last_harvest_date", sa.Date()),
+        sa.Column("activity_count", sa.Integer(), nullable=False),
+        sa.Column("type_counts", json_type, nullable=False),
+        sa.Column("daily_counts", json_type, nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("parcel_activity_summary")
@@ -0,0 +1,63 @@
+"""Index the foreign-key and date columns the list and economy routes filter on.
+
+On PostgreSQL the indexes are built CONCURRENTLY so large tables stay
+writable while the migration runs.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns); kept in sync with __table_args__ in app.models
+INDEXES = [
+    ("ix_terrains_owner_id", "terrains", ["owner_id"]),
+    ("ix_parcels_terrain_id", "parcels", ["terrain_id"]),
+    ("ix_activities_parcel_id_date", "activities", ["parcel_id", "date"]),
+    ("ix_activities_date", "activities", ["date"]),
+    ("ix_activity_details_activity_id", "activity_details", ["activity_id"]),
+    ("ix_inventories_parcel_id", "inventories", ["parcel_id"]),
+    (
+        "ix_inventory_events_inventory_id_date",
+        "inventory_events",
+        ["inventory_id", "date"],
+    ),
+    (
+        "ix_transactions_type_date_parcel_id",
+        "transactions",
+        ["type", "date", "parcel_id"],
+    ),
+    ("ix_transactions_parcel_id_date", "transactions", ["parcel_id", "date"]),
+    ("ix_budgets_year_parcel_id", "budgets", ["year", "parcel_id"]),
+    ("ix_indicators_parcel_id_date", "indicators", ["parcel_id", "date"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,88 @@
+"""Create and back-fill the transaction_monthly_rollup table.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+ROLLUP_COLUMNS = [
+    "parcel_id",
+    "year",
+    "month",
+    "category",
+    "type",
+    "total_amount",
+    "transaction_count",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transaction_monthly_rollup",
+        sa.Column(
+            "parcel_id",
+            sa.Integer(),
+            sa.ForeignKey("parcels.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("year", sa.Integer(), primary_key=True),
+        sa.Column("month", sa.Integer(), primary_key=True),
+        sa.Column("category", sa.String(), primary_key=True),
+        sa.Column("type", sa.String(), primary_key=True),
+        sa.Column("total_amount", sa.Float(), nullable=False),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        "ix_transaction_monthly_rollup_year_type_month",
+        "transaction_monthly_rollup",
+        ["year", "type", "month"],
+    )
+
+    transactions = sa.table(
+        "transactions",
+        sa.column("id", sa.Integer()),
+        sa.column("date", sa.Date()),
+        sa.column("type", sa.String()),
+        sa.column("category", sa.String()),
+        sa.column("amount", sa.Float()),
+        sa.column("parcel_id", sa.Integer()),
+    )
+    year = sa.cast(sa.extract("year", transactions.c.date), sa.Integer())
+    month = sa.cast(sa.extract("month", transactions.c.date), sa.Integer())
+    rollup = sa.table(
+        "transaction_monthly_rollup", *(sa.column(name) for name in ROLLUP_COLUMNS)
+    )
+    op.execute(
+        rollup.insert().from_select(
+            ROLLUP_COLUMNS,
+            sa.select(
+                transactions.c.parcel_id,
+                year,
+                month,
+                transactions.c.category,
+                transactions.c.type,
+                sa.func.sum(transactions.c.amount),
+                sa.func.count(transactions.c.id),
+            )
+            .where(transactions.c.parcel_id.isnot(None))
+            .group_by(
+                transactions.c.parcel_id,
+                year,
+                month,
+                transactions.c.category,
+                transactions.c.type,
+            ),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("transaction_monthly_rollup")
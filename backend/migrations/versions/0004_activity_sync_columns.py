@@ -0,0 +1,94 @@
+"""Add client_uuid and updated_at to activities for device sync.
+
+Existing activities get a random client_uuid and the migration time as
+updated_at, so they are included in a device's first pull.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+import uuid
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.models import utc_timestamp
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 10_000
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    client_uuid = sa.Column("client_uuid", sa.String(36), nullable=True)
+    # Naive UTC from the database clock, the same expression as the model
+    updated_at = sa.Column(
+        "updated_at", sa.DateTime(), nullable=False, server_default=utc_timestamp()
+    )
+    if bind.dialect.name == "sqlite":
+        # SQLite cannot ADD COLUMN with a non-constant default
+        with op.batch_alter_table("activities", recreate="always") as batch:
+            batch.add_column(client_uuid)
+            batch.add_column(updated_at)
+    else:
+        op.add_column("activities", client_uuid)
+        op.add_column("activities", updated_at)
+
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            "UPDATE activities SET client_uuid = gen_random_uuid()::text"
+            " WHERE client_uuid IS NULL"
+        )
+    else:
+        activities = sa.table(
+            "activities", sa.column("id", sa.Integer()), sa.column("client_uuid")
+        )
+        ids = (
+            bind.execute(
+                sa.select(activities.c.id).where(activities.c.client_uuid.is_(None))
+            )
+            .scalars()
+            .all()
+        )
+        statement = (
+            activities.update()
+            .where(activities.c.id == sa.bindparam("activity_id"))
+            .values(client_uuid=sa.bindparam("new_uuid"))
+        )
+        for start in range(0, len(ids), BATCH_SIZE):
+            bind.execute(
+                statement,
+                [
+                    {"activity_id": activity_id, "new_uuid": str(uuid.uuid4())}
+                    for activity_id in ids[start : start + BATCH_SIZE]
+                ],
+            )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_activities_client_uuid",
+            "activities",
+            ["client_uuid"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_activities_updated_at_id",
+            "activities",
+            ["updated_at", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activities_updated_at_id", table_name="activities")
+    op.drop_index("ix_activities_client_uuid", table_name="activities")
+    with op.batch_alter_table("activities") as batch:
+        batch.drop_column("updated_at")
+        batch.drop_column("client_uuid")
@@ -0,0 +1,43 @@
+"""Create the activity_tombstones table for device sync of deletions.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.models import utc_timestamp
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "activity_tombstones",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("activity_id", sa.Integer(), nullable=False),
+        sa.Column("client_uuid", sa.String(36)),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=utc_timestamp(),
+        ),
+    )
+    op.create_index(
+        "ix_activity_tombstones_deleted_at_id",
+        "activity_tombstones",
+        ["deleted_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_activity_tombstones_deleted_at_id", table_name="activity_tombstones"
+    )
+    op.drop_table("activity_tombstones")
@@ -0,0 +1,122 @@
+"""Roll up transactions without a parcel in transaction_monthly_rollup.
+
+The rollup was keyed by (parcel_id, year, month, category, type), so
+transactions with a NULL parcel_id had no bucket and were missing from
+the unscoped totals. The table is recreated with a surrogate key, a
+nullable parcel_id and a unique index over the bucket columns, then
+back-filled from every transaction.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+ROLLUP_COLUMNS = [
+    "parcel_id",
+    "year",
+    "month",
+    "category",
+    "type",
+    "total_amount",
+    "transaction_count",
+]
+
+
+def create_rollup_table(unassigned: bool) -> None:
+    """Create and back-fill the rollup table, with or without NULL buckets."""
+    if unassigned:
+        op.create_table(
+            "transaction_monthly_rollup",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "parcel_id",
+                sa.Integer(),
+                sa.ForeignKey("parcels.id", ondelete="CASCADE"),
+                nullable=True,
+            ),
+            sa.Column("year", sa.Integer(), nullable=False),
+            sa.Column("month", sa.Integer(), nullable=False),
+            sa.Column("category", sa.String(), nullable=False),
+            sa.Column("type", sa.String(), nullable=False),
+            sa.Column("total_amount", sa.Float(), nullable=False),
+            sa.Column("transaction_count", sa.Integer(), nullable=False),
+        )
+        op.create_index(
+            "ux_transaction_monthly_rollup_bucket",
+            "transaction_monthly_rollup",
+            ["parcel_id", "year", "month", "category", "type"],
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        )
+    else:
+        op.create_table(
+            "transaction_monthly_rollup",
+            sa.Column(
+                "parcel_id",
+                sa.Integer(),
+                sa.ForeignKey("parcels.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("year", sa.Integer(), primary_key=True),
+            sa.Column("month", sa.Integer(), primary_key=True),
+            sa.Column("category", sa.String(), primary_key=True),
+            sa.Column("type", sa.String(), primary_key=True),
+            sa.Column("total_amount", sa.Float(), nullable=False),
+            sa.Column("transaction_count", sa.Integer(), nullable=False),
+        )
+    op.create_index(
+        "ix_transaction_monthly_rollup_year_type_month",
+        "transaction_monthly_rollup",
+        ["year", "type", "month"],
+    )
+
+    transactions = sa.table(
+        "transactions",
+        sa.column("id", sa.Integer()),
+        sa.column("date", sa.Date()),
+        sa.column("type", sa.String()),
+        sa.column("category", sa.String()),
+        sa.column("amount", sa.Float()),
+        sa.column("parcel_id", sa.Integer()),
+    )
+    year = sa.cast(sa.extract("year", transactions.c.date), sa.Integer())
+    month = sa.cast(sa.extract("month", transactions.c.date), sa.Integer())
+    buckets = sa.select(
+        transactions.c.parcel_id,
+        year,
+        month,
+        transactions.c.category,
+        transactions.c.type,
+        sa.func.sum(transactions.c.amount),
+        sa.func.count(transactions.c.id),
+    ).group_by(
+        transactions.c.parcel_id,
+        year,
+        month,
+        transactions.c.category,
+        transactions.c.type,
+    )
+    if not unassigned:
+        buckets = buckets.where(transactions.c.parcel_id.isnot(None))
+    rollup = sa.table(
+        "transaction_monthly_rollup", *(sa.column(name) for name in ROLLUP_COLUMNS)
+    )
+    op.execute(rollup.insert().from_select(ROLLUP_COLUMNS, buckets))
+
+
+def upgrade() -> None:
+    op.drop_table("transaction_monthly_rollup")
+    create_rollup_table(unassigned=True)
+
+
+def downgrade() -> None:
+    op.drop_table("transaction_monthly_rollup")
+    create_rollup_table(unassigned=False)
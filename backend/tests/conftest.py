@@ -2,11 +2,12 @@
 Global test configuration and fixtures.
 """
 import os
+from contextlib import contextmanager
 from typing import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -62,6 +63,44 @@ def client(db_session: Session) -> Generator:
     fastapi_app.dependency_overrides.clear()
 
 
+class QueryCounter:
+    """Record the SQL statements executed on an engine while active."""
+
+    def __init__(self, bind):
+        self.engine = getattr(bind, "sync_engine", bind)  # AsyncEngine or Engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def assert_max_queries():
+    """Fail when a block runs more SQL statements than allowed (N+1 loads)."""
+
+    @contextmanager
+    def check(limit, bind=engine):
+        with QueryCounter(bind) as counter:
+            yield counter
+        assert counter.count <= limit, (
+            f"Expected at most {limit} queries, got {counter.count}:\n"
+            + "\n".join(counter.statements)
+        )
+
+    return check
+
+
 @pytest.fixture
 def sample_user(db_session: Session) -> User:
     """Create a sample user for testing."""
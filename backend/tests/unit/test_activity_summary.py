@@ -0,0 +1,90 @@
+"""
+Unit tests for the materialized parcel activity summary.
+"""
+from datetime import date, timedelta
+
+from app.activity_summary import rebuild_parcel_summaries
+from app.models import Activity, ParcelActivitySummary
+
+
+def activity_payload(user, parcel, activity_type="Irrigation", days_ago=0):
+    return {
+        "type": activity_type,
+        "date": (date.today() - timedelta(days=days_ago)).isoformat(),
+        "user_id": user.id,
+        "parcel_id": parcel.id,
+    }
+
+
+def get_summary(db_session, parcel):
+    db_session.expire_all()
+    return db_session.get(ParcelActivitySummary, parcel.id)
+
+
+class TestActivitySummaryMaintenance:
+    """Test that activity writes keep the summary table current."""
+
+    def test_register_activity(self, client, db_session, sample_user, sample_parcel):
+        """Test that registering activities updates the summary."""
+        client.post(
+            "/activities/", json=activity_payload(sample_user, sample_parcel, "Harvest")
+        )
+        client.post(
+            "/activities/bulk/",
+            json=[activity_payload(sample_user, sample_parcel, days_ago=4)] * 2,
+        )
+
+        summary = get_summary(db_session, sample_parcel)
+        assert summary.activity_count == 3
+        assert summary.last_activity_date == date.today()
+        assert summary.last_harvest_date == date.today()
+        assert summary.type_counts == {"Harvest": 1, "Irrigation": 2}
+        four_days_ago = (date.today() - timedelta(days=4)).isoformat()
+        assert summary.daily_counts == {
+            date.today().isoformat(): 1,
+            four_days_ago: 2,
+        }
+
+    def test_update_activity_moves_between_parcels(
+        self, client, db_session, sample_user, sample_parcel, sample_terrain
+    ):
+        """Test that moving an activity refreshes both parcels."""
+        other = client.post(
+            "/parcels/", json={"name": "Other", "terrain_id": sample_terrain.id}
+        ).json()
+        created = client.post(
+            "/activities/", json=activity_payload(sample_user, sample_parcel)
+        ).json()
+
+        payload = activity_payload(sample_user, sample_parcel, "Harvest")
+        payload["parcel_id"] = other["id"]
+        client.put(f"/activities/{created['id']}", json=payload)
+
+        assert get_summary(db_session, sample_parcel) is None
+        moved = db_session.get(ParcelActivitySummary, other["id"])
+        assert moved.type_counts == {"Harvest": 1}
+
+    def test_delete_activity(self, client, db_session, sample_user, sample_parcel):
+        """Test that deleting activities updates or removes the summary."""
+        first = client.post(
+            "/activities/", json=activity_payload(sample_user, sample_parcel)
+        ).json()
+        second = client.post(
+            "/activities/", json=activity_payload(sample_user, sample_parcel)
+        ).json()
+
+        client.delete(f"/activities/{first['id']}")
+        assert get_summary(db_session, sample_parcel).activity_count == 1
+
+        client.delete(f"/activities/{second['id']}")
+        assert get_summary(db_session, sample_parcel) is None
+
+    def test_rebuild(self, db_session, sample_activity):
+        """Test rebuilding the summary after a direct insert."""
+        assert rebuild_parcel_summaries(db_session) == 1
+
+        summary = get_summary(db_session, sample_activity.parcel)
+        assert summary.activity_count == 1
+        assert summary.last_activity_date == sample_activity.date
+        assert summary.daily_counts == {}
+        assert db_session.query(Activity).count() == 1
@@ -0,0 +1,203 @@
+"""
+Unit tests for the async terrain repository and the v1 terrain routes.
+"""
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.dependencies import get_current_settings
+from app.core.exceptions import InvalidOperationException
+from app.api.v1 import api_router
+from app.db import get_async_db
+from app.infrastructure.repositories.terrain_repository import (
+    AsyncTerrainRepository,
+)
+from app.models import Base, Parcel, Terrain, User
+
+
+@pytest_asyncio.fixture
+async def async_session_factory(tmp_path):
+    """Async sessions on a fresh SQLite database with two terrains."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", poolclass=NullPool
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    async with factory() as db:
+        db.add(User(id=1, name="Owner", email="o@x.io", password="-", role="owner"))
+        db.add_all(
+            [
+                Terrain(id=1, name="North Farm", owner_id=1),
+                Terrain(id=2, name="South Farm", owner_id=1),
+                Parcel(name="A", status="active", terrain_id=1),
+                Parcel(name="B", status="fallow", terrain_id=1),
+            ]
+        )
+        await db.commit()
+    yield factory
+    await engine.dispose()
+
+
+class TestAsyncTerrainRepository:
+    """Test terrain data access on an AsyncSession."""
+
+    @pytest.mark.asyncio
+    async def test_get_with_stats(self, async_session_factory):
+        """Test that statistics and parcels are loaded without lazy loads."""
+        async with async_session_factory() as db:
+            result = await AsyncTerrainRepository(db).get_with_stats(1)
+
+        assert [parcel.name for parcel in result["terrain"].parcels] == ["A", "B"]
+        assert result["statistics"] == {
+            "total_parcels": 2,
+            "active_parcels": 1,
+            "inactive_parcels": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_parcel_counts_in_one_query(
+        self, async_session_factory, assert_max_queries
+    ):
+        """Test that terrains and parcel counts come from a single statement."""
+        engine = async_session_factory.kw["bind"]
+        async with async_session_factory() as db:
+            repository = AsyncTerrainRepository(db)
+            with assert_max_queries(1, engine):
+                owned = await repository.get_by_owner_with_parcel_counts(1)
+            with assert_max_queries(1, engine):
+                found = await repository.search_by_name_with_parcel_counts("north")
+
+        assert [(terrain.name, count) for terrain, count in owned["items"]] == [
+            ("North Farm", 2),
+            ("South Farm", 0),
+        ]
+        assert owned["next_cursor"] is None
+        assert [(terrain.id, count) for terrain, count in found["items"]] == [(1, 2)]
+
+    @pytest.mark.asyncio
+    async def test_parcel_counts_page_by_id(self, async_session_factory):
+        """Test keyset pagination of terrains with parcel counts."""
+        async with async_session_factory() as db:
+            repository = AsyncTerrainRepository(db)
+            first = await repository.get_by_owner_with_parcel_counts(1, limit=1)
+            second = await repository.get_by_owner_with_parcel_counts(
+                1, limit=1, after=first["next_cursor"]
+            )
+            found = await repository.search_by_name_with_parcel_counts(
+                "farm", 1, limit=1, after=first["next_cursor"]
+            )
+
+        assert [(t.id, count) for t, count in first["items"]] == [(1, 2)]
+        assert first["next_cursor"] == 1
+        assert [(t.id, count) for t, count in second["items"]] == [(2, 0)]
+        assert second["next_cursor"] is None
+        assert [t.id for t, _ in found["items"]] == [2]
+
+    @pytest.mark.asyncio
+    async def test_get_multi_pages_by_id(self, async_session_factory):
+        """Test keyset pagination of the async base repository."""
+        async with async_session_factory() as db:
+            repository = AsyncTerrainRepository(db)
+            first = await repository.get_multi(limit=1)
+            second = await repository.get_multi(limit=1, after=first["next_cursor"])
+
+        assert [terrain.id for terrain in first["items"]] == [1]
+        assert [terrain.id for terrain in second["items"]] == [2]
+        assert second["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_delete_with_validation(self, async_session_factory):
+        """Test that only terrains without parcels can be deleted."""
+        async with async_session_factory() as db:
+            repository = AsyncTerrainRepository(db)
+            with pytest.raises(InvalidOperationException):
+                await repository.delete_with_validation(1)
+            assert await repository.delete_with_validation(2) is True
+            assert await repository.count() == 1
+
+
+class TestTerrainRoutesV1:
+    """Test the async v1 terrain endpoints."""
+
+    @pytest.fixture
+    def v1_app(self, async_session_factory):
+        """The v1 API, which app.main does not mount yet, on the test database."""
+
+        async def override_get_async_db():
+            async with async_session_factory() as db:
+                yield db
+
+        v1_app = FastAPI()
+        v1_app.include_router(api_router)
+        v1_app.dependency_overrides[get_async_db] = override_get_async_db
+        return v1_app
+
+    @pytest.fixture
+    def v1_client(self, v1_app):
+        with TestClient(v1_app) as test_client:
+            yield test_client
+
+    def test_list_terrains(self, v1_client, async_session_factory, assert_max_queries):
+        """Test listing the terrains of the current user with parcel counts."""
+        with assert_max_queries(1, async_session_factory.kw["bind"]):
+            response = v1_client.get("/api/v1/terrains/")
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert [(t["name"], t["parcel_count"]) for t in page["items"]] == [
+            ("North Farm", 2),
+            ("South Farm", 0),
+        ]
+        assert page["next_cursor"] is None
+
+    def test_list_terrains_follows_cursor(self, v1_client):
+        """Test paging through the terrains with limit and after."""
+        first = v1_client.get("/api/v1/terrains/", params={"limit": 1}).json()
+        assert [t["id"] for t in first["items"]] == [1]
+
+        second = v1_client.get(
+            "/api/v1/terrains/", params={"limit": 1, "after": first["next_cursor"]}
+        ).json()
+        assert [t["id"] for t in second["items"]] == [2]
+        assert second["next_cursor"] is None
+
+    def test_routes_do_not_load_settings(self, v1_app, v1_client):
+        """Test that the terrain routes work when Settings cannot be built."""
+
+        def missing_settings():
+            raise AssertionError("Settings loaded on a terrain request")
+
+        v1_app.dependency_overrides[get_current_settings] = missing_settings
+        response = v1_client.get("/api/v1/terrains/")
+        assert response.status_code == status.HTTP_200_OK
+        assert v1_client.get("/api/v1/terrains/1").status_code == status.HTTP_200_OK
+
+    def test_create_and_update_terrain(self, v1_client):
+        """Test creating and renaming a terrain."""
+        response = v1_client.post(
+            "/api/v1/terrains/", json={"name": "East Farm", "owner_id": 1}
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        terrain_id = response.json()["id"]
+
+        response = v1_client.put(
+            f"/api/v1/terrains/{terrain_id}", json={"name": "East Farm II"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "East Farm II"
+        assert response.json()["parcels"] == []
+
+    def test_search_terrains(self, v1_client, async_session_factory, assert_max_queries):
+        """Test searching terrains by name without loading their parcels."""
+        with assert_max_queries(1, async_session_factory.kw["bind"]):
+            response = v1_client.get("/api/v1/terrains/", params={"search": "farm"})
+        assert response.status_code == status.HTTP_200_OK
+        assert [t["parcel_count"] for t in response.json()["items"]] == [2, 0]
+
+    def test_not_mounted_on_main_app(self, client):
+        """Test that the v1 routes are not served until they have real auth."""
+        response = client.get("/api/v1/terrains/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,56 @@
+"""
+Unit tests for conditional GET support (ETag / 304 Not Modified).
+"""
+from fastapi import status
+
+from app.core.conditional import body_etag, parse_if_none_match
+from app.models import Parcel
+
+
+class TestConditionalGet:
+    """Test ETags and 304 responses on read endpoints."""
+
+    def test_etag_is_body_hash(self, client, sample_parcel):
+        """Test that GET responses carry the hash of their body."""
+        response = client.get("/parcels/")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] == body_etag(response.content)
+
+    def test_not_modified(self, client, sample_parcel):
+        """Test that a matching If-None-Match gets an empty 304."""
+        etag = client.get("/parcels/").headers["etag"]
+
+        response = client.get("/parcels/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert "content-type" not in response.headers
+        assert "server-timing" in response.headers
+
+        weak = client.get("/parcels/", headers={"If-None-Match": f'"x", W/{etag}'})
+        assert weak.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_changed_data_gets_new_body(self, client, db_session, sample_parcel):
+        """Test that a stale ETag gets the new body and ETag."""
+        etag = client.get("/parcels/").headers["etag"]
+        db_session.add(
+            Parcel(name="New parcel", status="active", terrain_id=sample_parcel.terrain_id)
+        )
+        db_session.commit()
+
+        response = client.get("/parcels/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+        assert len(response.json()["items"]) == 2
+
+    def test_errors_and_writes_untagged(self, client):
+        """Test that only successful GETs get an ETag."""
+        assert "etag" not in client.get("/terrains/9999").headers
+        response = client.post("/terrains/", json={})
+        assert "etag" not in response.headers
+
+    def test_parse_if_none_match(self):
+        """Test parsing of tag lists and weak tags."""
+        assert parse_if_none_match('"a", W/"b" ,') == {'"a"', '"b"'}
+        assert parse_if_none_match("*") == {"*"}
+        assert parse_if_none_match("") == set()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the settings loaded from .env files.
+"""
+from pathlib import Path
+
+import pytest
+
+from app.core.config import BatchSettings, ChatSettings, Settings
+
+ENV_EXAMPLE = Path(__file__).parents[2] / ".env.example"
+
+REQUIRED = (
+    "DATABASE_URL=postgresql+psycopg2://u:p@db:5432/agrovista\n"
+    "SECRET_KEY=test-secret\n"
+)
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Write a .env file, with the process environment not overriding it."""
+
+    def write(content):
+        for line in content.splitlines():
+            monkeypatch.delenv(line.split("=", 1)[0], raising=False)
+        path = tmp_path / ".env"
+        path.write_text(content)
+        return path
+
+    return write
+
+
+class TestSettings:
+    """Test that documented keys are declared and read from .env."""
+
+    def test_chat_settings_from_env_file(self, env_file):
+        """Test that the chat keys are read from the .env file."""
+        path = env_file(
+            REQUIRED
+            + "CHAT_INDEX_DIR=/tmp/idx\nCHAT_CONTEXT_CHUNK_SIZE=50\n"
+            + "EMBEDDING_MODEL_NAME=test-model\nEMBEDDING_BATCH_SIZE=7\n"
+            + "EMBEDDING_CACHE_PATH=/tmp/vectors.sqlite\n"
+            + "CHAT_ANSWER_CACHE_SIZE=8\nCHAT_ANSWER_CACHE_TTL=1.5\nCHAT_FAKE_LLM=True\n"
+        )
+
+        chat = ChatSettings(_env_file=path)
+        assert chat.CHAT_INDEX_DIR == "/tmp/idx"
+        assert chat.CHAT_CONTEXT_CHUNK_SIZE == 50
+        assert chat.EMBEDDING_MODEL_NAME == "test-model"
+        assert chat.EMBEDDING_BATCH_SIZE == 7
+        assert chat.EMBEDDING_CACHE_PATH == "/tmp/vectors.sqlite"
+        assert chat.CHAT_ANSWER_CACHE_SIZE == 8
+        assert chat.CHAT_ANSWER_CACHE_TTL == 1.5
+        assert chat.CHAT_FAKE_LLM is True
+
+        settings = Settings(_env_file=path)
+        assert settings.CHAT_INDEX_DIR == "/tmp/idx"
+
+    def test_batch_settings_from_env_file(self, env_file):
+        """Test that the export and import batch sizes are read from .env."""
+        path = env_file(REQUIRED + "EXPORT_BATCH_SIZE=250\nINGEST_BATCH_SIZE=13\n")
+
+        batches = BatchSettings(_env_file=path)
+        assert batches.EXPORT_BATCH_SIZE == 250
+        assert batches.INGEST_BATCH_SIZE == 13
+        assert Settings(_env_file=path).INGEST_BATCH_SIZE == 13
+
+    def test_env_example_is_valid(self, env_file):
+        """Test that a .env copied from .env.example is accepted as is."""
+        path = env_file(ENV_EXAMPLE.read_text())
+
+        settings = Settings(_env_file=path)
+        assert settings.CHAT_INDEX_DIR == "data/chat_index"
+        assert settings.INGEST_BATCH_SIZE == 1000
+
+    def test_comma_separated_cors_origins(self, env_file):
+        """Test the CORS_ORIGINS format documented in .env.example."""
+        path = env_file(
+            REQUIRED + "CORS_ORIGINS=http://localhost:8501,http://localhost:3000\n"
+        )
+        settings = Settings(_env_file=path)
+        assert settings.CORS_ORIGINS == [
+            "http://localhost:8501",
+            "http://localhost:3000",
+        ]
+
+    def test_undeclared_keys_rejected(self, env_file):
+        """Test that Settings still rejects unknown keys."""
+        path = env_file(REQUIRED + "NOT_A_SETTING=1\n")
+        with pytest.raises(ValueError):
+            Settings(_env_file=path)
+        assert ChatSettings(_env_file=path).CHAT_CONTEXT_CHUNK_SIZE == 500
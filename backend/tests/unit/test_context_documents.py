@@ -0,0 +1,76 @@
+"""
+Unit tests for streaming chat context documents from the database.
+"""
+from datetime import date, timedelta
+
+from app.context_documents import stream_context_documents
+from app.models import Activity, ActivityDetail, Transaction
+
+
+class TestContextDocuments:
+    """Test building chat context documents from database rows."""
+
+    def test_stream_context_documents(
+        self, db_session, sample_activity, sample_inventory
+    ):
+        """Test that every source table produces documents with stable ids."""
+        db_session.add_all(
+            [
+                ActivityDetail(
+                    activity_id=sample_activity.id,
+                    name="Water used",
+                    value="800",
+                    unit="l",
+                ),
+                Transaction(
+                    date=date(2024, 1, 2),
+                    type="expense",
+                    category="fertilizer purchase",
+                    amount=150.0,
+                    parcel_id=sample_activity.parcel_id,
+                ),
+            ]
+        )
+        db_session.commit()
+
+        documents = list(stream_context_documents(db_session, chunk_size=1))
+        ids = [doc.id for doc in documents]
+
+        assert ids == [
+            f"activity:{sample_activity.id}",
+            f"parcel_status:{sample_activity.parcel_id}",
+            "detail:1",
+            "transaction:1",
+            f"inventory:{sample_inventory.id}",
+        ]
+        assert "type: Maintenance" in documents[0].page_content
+        assert documents[1].page_content.startswith("Inactive")
+
+    def test_parcel_status_per_parcel(self, db_session, sample_user, sample_parcel):
+        """Test that a status document is emitted after each parcel's rows."""
+        today = date.today()
+        db_session.add_all(
+            [
+                Activity(
+                    type="Harvest",
+                    date=today - timedelta(days=offset),
+                    user_id=sample_user.id,
+                    parcel_id=sample_parcel.id,
+                )
+                for offset in range(3)
+            ]
+        )
+        db_session.commit()
+
+        documents = list(stream_context_documents(db_session, chunk_size=2))
+        status = documents[-1]
+
+        assert [doc.id for doc in documents[:3]] == [
+            "activity:3",
+            "activity:2",
+            "activity:1",
+        ]
+        assert status.id == f"parcel_status:{sample_parcel.id}"
+        assert status.page_content == (
+            "Active - Recently harvested - High task load - Has productivity"
+        )
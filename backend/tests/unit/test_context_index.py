@@ -0,0 +1,90 @@
+"""
+Unit tests for the chat context index.
+"""
+import pytest
+
+pytest.importorskip("faiss")
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from app.context_index import (
+    ContextIndex,
+    activity_document,
+    parcel_status_document,
+)
+
+
+def make_index(persist_dir=None) -> ContextIndex:
+    """Create an index backed by deterministic fake embeddings."""
+    return ContextIndex(
+        lambda: DeterministicFakeEmbedding(size=16), persist_dir=persist_dir
+    )
+
+
+def activity(id, type="Irrigation", parcel_id=1):
+    return activity_document(
+        {"id": id, "parcel_id": parcel_id, "type": type, "date": "2024-01-01"}
+    )
+
+
+class TestContextIndex:
+    """Test building and incrementally updating the context index."""
+
+    def test_build_and_search(self):
+        """Test that a built index returns stored documents."""
+        index = make_index()
+        index.build([activity(1), activity(2)])
+
+        results = index.similarity_search("Irrigation", k=5)
+
+        assert index.is_built
+        assert {doc.id for doc in results} == {"activity:1", "activity:2"}
+
+    def test_build_from_stream_in_chunks(self):
+        """Test that a streamed document source is indexed chunk by chunk."""
+        index = make_index()
+        index.build((activity(i) for i in range(5)), chunk_size=2)
+
+        assert len(index.similarity_search("Irrigation", k=10)) == 5
+
+    def test_changes_before_build_are_ignored(self):
+        """Test that upserts before the first build are dropped."""
+        index = make_index()
+        index.upsert([activity(1)])
+        index.build([])
+
+        assert index.similarity_search("Irrigation") == []
+
+    def test_upsert_replaces_document(self):
+        """Test that upserting an existing id replaces its content."""
+        index = make_index()
+        index.build([activity(1), parcel_status_document(1, ["Inactive"])])
+        version = index.version
+
+        index.upsert([activity(1, type="Harvest")])
+        results = index.similarity_search("Harvest", k=5)
+
+        assert index.version == version + 1
+        assert len(results) == 2
+        updated = next(doc for doc in results if doc.id == "activity:1")
+        assert "type: Harvest" in updated.page_content
+
+    def test_remove_document(self):
+        """Test that removed documents are no longer returned."""
+        index = make_index()
+        index.build([activity(1), activity(2)])
+
+        index.remove(["activity:1", "activity:99"])
+        results = index.similarity_search("Irrigation", k=5)
+
+        assert [doc.id for doc in results] == ["activity:2"]
+
+    def test_persisted_index_is_reloaded(self, tmp_path):
+        """Test that a saved index is loaded instead of rebuilt."""
+        index = make_index(persist_dir=str(tmp_path))
+        index.build([activity(1)])
+
+        reloaded = make_index(persist_dir=str(tmp_path))
+        reloaded.ensure_built(lambda: pytest.fail("index should not be rebuilt"))
+
+        assert [doc.id for doc in reloaded.similarity_search("x")] == ["activity:1"]
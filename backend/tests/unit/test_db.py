@@ -0,0 +1,95 @@
+"""
+Unit tests for the database engine factory and pool metrics.
+"""
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.config import DatabaseSettings
+from app.db import (
+    MeteredQueuePool,
+    async_database_url,
+    engine_options,
+    pool_metrics,
+)
+
+
+class TestEngineOptions:
+    """Test engine configuration from the database settings."""
+
+    def test_pool_options_from_settings(self):
+        """Test that pool and timeout settings reach create_engine."""
+        settings = DatabaseSettings(
+            DATABASE_URL="postgresql+psycopg2://u:p@db:5432/agrovista",
+            DATABASE_POOL_SIZE=20,
+            DATABASE_MAX_OVERFLOW=5,
+            DATABASE_POOL_RECYCLE=600,
+            DATABASE_STATEMENT_TIMEOUT=15000,
+        )
+
+        options = engine_options(settings)
+
+        assert options["poolclass"] is MeteredQueuePool
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 5
+        assert options["pool_recycle"] == 600
+        assert options["pool_pre_ping"] is True
+        assert options["connect_args"] == {"options": "-c statement_timeout=15000"}
+
+    def test_statement_timeout_can_be_disabled(self):
+        """Test that a zero statement timeout adds no connect arguments."""
+        settings = DatabaseSettings(
+            DATABASE_URL="postgresql+psycopg2://u:p@db:5432/agrovista",
+            DATABASE_STATEMENT_TIMEOUT=0,
+        )
+        assert "connect_args" not in engine_options(settings)
+
+    def test_sqlite_keeps_defaults(self):
+        """Test that SQLite URLs get no pool sizing options."""
+        settings = DatabaseSettings(DATABASE_URL="sqlite:///:memory:")
+        assert engine_options(settings) == {}
+
+
+    def test_async_database_url(self):
+        """Test the async driver chosen for each supported backend."""
+        url = async_database_url("postgresql+psycopg2://u:p@db:5432/agrovista")
+        assert url.drivername == "postgresql+asyncpg"
+        assert async_database_url("sqlite:///x.db").drivername == "sqlite+aiosqlite"
+
+    def test_async_database_url_unsupported(self):
+        """Test that backends without an async driver get a clear error."""
+        with pytest.raises(ValueError, match="mysql"):
+            async_database_url("mysql+pymysql://u:p@db/agrovista")
+
+
+class TestPoolMetrics:
+    """Test connection pool usage metrics."""
+
+    def test_metrics_track_checkouts(self, tmp_path):
+        """Test that connections in use and checkout waits are reported."""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=MeteredQueuePool,
+            pool_size=2,
+            max_overflow=0,
+        )
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                busy = pool_metrics(engine)
+            idle = pool_metrics(engine)
+        finally:
+            engine.dispose()
+
+        assert busy["pool"] == "MeteredQueuePool"
+        assert busy["size"] == 2
+        assert busy["in_use"] == 1
+        assert idle["in_use"] == 0
+        assert idle["idle"] == 1
+        assert idle["checkouts"] == 1
+        assert idle["wait_seconds_max"] >= 0
+
+    def test_health_endpoint(self, client):
+        """Test that the pool metrics are served over HTTP."""
+        response = client.get("/health/pool")
+        assert response.status_code == 200
+        assert "pool" in response.json()
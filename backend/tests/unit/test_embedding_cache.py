@@ -0,0 +1,59 @@
+"""
+Unit tests for the on-disk embedding cache.
+"""
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from app.infrastructure.external.embedding_cache import CachedEmbeddings
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    """Fake embedding model that counts embedded texts."""
+
+    embedded: int = 0
+
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+        return super().embed_documents(texts)
+
+
+class TestCachedEmbeddings:
+    """Test that unchanged texts are served from the cache."""
+
+    def test_only_new_texts_are_embedded(self, tmp_path):
+        """Test cache hits, misses and vector equality."""
+        model = CountingEmbedding(size=8)
+        cache = CachedEmbeddings(model, "fake", str(tmp_path / "cache.sqlite"))
+
+        first = cache.embed_documents(["a", "b"])
+        second = cache.embed_documents(["a", "b", "c"])
+
+        assert model.embedded == 3
+        assert cache.stats() == {"hits": 2, "misses": 3}
+        assert second[:2] == first
+        assert len(second[2]) == 8
+
+    def test_cache_survives_reopen(self, tmp_path):
+        """Test that vectors persist on disk across instances."""
+        path = str(tmp_path / "cache.sqlite")
+        CachedEmbeddings(CountingEmbedding(size=8), "fake", path).embed_documents(
+            ["a"]
+        )
+
+        model = CountingEmbedding(size=8)
+        cache = CachedEmbeddings(model, "fake", path)
+        cache.embed_documents(["a"])
+
+        assert model.embedded == 0
+        assert cache.stats() == {"hits": 1, "misses": 0}
+
+    def test_model_name_is_part_of_key(self, tmp_path):
+        """Test that a different model does not reuse cached vectors."""
+        path = str(tmp_path / "cache.sqlite")
+        CachedEmbeddings(CountingEmbedding(size=8), "model-a", path).embed_documents(
+            ["a"]
+        )
+
+        model = CountingEmbedding(size=8)
+        CachedEmbeddings(model, "model-b", path).embed_documents(["a"])
+
+        assert model.embedded == 1
@@ -0,0 +1,70 @@
+"""
+Unit tests for the shared embedding service.
+"""
+import threading
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from app.infrastructure.external.embeddings import (
+    EmbeddingService,
+    get_embedding_service,
+)
+
+
+class RecordingEmbedding(DeterministicFakeEmbedding):
+    """Fake embedding model that records the size of each batch."""
+
+    batches: list = []
+
+    def embed_documents(self, texts):
+        self.batches.append(len(texts))
+        return super().embed_documents(texts)
+
+
+class TestEmbeddingService:
+    """Test lazy loading and batching of the embedding service."""
+
+    def test_model_is_loaded_lazily_once(self):
+        """Test that the model is created on first use only, even across threads."""
+        created = []
+
+        def factory(name):
+            created.append(name)
+            return DeterministicFakeEmbedding(size=8)
+
+        service = EmbeddingService("fake-model", model_factory=factory)
+        assert not service.is_loaded
+
+        threads = [
+            threading.Thread(target=service.embed_query, args=("hello",))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert service.is_loaded
+        assert created == ["fake-model"]
+
+    def test_embed_documents_in_batches(self):
+        """Test that documents are embedded in batches of batch_size."""
+        model = RecordingEmbedding(size=8)
+        model.batches = []
+        service = EmbeddingService("fake", batch_size=4, model_factory=lambda _: model)
+
+        vectors = service.embed_documents([f"text {i}" for i in range(10)])
+
+        assert len(vectors) == 10
+        assert model.batches == [4, 4, 2]
+        assert vectors[0] == model.embed_query("text 0")
+
+    def test_invalid_batch_size(self):
+        """Test that a non-positive batch size is rejected."""
+        with pytest.raises(ValueError):
+            EmbeddingService(batch_size=0)
+
+    def test_get_embedding_service_is_singleton(self):
+        """Test that the process-wide service is shared."""
+        assert get_embedding_service() is get_embedding_service()
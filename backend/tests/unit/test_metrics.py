@@ -0,0 +1,91 @@
+"""
+Unit tests for the request instrumentation middleware.
+"""
+import re
+
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.metrics import (
+    MAX_REQUEST_ID_LENGTH,
+    RequestStats,
+    instrument_sql,
+    request_stats_ctx_var,
+    route_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    route_metrics.reset()
+    yield
+    route_metrics.reset()
+
+
+class TestMetricsMiddleware:
+    """Test per-request SQL and latency instrumentation."""
+
+    def test_server_timing_header(self, client, sample_terrain):
+        """Test that responses report their SQL count and timings."""
+        response = client.get(f"/terrains/{sample_terrain.id}")
+        assert response.status_code == status.HTTP_200_OK
+
+        timing = response.headers["server-timing"]
+        match = re.fullmatch(
+            r'db;dur=([\d.]+);desc="(\d+) queries, \d+ rows", app;dur=([\d.]+)',
+            timing,
+        )
+        assert match, timing
+        assert int(match.group(2)) == 1
+        assert float(match.group(1)) <= float(match.group(3))
+
+    def test_request_id_is_echoed(self, client):
+        """Test that a caller's request id is kept and returned."""
+        response = client.get("/", headers={"X-Request-ID": "abc-123"})
+        assert response.headers["x-request-id"] == "abc-123"
+        assert client.get("/").headers["x-request-id"]
+
+    def test_invalid_request_id_is_replaced(self, client):
+        """Test that non-ASCII request ids do not fail the request."""
+        response = client.get("/", headers={"X-Request-ID": "caf\xe9".encode("latin-1")})
+        assert response.status_code == status.HTTP_200_OK
+        assert re.fullmatch(r"[0-9a-f]{32}", response.headers["x-request-id"])
+
+    def test_long_request_id_is_truncated(self, client):
+        """Test that the echoed request id is capped in length."""
+        response = client.get("/", headers={"X-Request-ID": "a" * 10000})
+        assert response.headers["x-request-id"] == "a" * MAX_REQUEST_ID_LENGTH
+
+    def test_metrics_per_route(self, client, sample_terrain):
+        """Test that /metrics aggregates requests by route template."""
+        for _ in range(2):
+            client.get(f"/terrains/{sample_terrain.id}")
+        client.get("/terrains/9999")
+
+        metrics = client.get("/metrics").json()
+        route = metrics["GET /terrains/{terrain_id}"]
+        assert route["requests"] == 3
+        assert route["queries_total"] == 3
+        assert route["queries_max"] == 1
+        assert sum(route["latency_ms_buckets"].values()) == 3
+        assert "GET /metrics" not in metrics
+
+    def test_failed_statement_leaves_no_start_time(self):
+        """Test that a statement that raises is not paired with the next one."""
+        instrument_sql()
+        engine = create_engine("sqlite://")
+        stats = RequestStats()
+        token = request_stats_ctx_var.set(stats)
+        try:
+            with engine.connect() as connection:
+                with pytest.raises(OperationalError):
+                    connection.execute(text("SELECT * FROM missing_table"))
+                connection.execute(text("SELECT 1"))
+                assert "query_start" not in connection.connection.info
+        finally:
+            request_stats_ctx_var.reset(token)
+            engine.dispose()
+
+        assert stats.queries == 1
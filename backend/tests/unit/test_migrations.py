@@ -0,0 +1,179 @@
+"""
+Unit tests for the Alembic schema migrations.
+"""
+from alembic import command
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from app.init_db import alembic_config, stamp_migrations
+from app.models import Base
+
+
+def memory_engine():
+    return create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+def schema_indexes(engine):
+    """Indexes of every model table as {table: [(name, columns)]}."""
+    inspector = inspect(engine)
+    return {
+        table: sorted(
+            (index["name"], tuple(index["column_names"]))
+            for index in inspector.get_indexes(table)
+        )
+        for table in Base.metadata.tables
+    }
+
+
+def legacy_engine():
+    """Schema as it was before the first migration."""
+    engine = memory_engine()
+    Base.metadata.create_all(bind=engine)
+    script = ScriptDirectory.from_config(alembic_config())
+    with engine.begin() as connection:
+        for name, _, _ in script.get_revision("0002").module.INDEXES:
+            connection.execute(text(f"DROP INDEX {name}"))
+        connection.execute(text("DROP TABLE parcel_activity_summary"))
+        connection.execute(text("DROP TABLE transaction_monthly_rollup"))
+        connection.execute(text("DROP TABLE activity_tombstones"))
+        connection.execute(text("DROP INDEX ix_activities_client_uuid"))
+        connection.execute(text("DROP INDEX ix_activities_updated_at_id"))
+        connection.execute(text("ALTER TABLE activities DROP COLUMN client_uuid"))
+        connection.execute(text("ALTER TABLE activities DROP COLUMN updated_at"))
+    return engine
+
+
+def upgrade(engine, revision="head"):
+    config = alembic_config()
+    with engine.connect() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+        connection.commit()
+
+
+class TestMigrations:
+    """Test that the migrations bring existing databases up to the models."""
+
+    def test_upgrade_adds_model_indexes(self):
+        """Test upgrading a schema created before the filter indexes."""
+        expected = memory_engine()
+        Base.metadata.create_all(bind=expected)
+
+        legacy = legacy_engine()
+        upgrade(legacy)
+
+        assert schema_indexes(legacy) == schema_indexes(expected)
+
+    def test_upgrade_backfills_transaction_rollup(self):
+        """Test that existing transactions are rolled up by the migration."""
+        legacy = legacy_engine()
+        with legacy.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO transactions (date, type, category, amount, parcel_id)"
+                    " VALUES ('2024-03-01', 'expense', 'feed', 10.0, 1),"
+                    " ('2024-03-31', 'expense', 'feed', 5.5, 1),"
+                    " ('2024-04-01', 'expense', 'feed', 1.0, 1)"
+                )
+            )
+
+        upgrade(legacy)
+
+        with legacy.connect() as connection:
+            rows = connection.execute(
+                text(
+                    "SELECT year, month, total_amount, transaction_count"
+                    " FROM transaction_monthly_rollup ORDER BY month"
+                )
+            ).all()
+        assert [tuple(row) for row in rows] == [(2024, 3, 15.5, 2), (2024, 4, 1.0, 1)]
+
+    def test_upgrade_rolls_up_unassigned_transactions(self):
+        """Test that transactions without a parcel get a NULL-parcel bucket."""
+        legacy = legacy_engine()
+        with legacy.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO transactions (date, type, category, amount, parcel_id)"
+                    " VALUES ('2024-03-01', 'expense', 'feed', 10.0, 1),"
+                    " ('2024-03-02', 'expense', 'feed', 4.0, NULL),"
+                    " ('2024-03-03', 'expense', 'feed', 2.0, NULL)"
+                )
+            )
+
+        upgrade(legacy)
+
+        with legacy.connect() as connection:
+            rows = connection.execute(
+                text(
+                    "SELECT parcel_id, total_amount, transaction_count"
+                    " FROM transaction_monthly_rollup ORDER BY parcel_id"
+                )
+            ).all()
+        assert [tuple(row) for row in rows] == [(None, 6.0, 2), (1, 10.0, 1)]
+
+    def test_upgrade_backfills_activity_sync_columns(self):
+        """Test that existing activities get a sync key and watermark."""
+        legacy = legacy_engine()
+        with legacy.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO activities (type, date) VALUES"
+                    " ('Harvest', '2024-03-01'), ('Sowing', '2024-03-02')"
+                )
+            )
+
+        upgrade(legacy)
+
+        with legacy.connect() as connection:
+            rows = connection.execute(
+                text("SELECT client_uuid, updated_at FROM activities")
+            ).all()
+        assert len({client_uuid for client_uuid, _ in rows}) == 2
+        assert all(client_uuid and updated_at for client_uuid, updated_at in rows)
+
+    def test_sync_timestamps_use_model_default(self):
+        """Test that migrated sync timestamps default to the model's UTC clock."""
+
+        def defaults(engine):
+            with engine.connect() as connection:
+                return {
+                    table: {
+                        row.name: row.dflt_value
+                        for row in connection.execute(
+                            text(f"PRAGMA table_info({table})")
+                        )
+                    }[column]
+                    for table, column in [
+                        ("activities", "updated_at"),
+                        ("activity_tombstones", "deleted_at"),
+                    ]
+                }
+
+        expected = memory_engine()
+        Base.metadata.create_all(bind=expected)
+        legacy = legacy_engine()
+        upgrade(legacy)
+
+        assert defaults(legacy) == defaults(expected)
+        assert "strftime" in defaults(expected)["activities"]
+
+    def test_fresh_schema_is_stamped(self):
+        """Test that a create_all schema is marked as fully migrated."""
+        engine = memory_engine()
+        Base.metadata.create_all(bind=engine)
+        stamp_migrations(engine)
+
+        with engine.connect() as connection:
+            version = connection.execute(
+                text("SELECT version_num FROM alembic_version")
+            ).scalar()
+        head = ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+        assert version == head
+        upgrade(engine)  # nothing left to apply
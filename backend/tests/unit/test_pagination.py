@@ -0,0 +1,197 @@
+"""
+Unit tests for keyset pagination of list endpoints.
+"""
+from datetime import date
+
+from fastapi import status
+
+from app.infrastructure.repositories.base import BaseRepository
+from app.models import Activity, InventoryEvent, Parcel, Terrain
+
+
+def add_activities(db_session, user, parcel, dates):
+    for activity_date in dates:
+        db_session.add(
+            Activity(
+                type="Irrigation",
+                date=activity_date,
+                user_id=user.id,
+                parcel_id=parcel.id,
+            )
+        )
+    db_session.commit()
+
+
+def add_parcels(db_session, terrain, count):
+    for i in range(count):
+        db_session.add(Parcel(name=f"Parcel {i}", status="active", terrain_id=terrain.id))
+    db_session.commit()
+
+
+def add_inventory_events(db_session, inventory, count):
+    for _ in range(count):
+        db_session.add(
+            InventoryEvent(
+                inventory_id=inventory.id,
+                movement_type="Entry",
+                quantity=1.0,
+                date=date(2024, 1, 1),
+            )
+        )
+    db_session.commit()
+
+
+class TestKeysetPagination:
+    """Test cursor-based pages and filters on list endpoints."""
+
+    def test_pages_follow_cursor(self, client, db_session, sample_user):
+        """Test that following next_cursor visits every row exactly once."""
+        for i in range(5):
+            db_session.add(Terrain(name=f"Terrain {i}", owner_id=sample_user.id))
+        db_session.commit()
+
+        names, after = [], None
+        while True:
+            params = {"limit": 2} if after is None else {"limit": 2, "after": after}
+            page = client.get("/terrains/", params=params).json()
+            names += [terrain["name"] for terrain in page["items"]]
+            after = page["next_cursor"]
+            if after is None:
+                break
+
+        assert names == [f"Terrain {i}" for i in range(5)]
+
+    def test_last_full_page_has_no_cursor(self, client, sample_terrain):
+        """Test that an exactly filled last page does not point further."""
+        page = client.get("/terrains/", params={"limit": 1}).json()
+        assert len(page["items"]) == 1
+        assert page["next_cursor"] is None
+
+    def test_date_and_parcel_filters(
+        self, client, db_session, sample_user, sample_parcel
+    ):
+        """Test filtering activities by date range and parcel."""
+        add_activities(
+            db_session,
+            sample_user,
+            sample_parcel,
+            [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)],
+        )
+
+        response = client.get(
+            "/activities/",
+            params={
+                "date_from": "2024-01-15",
+                "date_to": "2024-03-01",
+                "parcel_id": sample_parcel.id,
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        dates = [activity["date"] for activity in response.json()["items"]]
+        assert dates == ["2024-02-01", "2024-03-01"]
+
+        other = client.get("/activities/", params={"parcel_id": sample_parcel.id + 1})
+        assert other.json()["items"] == []
+
+    def test_invalid_date_range(self, client):
+        """Test that an inverted date range is rejected."""
+        response = client.get(
+            "/economy/transactions/",
+            params={"date_from": "2024-02-01", "date_to": "2024-01-01"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_limit_is_bounded(self, client):
+        """Test that oversized pages are rejected."""
+        response = client.get("/terrains/", params={"limit": 100000})
+        assert response.status_code == 422
+
+    def test_legacy_endpoint_returns_items(
+        self, client, db_session, sample_user, sample_parcel
+    ):
+        """Test that legacy list endpoints keep returning plain lists."""
+        add_activities(
+            db_session, sample_user, sample_parcel, [date(2024, 1, 1)] * 3
+        )
+
+        response = client.get(
+            f"/activities/por-parcela/{sample_parcel.id}", params={"limit": 2}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 2
+
+    def test_legacy_endpoint_returns_full_list(
+        self, client, db_session, sample_terrain, monkeypatch
+    ):
+        """Test that legacy endpoints without a limit return every row."""
+        monkeypatch.setattr("app.pagination.MAX_PAGE_SIZE", 2)
+        add_parcels(db_session, sample_terrain, 5)
+
+        response = client.get(f"/parcels/listar-por-terreno/{sample_terrain.id}")
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["name"] for p in response.json()] == [
+            f"Parcel {i}" for i in range(5)
+        ]
+        assert "x-next-cursor" not in response.headers
+
+    def test_legacy_endpoint_cursor_header(self, client, db_session, sample_terrain):
+        """Test that a limited legacy page points to the next one in a header."""
+        add_parcels(db_session, sample_terrain, 3)
+        url = f"/parcels/listar-por-terreno/{sample_terrain.id}"
+
+        first = client.get(url, params={"limit": 2})
+        assert len(first.json()) == 2
+        after = first.headers["x-next-cursor"]
+
+        second = client.get(url, params={"limit": 2, "after": after})
+        assert [p["name"] for p in second.json()] == ["Parcel 2"]
+        assert "x-next-cursor" not in second.headers
+
+    def test_legacy_inventory_events_full_list(
+        self, client, db_session, sample_inventory, monkeypatch
+    ):
+        """Test that /inventory/eventos/ without a limit returns every event."""
+        monkeypatch.setattr("app.pagination.MAX_PAGE_SIZE", 2)
+        add_inventory_events(db_session, sample_inventory, 5)
+
+        response = client.get("/inventory/eventos/")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 5
+        assert "x-next-cursor" not in response.headers
+
+    def test_legacy_inventory_events_cursor_header(
+        self, client, db_session, sample_inventory
+    ):
+        """Test that a limited /inventory/eventos/ page sends X-Next-Cursor."""
+        add_inventory_events(db_session, sample_inventory, 3)
+
+        first = client.get("/inventory/eventos/", params={"limit": 2})
+        assert len(first.json()) == 2
+        after = first.headers["x-next-cursor"]
+
+        second = client.get(
+            "/inventory/eventos/", params={"limit": 2, "after": after}
+        )
+        assert len(second.json()) == 1
+        assert "x-next-cursor" not in second.headers
+
+
+class TestRepositoryPagination:
+    """Test keyset pagination in BaseRepository.get_multi."""
+
+    def test_get_multi(self, db_session, sample_user):
+        """Test paging through a repository with filters."""
+        for i in range(3):
+            db_session.add(Terrain(name=f"Terrain {i}", owner_id=sample_user.id))
+        db_session.add(Terrain(name="Other", owner_id=None))
+        db_session.commit()
+        repository = BaseRepository(Terrain, db_session)
+
+        first = repository.get_multi(limit=2, filters={"owner_id": sample_user.id})
+        second = repository.get_multi(
+            limit=2, after=first["next_cursor"], filters={"owner_id": sample_user.id}
+        )
+
+        assert [t.name for t in first["items"]] == ["Terrain 0", "Terrain 1"]
+        assert [t.name for t in second["items"]] == ["Terrain 2"]
+        assert second["next_cursor"] is None
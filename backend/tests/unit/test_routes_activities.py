@@ -1,7 +1,15 @@
 """
 Unit tests for activity routes.
 """
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
 from fastapi import status
+from sqlalchemy import update
+
+from app.models import Activity, ActivityDetail, ParcelActivitySummary
+from app.utils import utc_now
 
 
 class TestActivityRoutes:
@@ -11,7 +19,7 @@ class TestActivityRoutes:
         """Test getting activities when none exist."""
         response = client.get("/activities/")
         assert response.status_code == status.HTTP_200_OK
-        assert response.json() == []
+        assert response.json() == {"items": [], "next_cursor": None}
     
     def test_create_activity(self, client, sample_location):
         """Test creating a new activity."""
@@ -179,3 +187,201 @@ class TestActivityRoutes:
         data = response.json()
         assert data["name"] == "Siembra"
         assert data["activity_type"] == "Planting"
+
+
+class TestActivityIngest:
+    """Test the batched activity ingest endpoint."""
+
+    def ingest_row(self, user, parcel, **overrides):
+        row = {
+            "type": "Harvest",
+            "date": "2024-07-01",
+            "user_id": user.id,
+            "parcel_id": parcel.id,
+            "details": [
+                {"name": "Kg harvested", "value": "300", "unit": "kg"},
+                {"name": "Crates", "value": "12"},
+            ],
+        }
+        row.update(overrides)
+        return row
+
+    def test_ingest_with_nested_details(
+        self, client, db_session, sample_user, sample_parcel
+    ):
+        """Test that activities and their details are stored together."""
+        rows = [
+            self.ingest_row(sample_user, sample_parcel),
+            self.ingest_row(sample_user, sample_parcel, type="Irrigation", details=[]),
+        ]
+
+        response = client.post("/activities/ingest/", json=rows)
+        assert response.status_code == status.HTTP_200_OK
+
+        result = response.json()
+        assert result["inserted"] == 2
+        assert result["details_inserted"] == 2
+        assert result["errors"] == []
+        harvest_id, irrigation_id = result["activity_ids"]
+        assert db_session.get(Activity, irrigation_id).type == "Irrigation"
+        details = db_session.query(ActivityDetail).order_by(ActivityDetail.id).all()
+        assert [(d.activity_id, d.name) for d in details] == [
+            (harvest_id, "Kg harvested"),
+            (harvest_id, "Crates"),
+        ]
+        summary = db_session.get(ParcelActivitySummary, sample_parcel.id)
+        assert summary.activity_count == 2
+
+    def test_invalid_rows_are_reported(
+        self, client, db_session, sample_user, sample_parcel
+    ):
+        """Test that bad rows are skipped without failing the batch."""
+        rows = [
+            self.ingest_row(sample_user, sample_parcel, date="not a date"),
+            self.ingest_row(sample_user, sample_parcel),
+            self.ingest_row(sample_user, sample_parcel, parcel_id=9999),
+            "not an object",
+            self.ingest_row(sample_user, sample_parcel, details=[{"name": "x"}]),
+        ]
+
+        response = client.post("/activities/ingest/", json=rows)
+        assert response.status_code == status.HTTP_200_OK
+
+        result = response.json()
+        assert result["inserted"] == 1
+        assert [error["index"] for error in result["errors"]] == [0, 2, 3, 4]
+        assert result["errors"][0]["errors"][0].startswith("date:")
+        assert result["errors"][1]["errors"] == [
+            "parcel_id: parcel 9999 does not exist"
+        ]
+        assert result["errors"][3]["errors"][0].startswith("details.0.value:")
+        assert db_session.query(Activity).count() == 1
+
+
+class TestActivitySync:
+    """Test the offline device sync endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def no_safety_lag(self, monkeypatch):
+        """Pull changes as soon as they are committed."""
+        monkeypatch.setattr("app.activity_sync.SYNC_SAFETY_LAG", timedelta(0))
+
+    def sync_row(self, user, parcel, client_uuid, **overrides):
+        row = {
+            "client_uuid": client_uuid,
+            "type": "Harvest",
+            "date": "2024-07-01",
+            "user_id": user.id,
+            "parcel_id": parcel.id,
+        }
+        row.update(overrides)
+        return row
+
+    def test_push_is_idempotent(self, client, db_session, sample_user, sample_parcel):
+        """Test that re-uploading the same activities creates nothing."""
+        rows = [
+            self.sync_row(sample_user, sample_parcel, str(uuid4())) for _ in range(2)
+        ]
+
+        first = client.post("/activities/sync/", json=rows)
+        assert first.status_code == status.HTTP_200_OK
+        created = first.json()["created"]
+        assert [item["client_uuid"] for item in created] == [
+            row["client_uuid"] for row in rows
+        ]
+
+        retry = client.post("/activities/sync/", json=rows)
+        assert retry.status_code == status.HTTP_200_OK
+        assert retry.json()["created"] == []
+        assert db_session.query(Activity).count() == 2
+        summary = db_session.get(ParcelActivitySummary, sample_parcel.id)
+        assert summary.activity_count == 2
+
+    def test_pull_pages_from_watermark(
+        self, client, db_session, sample_user, sample_parcel
+    ):
+        """Test that pulls page through changes and resume after updates."""
+        rows = [
+            self.sync_row(sample_user, sample_parcel, str(uuid4())) for _ in range(3)
+        ]
+        client.post("/activities/sync/", json=rows)
+
+        first = client.get("/activities/sync/", params={"limit": 2}).json()
+        assert [item["client_uuid"] for item in first["items"]] == [
+            row["client_uuid"] for row in rows[:2]
+        ]
+        assert first["has_more"] is True
+
+        watermark = {"since": first["since"], "after_id": first["after_id"]}
+        second = client.get("/activities/sync/", params={**watermark, "limit": 2})
+        second = second.json()
+        assert [item["client_uuid"] for item in second["items"]] == [
+            rows[2]["client_uuid"]
+        ]
+        assert second["has_more"] is False
+
+        watermark = {"since": second["since"], "after_id": second["after_id"]}
+        assert client.get("/activities/sync/", params=watermark).json()["items"] == []
+
+        changed = first["items"][0]["id"]
+        update = self.sync_row(sample_user, sample_parcel, None, type="Irrigation")
+        del update["client_uuid"]
+        response = client.put(f"/activities/{changed}", json=update)
+        assert response.status_code == status.HTTP_200_OK
+        third = client.get("/activities/sync/", params=watermark).json()
+        assert [item["id"] for item in third["items"]] == [changed]
+        assert third["items"][0]["type"] == "Irrigation"
+
+    def test_recent_changes_held_back(
+        self, client, db_session, sample_user, sample_parcel, monkeypatch
+    ):
+        """Test that the watermark never passes changes still in the lag."""
+        monkeypatch.setattr("app.activity_sync.SYNC_SAFETY_LAG", timedelta(minutes=1))
+        rows = [
+            self.sync_row(sample_user, sample_parcel, str(uuid4())) for _ in range(2)
+        ]
+        created = client.post("/activities/sync/", json=rows).json()["created"]
+        old, recent = [item["id"] for item in created]
+        db_session.execute(
+            update(Activity)
+            .where(Activity.id == old)
+            .values(updated_at=utc_now() - timedelta(minutes=2))
+        )
+        db_session.commit()
+
+        first = client.get("/activities/sync/").json()
+        assert [item["id"] for item in first["items"]] == [old]
+        assert first["has_more"] is False
+
+        # Once out of the lag, the recent change follows the watermark
+        monkeypatch.setattr("app.activity_sync.SYNC_SAFETY_LAG", timedelta(0))
+        watermark = {"since": first["since"], "after_id": first["after_id"]}
+        second = client.get("/activities/sync/", params=watermark).json()
+        assert [item["id"] for item in second["items"]] == [recent]
+
+    def test_pull_reports_deletions(
+        self, client, db_session, sample_user, sample_parcel
+    ):
+        """Test that deleted activities come back as tombstones."""
+        rows = [
+            self.sync_row(sample_user, sample_parcel, str(uuid4())) for _ in range(2)
+        ]
+        created = client.post("/activities/sync/", json=rows).json()["created"]
+        deleted_id = created[0]["id"]
+        assert client.delete(f"/activities/{deleted_id}").status_code == 200
+
+        first = client.get("/activities/sync/").json()
+        assert [item["id"] for item in first["items"]] == [created[1]["id"]]
+        assert [
+            (item["activity_id"], item["client_uuid"]) for item in first["deleted"]
+        ] == [(deleted_id, rows[0]["client_uuid"])]
+
+        watermark = {
+            "since": first["since"],
+            "after_id": first["after_id"],
+            "deleted_since": first["deleted_since"],
+            "deleted_after_id": first["deleted_after_id"],
+        }
+        second = client.get("/activities/sync/", params=watermark).json()
+        assert second["items"] == []
+        assert second["deleted"] == []
@@ -0,0 +1,77 @@
+"""
+Unit tests for the bootstrap snapshot route.
+"""
+import json
+from datetime import date, timedelta
+
+from fastapi import status
+
+from app.models import Activity, Location
+
+
+def as_records(table):
+    return [dict(zip(table["columns"], row)) for row in table["rows"]]
+
+
+class TestBootstrapRoutes:
+    """Test the start-up snapshot endpoint."""
+
+    def test_snapshot_tables(
+        self, client, db_session, sample_user, sample_terrain, sample_parcel,
+        assert_max_queries
+    ):
+        """Test that all start-up data comes back in one request."""
+        point = {"type": "Point", "coordinates": [-74.68, 5.49]}
+        location = Location(type="point", coordinates=json.dumps(point))
+        db_session.add(location)
+        db_session.flush()
+        sample_parcel.location_id = location.id
+        today = date.today()
+        db_session.add_all(
+            [
+                Activity(type="Harvest", date=today, user_id=sample_user.id,
+                         parcel_id=sample_parcel.id),
+                Activity(type="Irrigation", date=today - timedelta(days=400),
+                         user_id=sample_user.id, parcel_id=sample_parcel.id),
+            ]
+        )
+        db_session.commit()
+
+        with assert_max_queries(4):
+            response = client.get("/bootstrap/")
+        assert response.status_code == status.HTTP_200_OK
+
+        data = response.json()
+        assert as_records(data["terrains"]) == [
+            {
+                "id": sample_terrain.id,
+                "name": "Test Farm",
+                "description": "A test farm for unit testing",
+                "owner_id": sample_user.id,
+                "location_id": None,
+            }
+        ]
+        parcels = as_records(data["parcels"])
+        assert [(p["name"], p["location_id"]) for p in parcels] == [
+            ("Test Parcel", location.id)
+        ]
+        activities = as_records(data["activities"])
+        assert [(a["type"], a["date"]) for a in activities] == [
+            ("Harvest", today.isoformat())
+        ]
+        assert as_records(data["locations"]) == [
+            {"id": location.id, "type": "point", "coordinates": point}
+        ]
+        assert data["activities_since"] == (today - timedelta(days=365)).isoformat()
+
+    def test_activity_window(self, client, sample_user, sample_parcel, db_session):
+        """Test that the activity window can be widened."""
+        db_session.add(
+            Activity(type="Harvest", date=date.today() - timedelta(days=400),
+                     user_id=sample_user.id, parcel_id=sample_parcel.id)
+        )
+        db_session.commit()
+
+        assert client.get("/bootstrap/").json()["activities"]["rows"] == []
+        response = client.get("/bootstrap/", params={"activity_days": 500})
+        assert len(response.json()["activities"]["rows"]) == 1
@@ -0,0 +1,157 @@
+"""
+Unit tests for chat routes.
+"""
+import json
+
+import pytest
+
+pytest.importorskip("faiss")
+
+from fastapi import status
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from app import chat_logic
+from app.chat_logic import AnswerCache, normalize_prompt
+from app.context_index import ContextIndex, activity_document
+
+
+@pytest.fixture
+def fake_chat(monkeypatch):
+    """Fake LLM and in-memory context index for the chat endpoints."""
+    llm = FakeListChatModel(responses=["Parcel 1 is inactive.", "Other answer."])
+    index = ContextIndex(lambda: DeterministicFakeEmbedding(size=16))
+    monkeypatch.setattr(chat_logic, "llm", llm)
+    monkeypatch.setattr(chat_logic, "context_index", index)
+    monkeypatch.setattr(chat_logic, "answer_cache", AnswerCache(16, 60))
+    monkeypatch.setattr(
+        chat_logic,
+        "load_context_documents",
+        lambda: [
+            activity_document(
+                {"id": 1, "parcel_id": 1, "type": "Harvest", "date": "2024-01-01"}
+            )
+        ],
+    )
+    return index
+
+
+def read_events(response):
+    """Parse a Server-Sent Events body into (event, data) pairs."""
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines.get("event", "message"), json.loads(lines["data"])))
+    return events
+
+
+class TestChatRoutes:
+    """Test the chat endpoints."""
+
+    def test_stream_chat(self, client, fake_chat):
+        """Test that the answer is streamed as token events."""
+        response = client.post("/chat/stream", json={"prompt": "Inactive parcels?"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = read_events(response)
+        assert events[-1] == ("done", {})
+        tokens = [data["token"] for event, data in events[:-1]]
+        assert len(tokens) > 1
+        assert "".join(tokens) == "Parcel 1 is inactive."
+
+    def test_repeated_question_is_cached(self, client, fake_chat):
+        """Test that a repeated, differently formatted question hits the cache."""
+        first = client.post("/chat", json={"prompt": "Which parcels are inactive?"})
+        second = client.post(
+            "/chat/stream", json={"prompt": "  which parcels are   INACTIVE "}
+        )
+
+        tokens = [data["token"] for event, data in read_events(second)[:-1]]
+        assert first.json() == {"response": "Parcel 1 is inactive."}
+        assert tokens == ["Parcel 1 is inactive."]
+
+    def test_index_update_invalidates_cache(self, client, fake_chat):
+        """Test that answers are not reused after the context index changes."""
+        client.post("/chat", json={"prompt": "Which parcels are inactive?"})
+        fake_chat.upsert(
+            [
+                activity_document(
+                    {"id": 2, "parcel_id": 2, "type": "Sowing", "date": "2024-02-01"}
+                )
+            ]
+        )
+
+        response = client.post("/chat", json={"prompt": "Which parcels are inactive?"})
+
+        assert response.json() == {"response": "Other answer."}
+
+    def test_answer_is_cached_under_retrieval_version(
+        self, client, fake_chat, monkeypatch
+    ):
+        """Test that an update applied during retrieval does not mislabel the answer."""
+        search = fake_chat.similarity_search_with_version
+
+        def search_after_update(query, k):
+            fake_chat.upsert(
+                [
+                    activity_document(
+                        {
+                            "id": 2,
+                            "parcel_id": 2,
+                            "type": "Sowing",
+                            "date": "2024-02-01",
+                        }
+                    )
+                ]
+            )
+            return search(query, k)
+
+        monkeypatch.setattr(
+            fake_chat, "similarity_search_with_version", search_after_update
+        )
+        client.post("/chat", json={"prompt": "Which parcels are inactive?"})
+        assert len(chat_logic.answer_cache) == 0
+
+        monkeypatch.setattr(fake_chat, "similarity_search_with_version", search)
+        client.post("/chat", json={"prompt": "Which parcels are inactive?"})
+        key = chat_logic._cache_key("Which parcels are inactive?", fake_chat.version)
+        assert chat_logic.answer_cache.get(key) == "Other answer."
+
+    def test_stream_chat_without_llm(self, client, monkeypatch):
+        """Test that the stream reports an unavailable assistant."""
+        monkeypatch.setattr(chat_logic, "llm", None)
+
+        response = client.post("/chat/stream", json={"prompt": "Hello"})
+
+        events = read_events(response)
+        assert events[0][1]["token"] == chat_logic.LLM_UNAVAILABLE_MESSAGE
+
+
+class TestAnswerCache:
+    """Test the LRU/TTL answer cache."""
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = AnswerCache(max_size=2, ttl=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_expired_entry_is_dropped(self):
+        """Test that entries expire after the TTL."""
+        cache = AnswerCache(max_size=2, ttl=0)
+        cache.set("a", "1")
+
+        assert cache.get("a") is None
+
+    def test_normalize_prompt(self):
+        """Test that case, whitespace and trailing punctuation are ignored."""
+        assert normalize_prompt(" Which  parcels are INACTIVE? ") == (
+            "which parcels are inactive"
+        )
@@ -1,7 +1,16 @@
 """
 Unit tests for economy routes.
 """
+from datetime import date
+
 from fastapi import status
+from sqlalchemy import func
+
+from app.models import Budget, Parcel, Terrain, Transaction, TransactionMonthlyRollup
+from app.transaction_rollup import (
+    rebuild_transaction_rollup,
+    refresh_transaction_rollup,
+)
 
 
 class TestEconomyRoutes:
@@ -11,7 +20,7 @@ class TestEconomyRoutes:
         """Test getting transactions when none exist."""
         response = client.get("/economy/transactions/")
         assert response.status_code == status.HTTP_200_OK
-        assert response.json() == []
+        assert response.json() == {"items": [], "next_cursor": None}
     
     def test_create_transaction(self, client, sample_parcel, sample_activity):
         """Test creating a new transaction."""
@@ -292,3 +301,219 @@ class TestEconomyRoutes:
         response = client.get("/economia/transacciones/")
         assert response.status_code == status.HTTP_200_OK
         assert isinstance(response.json(), list)
+
+
+def add_year_of_expenses(db_session, parcel):
+    """Budgets and transactions around the 2024 year boundaries."""
+    db_session.add_all(
+        [
+            Budget(year=2024, category="feed", estimated_amount=1000.0, parcel_id=parcel.id),
+            Budget(year=2024, category="seeds", estimated_amount=200.0, parcel_id=parcel.id),
+            Budget(year=2023, category="feed", estimated_amount=999.0, parcel_id=parcel.id),
+        ]
+    )
+    for day, transaction_type, category, amount in [
+        (date(2023, 12, 31), "expense", "feed", 50.0),
+        (date(2024, 1, 1), "expense", "feed", 300.0),
+        (date(2024, 1, 20), "expense", "seeds", 120.0),
+        (date(2024, 3, 5), "income", "milk", 900.0),
+        (date(2024, 12, 31), "expense", "feed", 400.0),
+        (date(2025, 1, 1), "expense", "feed", 70.0),
+    ]:
+        db_session.add(
+            Transaction(
+                date=day,
+                type=transaction_type,
+                category=category,
+                amount=amount,
+                parcel_id=parcel.id,
+            )
+        )
+    rebuild_transaction_rollup(db_session)
+
+
+class TestEconomyAggregations:
+    """Test the yearly budget and expense aggregations."""
+
+    def test_year_boundaries(self, client, db_session, sample_parcel):
+        """Test that the first and last day of the year are both included."""
+        add_year_of_expenses(db_session, sample_parcel)
+
+        response = client.get("/economy/global-summary/", params={"year": 2024})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "budget_total": 1200.0,
+            "executed_total": 820.0,
+            "difference_total": 380.0,
+            "global_alert": True,
+        }
+
+    def test_monthly_comparison(self, client, db_session, sample_parcel):
+        """Test expenses bucketed by month."""
+        add_year_of_expenses(db_session, sample_parcel)
+
+        response = client.get(
+            "/economy/monthly-comparison/", params={"year": 2024, "category": "feed"}
+        )
+        assert response.json() == [
+            {"month": 1, "executed_amount": 300.0},
+            {"month": 12, "executed_amount": 400.0},
+        ]
+
+    def test_overview_matches_separate_endpoints(
+        self, client, db_session, sample_parcel
+    ):
+        """Test that the combined endpoint returns the three separate results."""
+        add_year_of_expenses(db_session, sample_parcel)
+        params = {"year": 2024, "parcel_id": sample_parcel.id}
+
+        response = client.get("/economy/overview/", params=params)
+        assert response.status_code == status.HTTP_200_OK
+
+        overview = response.json()
+        comparison = client.get("/economy/comparison/", params=params).json()
+        assert sorted(overview["comparison"], key=lambda row: row["category"]) == sorted(
+            comparison, key=lambda row: row["category"]
+        )
+        assert overview["summary"] == client.get(
+            "/economy/global-summary/", params=params
+        ).json()
+        assert overview["monthly"] == client.get(
+            "/economy/monthly-comparison/", params=params
+        ).json()
+        assert overview["monthly"] == [
+            {"month": 1, "executed_amount": 420.0},
+            {"month": 12, "executed_amount": 400.0},
+        ]
+
+    def test_comparison_by_terrain_and_parcel_list(
+        self, client, db_session, sample_parcel, sample_terrain
+    ):
+        """Test comparing all parcels of a terrain, or a list of parcels."""
+        other_terrain = Terrain(name="Other Farm")
+        db_session.add(other_terrain)
+        db_session.flush()
+        sibling = Parcel(name="Sibling", terrain_id=sample_terrain.id)
+        outsider = Parcel(name="Outsider", terrain_id=other_terrain.id)
+        db_session.add_all([sibling, outsider])
+        db_session.flush()
+        for parcel in (sample_parcel, sibling, outsider):
+            add_year_of_expenses(db_session, parcel)
+
+        def feed_row(params):
+            response = client.get("/economy/comparison/", params={"year": 2024, **params})
+            assert response.status_code == status.HTTP_200_OK
+            return next(row for row in response.json() if row["category"] == "feed")
+
+        assert feed_row({"terrain_id": sample_terrain.id}) == {
+            "category": "feed",
+            "budgeted_amount": 2000.0,
+            "executed_amount": 1400.0,
+            "difference": 600.0,
+            "alert": True,
+        }
+        assert feed_row({"parcel_ids": [sample_parcel.id, outsider.id]})[
+            "executed_amount"
+        ] == 1400.0
+        assert feed_row({})["executed_amount"] == 2100.0
+        disjoint = client.get(
+            "/economy/comparison/",
+            params={"year": 2024, "terrain_id": other_terrain.id, "parcel_ids": [sibling.id]},
+        )
+        assert disjoint.json() == []
+
+    def test_create_transaction_updates_rollup(self, client, db_session, sample_parcel):
+        """Test that new transactions are added to the monthly rollup."""
+        for day, amount in [("2024-05-02", 10.0), ("2024-05-30", 15.0)]:
+            response = client.post(
+                "/economy/transaction/",
+                json={
+                    "date": day,
+                    "type": "expense",
+                    "category": "feed",
+                    "description": None,
+                    "amount": amount,
+                    "parcel_id": sample_parcel.id,
+                },
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        rollup = db_session.query(TransactionMonthlyRollup).one()
+        assert (rollup.year, rollup.month, rollup.category, rollup.type) == (
+            2024,
+            5,
+            "feed",
+            "expense",
+        )
+        assert rollup.total_amount == 25.0
+        assert rollup.transaction_count == 2
+        response = client.get("/economy/monthly-comparison/", params={"year": 2024})
+        assert response.json() == [{"month": 5, "executed_amount": 25.0}]
+
+    def test_rebuild_rollup_matches_refresh(self, db_session, sample_parcel):
+        """Test that a rebuild reproduces the incrementally kept rollup."""
+        add_year_of_expenses(db_session, sample_parcel)
+        transactions = db_session.query(Transaction).all()
+        db_session.query(TransactionMonthlyRollup).delete()
+        refresh_transaction_rollup(db_session, transactions)
+        db_session.commit()
+
+        def rollup_rows():
+            return sorted(
+                (r.parcel_id, r.year, r.month, r.category, r.type, r.total_amount, r.transaction_count)
+                for r in db_session.query(TransactionMonthlyRollup)
+            )
+
+        refreshed = rollup_rows()
+        assert rebuild_transaction_rollup(db_session) == len(refreshed) == 6
+        assert rollup_rows() == refreshed
+
+    def test_unassigned_transactions_in_totals(self, client, db_session, sample_parcel):
+        """Test that transactions without a parcel count in unscoped totals."""
+        add_year_of_expenses(db_session, sample_parcel)
+        unassigned = Transaction(
+            date=date(2024, 6, 1), type="expense", category="feed", amount=30.0
+        )
+        db_session.add(unassigned)
+        refresh_transaction_rollup(db_session, [unassigned])
+        db_session.commit()
+
+        direct_total = (
+            db_session.query(func.sum(Transaction.amount))
+            .filter(
+                Transaction.type == "expense",
+                Transaction.date >= date(2024, 1, 1),
+                Transaction.date < date(2025, 1, 1),
+            )
+            .scalar()
+        )
+        overview = client.get("/economy/overview/", params={"year": 2024}).json()
+        scoped = client.get(
+            "/economy/global-summary/",
+            params={"year": 2024, "parcel_id": sample_parcel.id},
+        ).json()
+
+        assert overview["summary"]["executed_total"] == direct_total == 850.0
+        assert scoped["executed_total"] == 820.0
+        assert rebuild_transaction_rollup(db_session) == 7
+
+        db_session.delete(unassigned)
+        refresh_transaction_rollup(db_session, [unassigned])
+        db_session.commit()
+        assert db_session.query(TransactionMonthlyRollup).filter(
+            TransactionMonthlyRollup.parcel_id.is_(None)
+        ).count() == 0
+
+    def test_overview_empty_year(self, client):
+        """Test the combined endpoint for a year without data."""
+        response = client.get("/economy/overview/", params={"year": 2030})
+        assert response.json() == {
+            "comparison": [],
+            "summary": {
+                "budget_total": 0.0,
+                "executed_total": 0.0,
+                "difference_total": 0.0,
+                "global_alert": False,
+            },
+            "monthly": [],
+        }
@@ -0,0 +1,83 @@
+"""
+Unit tests for streaming export routes.
+"""
+import csv
+import gzip
+import io
+import json
+from datetime import date
+
+from fastapi import status
+
+from app.models import Activity
+
+
+def add_activities(db_session, user, parcel, count):
+    for i in range(count):
+        db_session.add(
+            Activity(
+                type="Irrigation",
+                date=date(2024, 1, 1 + i),
+                description=f"Run {i}",
+                user_id=user.id,
+                parcel_id=parcel.id,
+            )
+        )
+    db_session.commit()
+
+
+class TestExportRoutes:
+    """Test NDJSON/CSV table exports."""
+
+    def test_export_ndjson(self, client, db_session, sample_user, sample_parcel):
+        """Test exporting a table as newline-delimited JSON."""
+        add_activities(db_session, sample_user, sample_parcel, 3)
+
+        response = client.get("/export/activities")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["description"] for row in rows] == ["Run 0", "Run 1", "Run 2"]
+        assert rows[0]["date"] == "2024-01-01"
+        assert rows[0]["parcel_id"] == sample_parcel.id
+
+    def test_export_csv(self, client, db_session, sample_user, sample_parcel):
+        """Test exporting a table as CSV with a header line."""
+        add_activities(db_session, sample_user, sample_parcel, 2)
+
+        response = client.get("/export/activities", params={"format": "csv"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'filename="activities.csv"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["description"] for row in rows] == ["Run 0", "Run 1"]
+
+    def test_export_empty_csv_has_header(self, client):
+        """Test that an empty table still yields the CSV header."""
+        response = client.get("/export/transactions", params={"format": "csv"})
+
+        assert response.text.splitlines()[0].startswith("id,")
+
+    def test_export_gzip_with_date_filter(
+        self, client, db_session, sample_user, sample_parcel
+    ):
+        """Test gzip output and date filtering."""
+        add_activities(db_session, sample_user, sample_parcel, 5)
+
+        response = client.get(
+            "/export/activities",
+            params={"gzip": True, "date_from": "2024-01-02", "date_to": "2024-01-03"},
+        )
+
+        assert response.headers["content-type"] == "application/gzip"
+        lines = gzip.decompress(response.content).decode().splitlines()
+        assert [json.loads(line)["date"] for line in lines] == [
+            "2024-01-02",
+            "2024-01-03",
+        ]
+
+    def test_export_unknown_table(self, client):
+        """Test that only exportable tables are accepted."""
+        response = client.get("/export/users")
+        assert response.status_code == 422
@@ -0,0 +1,89 @@
+"""
+Unit tests for the terrain and parcel GeoJSON routes.
+"""
+import json
+
+from fastapi import status
+
+from app.models import Location, Parcel
+
+SQUARE = {
+    "type": "Polygon",
+    "coordinates": [[[-74.68, 5.49], [-74.67, 5.49], [-74.67, 5.5], [-74.68, 5.49]]],
+}
+
+
+def add_location(db_session, geometry=SQUARE):
+    location = Location(type="polygon", coordinates=json.dumps(geometry))
+    db_session.add(location)
+    db_session.flush()
+    return location
+
+
+class TestGeoJSONRoutes:
+    """Test the FeatureCollection endpoints used by the map."""
+
+    def test_terrain_features(self, client, db_session, sample_terrain):
+        """Test that terrains come back as features with their fields."""
+        sample_terrain.location_id = add_location(db_session).id
+        db_session.commit()
+
+        response = client.get("/terrains/geojson")
+        assert response.status_code == status.HTTP_200_OK
+        collection = response.json()
+        assert collection["type"] == "FeatureCollection"
+        [feature] = collection["features"]
+        assert feature["type"] == "Feature"
+        assert feature["id"] == f"terrain-{sample_terrain.id}"
+        assert feature["properties"]["id"] == sample_terrain.id
+        assert feature["geometry"] == SQUARE
+        assert feature["properties"]["kind"] == "terrain"
+        assert feature["properties"]["name"] == sample_terrain.name
+
+    def test_terrain_with_parcels_in_one_response(
+        self, client, db_session, sample_terrain, sample_parcel, assert_max_queries
+    ):
+        """Test that a terrain and its parcels load with one query each."""
+        sample_terrain.location_id = add_location(db_session).id
+        sample_parcel.location_id = add_location(db_session).id
+        other = Parcel(name="No location", status="active", terrain_id=sample_terrain.id)
+        db_session.add(other)
+        db_session.commit()
+        params = {"terrain_id": sample_terrain.id, "include_parcels": True}
+
+        with assert_max_queries(2):
+            response = client.get("/terrains/geojson", params=params)
+        features = response.json()["features"]
+        assert [f["properties"]["kind"] for f in features] == ["terrain", "parcel"]
+        # The terrain and the parcel share their id, not their feature id
+        assert sample_parcel.id == sample_terrain.id
+        assert [f["id"] for f in features] == [
+            f"terrain-{sample_terrain.id}",
+            f"parcel-{sample_parcel.id}",
+        ]
+        parcel = features[1]["properties"]
+        assert parcel["name"] == sample_parcel.name
+        assert parcel["status"] == sample_parcel.status
+        assert parcel["current_use"] == sample_parcel.current_use
+        assert parcel["terrain_id"] == sample_terrain.id
+
+    def test_parcel_features_by_terrain(
+        self, client, db_session, sample_terrain, sample_parcel
+    ):
+        """Test filtering parcel features by terrain."""
+        sample_parcel.location_id = add_location(db_session).id
+        db_session.commit()
+
+        features = client.get(
+            "/parcels/geojson", params={"terrain_id": sample_terrain.id}
+        ).json()["features"]
+        assert [f["id"] for f in features] == [f"parcel-{sample_parcel.id}"]
+
+        other = client.get("/parcels/geojson", params={"terrain_id": 9999})
+        assert other.status_code == status.HTTP_200_OK
+        assert other.json()["features"] == []
+
+    def test_geojson_route_not_shadowed(self, client):
+        """Test that /geojson is not taken for a terrain or parcel id."""
+        assert client.get("/terrains/geojson").status_code == status.HTTP_200_OK
+        assert client.get("/parcels/geojson").status_code == status.HTTP_200_OK
@@ -0,0 +1,153 @@
+"""
+Unit tests for parcel routes.
+"""
+from datetime import date, timedelta
+
+import pandas as pd
+from fastapi import status
+
+from app.activity_summary import refresh_parcel_summaries
+from app.models import Activity, Parcel
+from app.parcel_status import query_parcel_statuses
+from app.utils import evaluate_parcel_status
+
+
+def add_parcel_with_activities(db_session, terrain, user, name, activities):
+    """Create a parcel with (days_ago, type) activities."""
+    parcel = Parcel(name=name, terrain_id=terrain.id)
+    db_session.add(parcel)
+    db_session.flush()
+    today = date.today()
+    for days_ago, activity_type in activities:
+        db_session.add(
+            Activity(
+                type=activity_type,
+                date=today - timedelta(days=days_ago),
+                user_id=user.id,
+                parcel_id=parcel.id,
+            )
+        )
+    refresh_parcel_summaries(db_session, [parcel.id])
+    db_session.commit()
+    return parcel
+
+
+class TestParcelStatusRoutes:
+    """Test the SQL-side parcel status endpoint."""
+
+    def test_get_parcel_statuses_empty(self, client):
+        """Test that no activities give no statuses."""
+        response = client.get("/parcels/status")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "statuses": {},
+            "summary": {"Optimal": 0, "Attention": 0, "Critical": 0},
+        }
+
+    def test_get_parcel_statuses(self, client, db_session, sample_terrain, sample_user):
+        """Test statuses and summary computed by the database."""
+        busy = add_parcel_with_activities(
+            db_session,
+            sample_terrain,
+            sample_user,
+            "Busy",
+            [(0, "Harvest"), (1, "Irrigation"), (3, "Irrigation"), (30, "Sowing")],
+        )
+        pending = add_parcel_with_activities(
+            db_session, sample_terrain, sample_user, "Pending", [(8, "Milking")]
+        )
+        idle = add_parcel_with_activities(
+            db_session, sample_terrain, sample_user, "Idle", [(40, "Harvest")]
+        )
+
+        response = client.get("/parcels/status")
+        assert response.status_code == status.HTTP_200_OK
+
+        data = response.json()
+        assert data["statuses"] == {
+            str(busy.id): [
+                "Active",
+                "Recently harvested",
+                "High task load",
+                "Has productivity",
+            ],
+            str(pending.id): ["Pending intervention", "Has productivity"],
+            str(idle.id): ["Inactive", "Has productivity"],
+        }
+        assert data["summary"] == {"Optimal": 1, "Attention": 1, "Critical": 1}
+
+    def test_spanish_activity_types(
+        self, client, db_session, sample_terrain, sample_user
+    ):
+        """Test that Cosecha, Ordeño and Pesaje count like their English types."""
+        harvested = add_parcel_with_activities(
+            db_session,
+            sample_terrain,
+            sample_user,
+            "Cosecha",
+            [(0, "Cosecha"), (10, "Harvest")],
+        )
+        milked = add_parcel_with_activities(
+            db_session, sample_terrain, sample_user, "Ordeño", [(8, "Ordeño")]
+        )
+        weighed = add_parcel_with_activities(
+            db_session, sample_terrain, sample_user, "Pesaje", [(8, "Pesaje")]
+        )
+
+        statuses = client.get("/parcels/status").json()["statuses"]
+        assert statuses[str(harvested.id)] == [
+            "Active",
+            "Recently harvested",
+            "Has productivity",
+        ]
+        assert statuses[str(milked.id)] == ["Pending intervention", "Has productivity"]
+        assert statuses[str(weighed.id)] == ["Pending intervention", "Has productivity"]
+
+    def test_list_parcel_activity_summaries(
+        self, client, db_session, sample_terrain, sample_user
+    ):
+        """Test the per-parcel activity summary endpoint."""
+        parcel = add_parcel_with_activities(
+            db_session,
+            sample_terrain,
+            sample_user,
+            "Busy",
+            [(0, "Harvest"), (2, "Irrigation"), (10, "Irrigation"), (60, "Harvest")],
+        )
+
+        response = client.get("/parcels/activity-summary", params={"days": 7})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "parcel_id": parcel.id,
+                "last_activity_date": date.today().isoformat(),
+                "last_harvest_date": date.today().isoformat(),
+                "activity_count": 4,
+                "recent_activity_count": 2,
+                "type_counts": {"Harvest": 2, "Irrigation": 2},
+            }
+        ]
+
+    def test_activity_summary_window_limit(self, client):
+        """Test that windows longer than the stored daily counts are rejected."""
+        response = client.get("/parcels/activity-summary", params={"days": 365})
+        assert response.status_code == 422
+
+    def test_matches_pandas_evaluation(self, db_session, sample_terrain, sample_user):
+        """Test that the SQL rules agree with evaluate_parcel_status."""
+        types = ["Harvest", "Irrigation", "Weighing", "Sowing"]
+        for i in range(12):
+            add_parcel_with_activities(
+                db_session,
+                sample_terrain,
+                sample_user,
+                f"Parcel {i}",
+                [((i * j) % 13, types[(i + j) % 4]) for j in range(i % 5 + 1)],
+            )
+
+        rows = db_session.query(Activity.parcel_id, Activity.date, Activity.type)
+        activities_df = pd.DataFrame([row._asdict() for row in rows])
+
+        assert query_parcel_statuses(db_session) == evaluate_parcel_status(
+            activities_df
+        )
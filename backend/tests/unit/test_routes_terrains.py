@@ -11,7 +11,7 @@ class TestTerrainRoutes:
         """Test getting terrains when none exist."""
         response = client.get("/terrains/")
         assert response.status_code == status.HTTP_200_OK
-        assert response.json() == []
+        assert response.json() == {"items": [], "next_cursor": None}
     
     def test_create_terrain(self, client, sample_user):
         """Test creating a new terrain."""
@@ -35,7 +35,7 @@ class TestTerrainRoutes:
         response = client.get("/terrains/")
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
+        data = response.json()["items"]
         assert len(data) == 1
         assert data[0]["name"] == sample_terrain.name
         assert data[0]["id"] == sample_terrain.id
@@ -237,3 +237,83 @@ class TestConversionUtilities:
         # Pounds to kilograms (approximate)
         result = convert_weight_units(1, "lb", "kg")
         assert 0.45 < result < 0.46
+
+
+class TestParcelStatus:
+    """Test vectorized parcel status evaluation."""
+
+    def test_statuses(self):
+        """Test each status flag on a small activity set."""
+        import pandas as pd
+
+        from app.utils import evaluate_parcel_status
+
+        today = pd.Timestamp.today().normalize()
+        df = pd.DataFrame(
+            {
+                "parcel_id": [1, 1, 1, 2, 3, 3],
+                "date": [
+                    today,
+                    today - timedelta(days=1),
+                    today - timedelta(days=2),
+                    today - timedelta(days=7),
+                    today - timedelta(days=20),
+                    "not a date",
+                ],
+                "type": [
+                    "Harvest",
+                    "Irrigation",
+                    "Irrigation",
+                    "Sowing",
+                    "Milking",
+                    "X",
+                ],
+            }
+        )
+
+        assert evaluate_parcel_status(df) == {
+            1: ["Active", "Recently harvested", "High task load", "Has productivity"],
+            2: ["Pending intervention"],
+            3: ["Inactive", "Has productivity"],
+        }
+
+    def test_spanish_activity_types(self):
+        """Test that Spanish harvest and productive types are recognized."""
+        import pandas as pd
+
+        from app.utils import evaluate_parcel_status
+
+        today = pd.Timestamp.today().normalize()
+        df = pd.DataFrame(
+            {
+                "parcel_id": [1, 2, 3],
+                "date": [today, today - timedelta(days=10), today],
+                "type": ["Cosecha", "Ordeño", "Pesaje"],
+            }
+        )
+
+        assert evaluate_parcel_status(df) == {
+            1: ["Active", "Recently harvested", "Has productivity"],
+            2: ["Pending intervention", "Has productivity"],
+            3: ["Active", "Has productivity"],
+        }
+
+    def test_empty(self):
+        """Test that no activities give no statuses."""
+        import pandas as pd
+
+        from app.utils import evaluate_parcel_status
+
+        assert evaluate_parcel_status(pd.DataFrame()) == {}
+
+    def test_matches_per_parcel_loop(self):
+        """Test that the vectorized result equals the previous loop."""
+        from app.utils import evaluate_parcel_status
+        from benchmarks.parcel_status import (
+            evaluate_parcel_status_loop,
+            make_activities,
+        )
+
+        df = make_activities(parcels=200, activities=5000)
+
+        assert evaluate_parcel_status(df) == evaluate_parcel_status_loop(df)
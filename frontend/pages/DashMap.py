@@ -1,12 +1,12 @@
 import streamlit as st
 from streamlit_folium import st_folium
-from utils.data_loader import load_data
-from utils.parcel_status import evaluate_parcel_status
+from utils.data_loader import load_data, load_map_features, load_parcel_statuses
 from utils.map_rendering import create_base_map, add_terrain_polygons, add_parcel_polygons_and_markers
 from utils.click_detection import process_map_click
 from utils.status_utils import convert_status_to_display
 from utils.sidebar_components import render_complete_sidebar
 from utils.details_panel import render_details_panel
+from utils.http_client import get_backend_client
 
 st.set_page_config(page_title="AgroVista - Terrain Management", layout="wide")
 
@@ -19,15 +19,16 @@ if 'selected_parcel' not in st.session_state:
     st.session_state.selected_parcel = None
 
 # --- Load data from backend ---
-df_activities, parcels_df, terrains_df, parcel_ids = load_data()
+# The snapshot, the parcel statuses and the map geometries are independent: fetch them in parallel
+data, statuses, (terrain_features, parcel_features) = get_backend_client().fetch_many(
+    lambda load: load(), [load_data, load_parcel_statuses, load_map_features]
+)
+df_activities, parcels_df, terrains_df, parcel_ids = data
 
 # Convert dataframes to lists for easier handling
 terrains = terrains_df.to_dict('records') if not terrains_df.empty else []
 all_parcels = parcels_df.to_dict('records') if not parcels_df.empty else []
 
-# Evaluate parcel statuses
-statuses = evaluate_parcel_status(df_activities) if not df_activities.empty else {}
-
 # --- SIDEBAR ---
 render_complete_sidebar(statuses)
 
@@ -39,8 +40,8 @@ with col1:
     
     # Create and populate map
     m = create_base_map()
-    add_terrain_polygons(m, terrains_df, st.session_state.selected_terrain)
-    add_parcel_polygons_and_markers(m, parcels_df, statuses, convert_status_to_display, st.session_state.selected_parcel)
+    add_terrain_polygons(m, terrain_features, st.session_state.selected_terrain)
+    add_parcel_polygons_and_markers(m, parcel_features, statuses, convert_status_to_display, st.session_state.selected_parcel)
     
     # Display map
     map_data = st_folium(
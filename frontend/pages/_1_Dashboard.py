@@ -1,30 +1,28 @@
 import streamlit as st
-import requests
 import pandas as pd
+from utils.http_client import get_backend_client
 
-BACKEND_URL = "http://localhost:8000"  # Change if your backend is on a different host/port
+client = get_backend_client()  # Backend URL from the BACKEND_URL environment variable
 st.title("AgroVista Dashboard")
 
 # --- Safe function to get data ---
-def safe_get(url):
+def safe_get(endpoint):
+    """Get every item of a paginated list endpoint, or the error that prevented it."""
     try:
-        resp = requests.get(url)
-        resp.raise_for_status()
-        return resp.json()
+        return client.get_all_pages(endpoint), None
     except Exception as e:
-        st.error(f"Could not connect to {url}: {e}")
-        return []
+        return [], e
 
-# --- 1. Get parcel data ---
-parcels = safe_get(f"{BACKEND_URL}/parcels/")
+# --- Get parcels, indicators and transactions in parallel ---
+endpoints = ["/parcels/", "/control/indicators/", "/economy/transactions/"]
+results = client.fetch_many(safe_get, endpoints)
+# Streamlit elements can only be created from the script thread
+for endpoint, (_, error) in zip(endpoints, results):
+    if error is not None:
+        st.error(f"Could not connect to {client.url(endpoint)}: {error}")
+(parcels, _), (indicators, _), (transactions, _) = results
 df_parcels = pd.DataFrame(parcels)
-
-# --- 2. Get indicators ---
-indicators = safe_get(f"{BACKEND_URL}/control/indicators/")
 df_indicators = pd.DataFrame(indicators)
-
-# --- 3. Get transactions ---
-transactions = safe_get(f"{BACKEND_URL}/economy/transactions/")
 df_transactions = pd.DataFrame(transactions)
 
 # --- KPIs: Parcels by status ---
@@ -33,7 +33,8 @@ with tab1:
     with col2:
         st.markdown("#### Budget Summary")
         try:
-            budget = api_client.get_budget_summary()
+            overview = api_client.get_economy_overview(pd.Timestamp.today().year)
+            budget = overview["summary"] if overview else None
             if budget:
                 for key, value in budget.items():
                     if isinstance(value, (int, float)):
@@ -72,9 +73,8 @@ with tab2:
                 # Get parcels for this terrain
                 terrain_parcels = parcels_df[parcels_df['terrain_id'] == selected_terrain_id]
                 if not terrain_parcels.empty:
-                    terrain_parcel_ids = terrain_parcels['id'].tolist()
                     st.markdown(f"#### Budget Analysis for Terrain: {selected_terrain_name}")
-                    show_budget_vs_execution_terrain(terrain_parcel_ids)
+                    show_budget_vs_execution_terrain(selected_terrain_id)
                 else:
                     st.info(f"No parcels found for terrain: {selected_terrain_name}")
         else:
@@ -3,5 +3,6 @@ Utilities package for AgroVista frontend
 """
 
 from .api_client import APIClient, get_api_client
+from .http_client import BackendClient, get_backend_client
 
-__all__ = ['APIClient', 'get_api_client']
\ No newline at end of file
+__all__ = ['APIClient', 'get_api_client', 'BackendClient', 'get_backend_client']
\ No newline at end of file
@@ -5,28 +5,62 @@ Centralized module for all backend API requests
 
 import requests
 import streamlit as st
-from typing import Optional, Dict, List
+from typing import Callable, Iterable, Optional, Dict, List
+
+from .http_client import BACKEND_URL, BackendClient, get_backend_client
+
+PAGE_SIZE = 1000  # Largest page the backend serves
 
 
 class APIClient:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = BACKEND_URL, http: Optional[BackendClient] = None):
         self.base_url = base_url.rstrip('/')
+        # The shared pooled client unless another backend URL is requested
+        if http is None:
+            shared = get_backend_client()
+            http = shared if shared.base_url == self.base_url else BackendClient(self.base_url)
+        self.http = http
         
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict]:
         """Make HTTP request to backend API"""
-        url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.request(method, url, **kwargs)
+            if method.upper() == "GET":
+                # Cached, and revalidated once its TTL has passed
+                return self.http.get_json(endpoint, **kwargs)
+            # Successful writes invalidate the cached reads they affect
+            response = self.http.request(method, endpoint, **kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             st.error(f"API request failed: {e}")
             return None
     
+    def _get_all_pages(self, endpoint: str, params: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """Collect every item of a paginated list endpoint by following next_cursor"""
+        params = {**(params or {}), "limit": PAGE_SIZE}
+        items = []
+        while True:
+            page = self._make_request("GET", endpoint, params=params)
+            if page is None:
+                return None
+            items += page["items"]
+            if page.get("next_cursor") is None:
+                return items
+            params["after"] = page["next_cursor"]
+    
+    def fetch_many(self, func: Callable, args: Iterable) -> List:
+        """
+        Run independent requests concurrently, e.g. fetch_many(self.get_location, ids).
+        
+        The calls run in worker threads, where Streamlit elements (such as the
+        st.error of failed requests) are not displayed.
+        """
+        return self.http.fetch_many(func, args)
+    
     # Terrain endpoints
     def get_terrains(self) -> Optional[List[Dict]]:
         """Get all terrains using working endpoint"""
-        return self._make_request("GET", "/terrains")
+        return self._get_all_pages("/terrains/")
     
     def get_terrain_by_id(self, terrain_id: int) -> Optional[Dict]:
         """Get terrain by ID"""
@@ -52,7 +86,11 @@ class APIClient:
             endpoint = f"/parcels/by-terrain/{terrain_id}"
         else:
             endpoint = "/parcels/"
-        return self._make_request("GET", endpoint)
+        return self._get_all_pages(endpoint)
+    
+    def get_parcel_statuses(self) -> Optional[Dict]:
+        """Get parcel statuses and their Optimal/Attention/Critical summary"""
+        return self._make_request("GET", "/parcels/status")
     
     def get_parcel_by_id(self, parcel_id: int) -> Optional[Dict]:
         """Get parcel by ID"""
@@ -78,7 +116,7 @@ class APIClient:
             endpoint = f"/activities/by-parcel/{parcel_id}"
         else:
             endpoint = "/activities/"
-        return self._make_request("GET", endpoint)
+        return self._get_all_pages(endpoint)
     
     def create_activity(self, activity_data: Dict) -> Optional[Dict]:
         """Create new activity"""
@@ -87,11 +125,31 @@ class APIClient:
     # Economy endpoints
     def get_transactions(self) -> Optional[List[Dict]]:
         """Get all transactions"""
-        return self._make_request("GET", "/economy/transactions/")
+        return self._get_all_pages("/economy/transactions/")
     
     def get_budget_summary(self) -> Optional[Dict]:
         """Get budget summary - returns list of budgets"""
-        return self._make_request("GET", "/economy/budgets/")
+        return self._get_all_pages("/economy/budgets/")
+    
+    def get_budget_comparison(self, year: int, terrain_id: Optional[int] = None,
+                              parcel_ids: Optional[List[int]] = None) -> Optional[List[Dict]]:
+        """Get budget vs execution by category, summed over a terrain or a list of parcels"""
+        params = {"year": year}
+        if terrain_id:
+            params["terrain_id"] = terrain_id
+        if parcel_ids:
+            params["parcel_ids"] = parcel_ids
+        return self._make_request("GET", "/economy/comparison/", params=params)
+    
+    def get_economy_overview(self, year: int, parcel_id: Optional[int] = None,
+                             category: Optional[str] = None) -> Optional[Dict]:
+        """Get budget comparison, global summary and monthly expenses in one request"""
+        params = {"year": year}
+        if parcel_id:
+            params["parcel_id"] = parcel_id
+        if category:
+            params["category"] = category
+        return self._make_request("GET", "/economy/overview/", params=params)
     
     # Chat endpoints
     def send_chat_message(self, message: str) -> Optional[Dict]:
@@ -122,19 +180,18 @@ class APIClient:
         """Get dashboard statistics"""
         return self._make_request("GET", "/control/dashboard-stats")
     
-    def get_terrain_geojson(self, terrain_id: Optional[int] = None) -> Optional[Dict]:
-        """Get terrain geometries as GeoJSON"""
-        endpoint = "/terrenos/geojson"
+    def get_terrain_geojson(self, terrain_id: Optional[int] = None,
+                            include_parcels: bool = False) -> Optional[Dict]:
+        """Get terrain geometries (and optionally their parcels') as a GeoJSON FeatureCollection"""
+        params = {"include_parcels": include_parcels}
         if terrain_id:
-            endpoint += f"/{terrain_id}"
-        return self._make_request("GET", endpoint)
+            params["terrain_id"] = terrain_id
+        return self._make_request("GET", "/terrains/geojson", params=params)
     
     def get_parcel_geojson(self, terrain_id: Optional[int] = None) -> Optional[Dict]:
-        """Get parcel geometries as GeoJSON"""
-        endpoint = "/parcelas/geojson"
-        if terrain_id:
-            endpoint += f"?terrain_id={terrain_id}"
-        return self._make_request("GET", endpoint)
+        """Get parcel geometries as a GeoJSON FeatureCollection"""
+        params = {"terrain_id": terrain_id} if terrain_id else {}
+        return self._make_request("GET", "/parcels/geojson", params=params)
     
     def get_location(self, location_id: int) -> Optional[Dict]:
         """Get location by ID"""
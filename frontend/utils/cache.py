@@ -0,0 +1,138 @@
+"""
+Response cache for AgroVista backend reads
+Per-resource TTLs, ETag revalidation and invalidation on writes
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+# Resource of each endpoint, by path prefix (most specific first)
+ENDPOINT_RESOURCES = [
+    ("/parcels/status", "parcel_statuses"),
+    ("/terrains/geojson", "geometries"),
+    ("/parcels/geojson", "geometries"),
+    ("/bootstrap", "bootstrap"),
+    ("/api/v1/terrains", "terrains"),
+    ("/terrains", "terrains"),
+    ("/terrenos", "terrains"),
+    ("/parcels", "parcels"),
+    ("/parcelas", "parcels"),
+    ("/activities", "activities"),
+    ("/actividades", "activities"),
+    ("/locations", "locations"),
+    ("/economy", "economy"),
+    ("/control", "indicators"),
+    ("/simulation", "simulation"),
+]
+
+# Seconds a response is used without asking the backend again
+RESOURCE_TTLS = {
+    "locations": 3600,  # Geometries rarely change
+    "geometries": 300,
+    "terrains": 300,
+    "parcels": 300,
+    "indicators": 120,
+    "bootstrap": 60,
+    "parcel_statuses": 60,
+    "activities": 60,
+    "economy": 60,
+    "simulation": 60,
+}
+DEFAULT_TTL = 30
+
+# Cached resources built from others, dropped along with them
+DEPENDENT_RESOURCES = {
+    "terrains": {"bootstrap", "geometries"},
+    "parcels": {"bootstrap", "parcel_statuses", "geometries"},
+    "activities": {"bootstrap", "parcel_statuses"},
+    "locations": {"bootstrap", "geometries"},
+}
+
+
+def resource_of(endpoint: str) -> str:
+    """Resource an endpoint reads or writes, e.g. "/parcels/3" -> "parcels" """
+    for prefix, resource in ENDPOINT_RESOURCES:
+        if endpoint.startswith(prefix):
+            return resource
+    return endpoint.strip('/').split('/')[0] or "root"
+
+
+def cache_key(endpoint: str, params: Optional[Dict] = None) -> Tuple:
+    """Key of a GET request: its endpoint and sorted query parameters"""
+    items = ((name, tuple(value) if isinstance(value, list) else value)
+             for name, value in (params or {}).items())
+    return endpoint, tuple(sorted(items))
+
+
+class CacheEntry:
+    """A cached JSON body with the ETag to revalidate it"""
+
+    def __init__(self, resource: str, value: Any, etag: Optional[str] = None):
+        self.resource = resource
+        self.value = value
+        self.etag = etag
+        self.fetched_at = time.monotonic()
+
+    def is_fresh(self) -> bool:
+        """Whether the entry is younger than its resource's TTL"""
+        ttl = RESOURCE_TTLS.get(self.resource, DEFAULT_TTL)
+        return time.monotonic() - self.fetched_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers, empty when the backend sent no ETag"""
+        return {"If-None-Match": self.etag} if self.etag else {}
+
+    def touch(self):
+        """Restart the TTL after the backend confirmed the body (304)"""
+        self.fetched_at = time.monotonic()
+
+
+class ResponseCache:
+    """
+    Thread-safe cache of GET responses.
+
+    Lives for the whole Streamlit process, so reruns and sessions reuse
+    the same bodies. Cached values are shared: treat them as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, CacheEntry] = {}
+
+    def get(self, key: Tuple) -> Optional[CacheEntry]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Tuple, value: Any, etag: Optional[str] = None) -> CacheEntry:
+        entry = CacheEntry(resource_of(key[0]), value, etag)
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def invalidate(self, resources: Iterable[str]) -> int:
+        """
+        Drop the entries of some resources and of the resources built from them.
+
+        Args:
+            resources: Resources that changed, e.g. ["activities"]
+
+        Returns:
+            Number of entries dropped
+        """
+        stale: Set[str] = set()
+        for resource in resources:
+            stale |= {resource, *DEPENDENT_RESOURCES.get(resource, ())}
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.resource in stale]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def invalidate_endpoint(self, endpoint: str) -> int:
+        """Drop what a successful write to an endpoint made stale"""
+        return self.invalidate([resource_of(endpoint)])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -3,7 +3,7 @@ Click detection utilities for map interactions
 """
 
 from typing import Dict, List, Tuple, Optional
-from .geospatial import get_location_coordinates
+from .geospatial import geometry_to_latlon, get_location_coordinates
 
 
 def point_in_polygon(point_lat: float, point_lng: float, polygon_coords: List[List[float]]) -> bool:
@@ -65,6 +65,19 @@ def extract_click_coordinates(map_data: Dict) -> Optional[Tuple[float, float]]:
     return (clicked_lat, clicked_lng) if clicked_lat and clicked_lng else None
 
 
+def item_coordinates(item: Dict) -> Optional[List[List[float]]]:
+    """
+    Polygon of a terrain or parcel as [lat, lon] pairs
+    
+    Uses the "geometry" loaded with the item (see load_data), and only
+    fetches its location when there is none.
+    """
+    coords = geometry_to_latlon(item.get('geometry'))
+    if coords is None and item.get('location_id') and 'geometry' not in item:
+        coords = get_location_coordinates(item['location_id'])
+    return coords
+
+
 def detect_clicked_parcel(click_coords: Tuple[float, float], parcels: List[Dict]) -> Optional[Dict]:
     """
     Detect which parcel was clicked based on coordinates
@@ -79,10 +92,9 @@ def detect_clicked_parcel(click_coords: Tuple[float, float], parcels: List[Dict]
     clicked_lat, clicked_lng = click_coords
     
     for parcel in parcels:
-        if parcel.get('location_id'):
-            coords = get_location_coordinates(parcel['location_id'])
-            if coords and point_in_polygon(clicked_lat, clicked_lng, coords):
-                return parcel
+        coords = item_coordinates(parcel)
+        if coords and point_in_polygon(clicked_lat, clicked_lng, coords):
+            return parcel
     return None
 
 
@@ -100,10 +112,9 @@ def detect_clicked_terrain(click_coords: Tuple[float, float], terrains: List[Dic
     clicked_lat, clicked_lng = click_coords
     
     for terrain in terrains:
-        if terrain.get('location_id'):
-            coords = get_location_coordinates(terrain['location_id'])
-            if coords and point_in_polygon(clicked_lat, clicked_lng, coords):
-                return terrain
+        coords = item_coordinates(terrain)
+        if coords and point_in_polygon(clicked_lat, clicked_lng, coords):
+            return terrain
     return None
 
 
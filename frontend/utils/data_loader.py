@@ -3,64 +3,94 @@ Data loading utilities for AgroVista frontend
 """
 
 import pandas as pd
-import requests
-from typing import Tuple, Dict
+from typing import Tuple, Dict, List
+
+from .http_client import get_backend_client
+
+
+def table_to_df(table: Dict) -> pd.DataFrame:
+    """
+    Build a DataFrame from a bootstrap table.
+    
+    Args:
+        table: Dictionary with "columns" and "rows"
+        
+    Returns:
+        DataFrame with one row per table row
+    """
+    return pd.DataFrame(table["rows"], columns=table["columns"])
 
 
 def load_data() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict[str, int]]:
     """
-    Load all necessary data from backend using working endpoints.
+    Load all necessary data from the backend bootstrap endpoint.
+    
+    Terrains, parcels, recent activities and their locations come back in
+    a single request. Parcels and terrains get a "geometry" column with the
+    GeoJSON of their location (None without one).
     
     Returns:
         Tuple of (activities_df, parcels_df, terrains_df, parcel_name_to_id_map)
     """
-    base_url = "http://localhost:8000"
-    
-    # Load terrains using working endpoint
     try:
-        response = requests.get(f"{base_url}/terrains")
-        response.raise_for_status()
-        terrains = response.json() or []
+        snapshot = get_backend_client().get_json("/bootstrap/")
     except Exception as e:
-        print(f"Error getting terrains: {e}")
+        print(f"Error getting bootstrap data: {e}")
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}
-    
-    # Load parcels for all terrains using working endpoint
-    parcels = []
-    for terrain in terrains:
-        try:
-            response = requests.get(f"{base_url}/parcels/by-terrain/{terrain['id']}")
-            response.raise_for_status()
-            terrain_parcels = response.json() or []
-            parcels += terrain_parcels
-        except Exception as e:
-            print(f"Error getting parcels for terrain {terrain['id']}: {e}")
 
-    # Load activities for all parcels using working endpoint
-    activities = []
-    for parcel in parcels:
-        try:
-            response = requests.get(f"{base_url}/activities/by-parcel/{parcel['id']}")
-            response.raise_for_status()
-            parcel_activities = response.json() or []
-            for act in parcel_activities:
-                act["name"] = parcel["name"]
-            activities += parcel_activities
-        except Exception as e:
-            print(f"Error getting activities for parcel {parcel['id']}: {e}")
+    terrains_df = table_to_df(snapshot["terrains"])
+    parcels_df = table_to_df(snapshot["parcels"])
+    activities_df = table_to_df(snapshot["activities"])
+    locations_df = table_to_df(snapshot["locations"])
+
+    geometries = dict(zip(locations_df["id"], locations_df["coordinates"])) if not locations_df.empty else {}
+    for df in (terrains_df, parcels_df):
+        df["geometry"] = df["location_id"].map(geometries) if not df.empty else None
 
-    # Create DataFrames
-    activities_df = pd.DataFrame(activities)
     if not activities_df.empty:
+        # Activities are labelled with their parcel's name
+        parcel_names = dict(zip(parcels_df["id"], parcels_df["name"]))
+        activities_df["name"] = activities_df["parcel_id"].map(parcel_names)
         activities_df["date"] = pd.to_datetime(activities_df["date"], errors="coerce")
-        
-    parcels_df = pd.DataFrame(parcels)
-    terrains_df = pd.DataFrame(terrains)
     
     # Create parcel name to ID mapping
     parcel_ids = {}
     if not parcels_df.empty:
-        parcel_ids = {row["name"]: row["id"] for _, row in parcels_df.iterrows()}
+        parcel_ids = dict(zip(parcels_df["name"], parcels_df["id"]))
     
     return activities_df, parcels_df, terrains_df, parcel_ids
 
+
+def load_parcel_statuses() -> Dict[int, List[str]]:
+    """
+    Load parcel statuses computed by the backend.
+    
+    Returns:
+        Dictionary mapping parcel_id to list of status strings
+    """
+    try:
+        statuses = get_backend_client().get_json("/parcels/status").get("statuses", {})
+    except Exception as e:
+        print(f"Error getting parcel statuses: {e}")
+        return {}
+    # JSON object keys are strings
+    return {int(parcel_id): status for parcel_id, status in statuses.items()}
+
+
+def load_map_features() -> Tuple[List[Dict], List[Dict]]:
+    """
+    Load the terrain and parcel geometries for the map in one request.
+    
+    Returns:
+        Tuple of (terrain_features, parcel_features), GeoJSON Feature dictionaries
+    """
+    try:
+        collection = get_backend_client().get_json("/terrains/geojson", params={"include_parcels": True})
+    except Exception as e:
+        print(f"Error getting map features: {e}")
+        return [], []
+    features = collection["features"]
+    return (
+        [feature for feature in features if feature["properties"]["kind"] == "terrain"],
+        [feature for feature in features if feature["properties"]["kind"] == "parcel"],
+    )
@@ -2,8 +2,25 @@
 Geospatial utilities for AgroVista frontend
 """
 
-import requests
-from typing import Optional, List
+from typing import Dict, Optional, List
+
+from .http_client import get_backend_client
+
+
+def geometry_to_latlon(geometry: Optional[Dict]) -> Optional[List[List[float]]]:
+    """
+    Convert a GeoJSON polygon to Folium coordinates.
+    
+    Args:
+        geometry: GeoJSON geometry, e.g. the "geometry" of a map feature
+        
+    Returns:
+        First ring of the polygon as [lat, lon] pairs, or None if not a polygon
+    """
+    if not isinstance(geometry, dict) or geometry.get('type') != 'Polygon':
+        return None
+    # GeoJSON positions are [lon, lat]
+    return [[coord[1], coord[0]] for coord in geometry['coordinates'][0]]
 
 
 def get_location_coordinates(location_id: int) -> Optional[List[List[float]]]:
@@ -17,16 +34,9 @@ def get_location_coordinates(location_id: int) -> Optional[List[List[float]]]:
         List of coordinate pairs [lat, lon] or None if error
     """
     try:
-        response = requests.get(f"http://localhost:8000/locations/{location_id}")
-        response.raise_for_status()
-        location = response.json()
-        
-        # Extract coordinates from GeoJSON format
-        if 'coordinates' in location and location['coordinates']:
-            coords_geojson = location['coordinates']['coordinates'][0]  # Get first ring of polygon
-            # Convert from [lon, lat] to [lat, lon] format for Folium
-            coords_latlon = [[coord[1], coord[0]] for coord in coords_geojson]
-            return coords_latlon
+        location = get_backend_client().get_json(f"/locations/{location_id}")
+        return geometry_to_latlon(location.get('coordinates'))
     except Exception as e:
         print(f"Error fetching coordinates for location {location_id}: {e}")
-    return None
\ No newline at end of file
+    return None
+
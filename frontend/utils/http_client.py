@@ -0,0 +1,147 @@
+"""
+Shared HTTP client for the AgroVista backend
+One keep-alive connection pool, timeouts and retries for every request
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import ResponseCache, cache_key
+
+BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000").rstrip('/')
+CONNECT_TIMEOUT = 3.05  # Seconds to open a connection
+READ_TIMEOUT = 30  # Seconds to wait for the response
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3  # Retries wait 0.3s, 0.6s, 1.2s...
+RETRY_STATUSES = (502, 503, 504)
+MAX_WORKERS = 8  # Requests run at the same time by fetch_many
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BackendClient:
+    """
+    Pooled requests.Session bound to the backend URL.
+
+    Connections are kept alive and reused across requests (and Streamlit
+    reruns). Connection errors and 502/503/504 responses are retried with
+    exponential backoff, except for POST and PATCH, which are not
+    idempotent. Sessions are shared between threads, so fetch_many can run
+    independent requests in parallel.
+
+    GET responses are cached per resource (see utils.cache): within their
+    TTL they are served without a request, then revalidated with the ETag
+    the backend sent. Successful writes drop the cached responses they
+    make stale.
+    """
+
+    def __init__(self, base_url: str = BACKEND_URL, max_retries: int = MAX_RETRIES,
+                 max_workers: int = MAX_WORKERS):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+        self.max_workers = max_workers
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        # One pool per host, with a connection for each concurrent request
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.cache = ResponseCache()
+
+    def url(self, endpoint: str) -> str:
+        """Absolute URL of a backend endpoint"""
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{self.base_url}{endpoint}"
+
+    def request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send a request on the pooled session, with the default timeout"""
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, self.url(endpoint), **kwargs)
+        if method.upper() not in ("GET", "HEAD", "OPTIONS") and response.ok:
+            self.cache.invalidate_endpoint(endpoint)
+        return response
+
+    def get_json(self, endpoint: str, params: Optional[Dict] = None,
+                 use_cache: bool = True, **kwargs) -> Any:
+        """
+        GET an endpoint and decode its JSON body, raising on HTTP errors.
+
+        Args:
+            endpoint: Backend path, e.g. "/parcels/"
+            params: Query parameters
+            use_cache: Serve and store the body in the response cache
+
+        Returns:
+            Decoded body (shared with the cache: do not modify it)
+        """
+        if not use_cache:
+            response = self.request("GET", endpoint, params=params, **kwargs)
+            response.raise_for_status()
+            return response.json()
+
+        key = cache_key(endpoint, params)
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return entry.value
+        headers = {**(entry.validators() if entry else {}), **kwargs.pop("headers", {})}
+        response = self.request("GET", endpoint, params=params, headers=headers, **kwargs)
+        if entry is not None and response.status_code == 304:
+            entry.touch()
+            return entry.value
+        response.raise_for_status()
+        value = response.json()
+        self.cache.put(key, value, response.headers.get("ETag"))
+        return value
+
+    def get_all_pages(self, endpoint: str, params: Optional[Dict] = None,
+                      page_size: int = 1000) -> List[Dict]:
+        """Collect every item of a paginated list endpoint by following next_cursor"""
+        params = {**(params or {}), "limit": page_size}
+        items = []
+        while True:
+            page = self.get_json(endpoint, params=params)
+            items += page["items"]
+            if page.get("next_cursor") is None:
+                return items
+            params["after"] = page["next_cursor"]
+
+    def fetch_many(self, func: Callable[[T], R], args: Iterable[T]) -> List[R]:
+        """
+        Call func on every argument concurrently, at most max_workers at a time.
+
+        Args:
+            func: Function doing one request, e.g. lambda url: client.get_json(url)
+            args: One argument per call
+
+        Returns:
+            Results in the order of args; the first exception is re-raised
+        """
+        args = list(args)
+        if len(args) <= 1:
+            return [func(arg) for arg in args]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(args))) as executor:
+            return list(executor.map(func, args))
+
+
+_client: Optional[BackendClient] = None
+
+
+def get_backend_client() -> BackendClient:
+    """Process-wide BackendClient, created on first use"""
+    global _client
+    if _client is None:
+        _client = BackendClient()
+    return _client
@@ -8,10 +8,17 @@ from collections import Counter
 from typing import Dict, List
 
 
+HARVEST_TYPES = ["Harvest", "Cosecha"]
+PRODUCTIVE_TYPES = ["Harvest", "Cosecha", "Milking", "Ordeño", "Weighing", "Pesaje"]
+
+
 def evaluate_parcel_status(activities_df: pd.DataFrame) -> Dict[int, List[str]]:
     """
     Evaluate parcel status based on activity data.
     
+    Dates are parsed once and every status flag is computed with a single
+    groupby aggregation over all parcels.
+    
     Args:
         activities_df: DataFrame with activity data
         
@@ -22,41 +29,50 @@ def evaluate_parcel_status(activities_df: pd.DataFrame) -> Dict[int, List[str]]:
         return {}
         
     today = pd.Timestamp.today().normalize()
-    parcel_status = {}
+    dates = pd.to_datetime(activities_df["date"], errors="coerce")
+    days_ago = (today - dates).dt.days
+    types = activities_df["type"]
 
-    for parcel_id, group in activities_df.groupby("parcel_id"):
-        group = group.copy()
-        group["date"] = pd.to_datetime(group["date"], errors="coerce")
+    flags = pd.DataFrame({
+        "parcel_id": activities_df["parcel_id"],
+        "days_ago": days_ago,
+        "recent_harvest": types.isin(HARVEST_TYPES) & (days_ago <= 3),
+        "recent_task": dates >= today - timedelta(days=3),
+        "productive": types.isin(PRODUCTIVE_TYPES),
+    })
+    parcels = flags.groupby("parcel_id").agg(
+        days_without_activity=("days_ago", "min"),
+        recently_harvested=("recent_harvest", "any"),
+        recent_tasks=("recent_task", "sum"),
+        has_productivity=("productive", "any"),
+    )
 
-        last_date = group["date"].max()
-        if pd.isna(last_date):
+    parcel_status = {}
+    for parcel_id, days, harvested, recent_tasks, productive in zip(
+        parcels.index.tolist(),
+        parcels["days_without_activity"].tolist(),
+        parcels["recently_harvested"].tolist(),
+        parcels["recent_tasks"].tolist(),
+        parcels["has_productivity"].tolist(),
+    ):
+        # No valid activity date at all
+        if pd.isna(days):
             parcel_status[parcel_id] = ["Inactive"]
             continue
-            
-        days_without_activity = (today - last_date).days
-        status = []
 
         # Activity recency status
-        if days_without_activity <= 5:
-            status.append("Active")
-        elif days_without_activity <= 10:
-            status.append("Pending intervention")
+        if days <= 5:
+            status = ["Active"]
+        elif days <= 10:
+            status = ["Pending intervention"]
         else:
-            status.append("Inactive")
-
-        # Recent harvest check
-        if "Harvest" in group["type"].tolist() or "Cosecha" in group["type"].tolist():
-            harvest_dates = group[group["type"].isin(["Harvest", "Cosecha"])]["date"]
-            if any((today - harvest_dates).dt.days <= 3):
-                status.append("Recently harvested")
+            status = ["Inactive"]
 
-        # High task load check
-        recent_tasks = group[group["date"] >= today - timedelta(days=3)]
-        if len(recent_tasks) >= 3:
+        if harvested:
+            status.append("Recently harvested")
+        if recent_tasks >= 3:
             status.append("High task load")
-
-        # Productivity check
-        if group["type"].isin(["Harvest", "Cosecha", "Milking", "Ordeño", "Weighing", "Pesaje"]).any():
+        if productive:
             status.append("Has productivity")
 
         parcel_status[parcel_id] = status
@@ -5,40 +5,31 @@ Visualization utilities for AgroVista frontend
 import streamlit as st
 import altair as alt
 import pandas as pd
-from typing import List, Optional
+from typing import Optional
 from .api_client import get_api_client
 
 
-def show_budget_vs_execution_terrain(parcel_ids: List[int]):
+def show_budget_vs_execution_terrain(terrain_id: int):
     """
-    Show budget vs execution comparison for multiple parcels (terrain level).
+    Show budget vs execution comparison for all parcels of a terrain.
     
     Args:
-        parcel_ids: List of parcel IDs to analyze
+        terrain_id: ID of the terrain to analyze
     """
     api_client = get_api_client()
     year = pd.Timestamp.today().year
-    all_data = []
 
-    for parcel_id in parcel_ids:
-        try:
-            # Using working economy comparison endpoint
-            result = api_client._make_request("GET", "/economy/comparison", 
-                                            params={"year": year, "parcel_id": parcel_id})
-            if result:
-                all_data.extend(result)
-        except Exception as e:
-            st.warning(f"Error loading data for parcel {parcel_id}: {e}")
+    try:
+        result = api_client.get_budget_comparison(year, terrain_id=terrain_id)
+    except Exception as e:
+        st.warning(f"Error loading data for terrain {terrain_id}: {e}")
+        return
 
-    if not all_data:
+    if not result:
         st.warning("No economic data available for this terrain.")
         return
 
-    df = pd.DataFrame(all_data)
-    summary = df.groupby("category").agg({
-        "budgeted_amount": "sum",
-        "executed_amount": "sum",
-    }).reset_index()
+    summary = pd.DataFrame(result)
     summary["category"] = summary["category"].str.capitalize()
 
     chart = alt.Chart(summary).transform_fold(
@@ -65,8 +56,8 @@ def show_budget_vs_execution_parcel(parcel_id: int):
     year = pd.Timestamp.today().year
     
     try:
-        result = api_client._make_request("GET", "/economy/comparison", 
-                                        params={"year": year, "parcel_id": parcel_id})
+        overview = api_client.get_economy_overview(year, parcel_id=parcel_id)
+        result = overview["comparison"] if overview else None
         if not result:
             st.warning("No economic data available for this parcel.")
             return
@@ -83,6 +74,15 @@ def show_budget_vs_execution_parcel(parcel_id: int):
 
         st.altair_chart(chart, use_container_width=True)
 
+        if overview["monthly"]:
+            monthly_df = pd.DataFrame(overview["monthly"])
+            monthly_chart = alt.Chart(monthly_df).mark_line(point=True).encode(
+                x=alt.X("month:O", title="Month"),
+                y=alt.Y("executed_amount:Q", title="Monthly Expenses ($)"),
+                tooltip=["month", "executed_amount"]
+            ).properties(width=500, height=250)
+            st.altair_chart(monthly_chart, use_container_width=True)
+
     except Exception as e:
         st.warning(f"Error loading economic comparison: {e}")
 
@@ -230,8 +230,8 @@ def show_economic_reports():
         category = st.text_input("Filter by category (optional)", "")
 
     try:
-        # Using working economy comparison endpoint
-        result = api_client._make_request("GET", "/economy/comparison", params={"year": year})
+        overview = api_client.get_economy_overview(year)
+        result = overview["comparison"] if overview else None
         if not result:
             st.info("No economic data available for the selected year.")
             return
@@ -274,7 +274,7 @@ def show_agricultural_simulations():
 
     # Show existing simulations
     try:
-        simulations = api_client._make_request("GET", "/simulation/")
+        simulations = api_client._get_all_pages("/simulation/")
         
         if not simulations:
             st.info("No saved simulations.")